@@ -21,7 +21,10 @@ class Animal: # CONSTRUCTOR DE LA CLASE
                host=host, 
                user=user, 
                password=password, 
-               port=port
+               port=port,
+               # Filas compactas: ocupan menos memoria que un diccionario por fila
+               # y jsonify las convierte igual
+               compact_rows=True
                ) 
           self.cursor=self.conn.cursor() # Creamos el cursor
 
@@ -0,0 +1,61 @@
+import sys
+import timeit
+
+from mysql.connector.query_cache import STMT_READ, STMT_WRITE, parse_statement
+
+# Mide cuanto tarda el cache de resultados (query_cache=True) en decidir de que
+# tablas lee cada consulta de la aplicacion. Antes de medir revisa los casos
+# en los que equivocarse deja resultados viejos en el cache: tablas derivadas,
+# subconsultas y UNION. Un conjunto vacio quiere decir que no se guarda
+ESQUEMA = 'callejeros_db'
+CASOS = [
+     (b"SELECT * FROM callejeros WHERE id = 7",
+          STMT_READ, {'callejeros_db.callejeros'}),
+     (b"SELECT c.nombre, a.fecha FROM callejeros c JOIN adopciones a ON a.id_callejero = c.id",
+          STMT_READ, {'callejeros_db.callejeros', 'callejeros_db.adopciones'}),
+     (b"SELECT nombre FROM callejeros UNION SELECT nombre FROM adopciones",
+          STMT_READ, {'callejeros_db.callejeros', 'callejeros_db.adopciones'}),
+     # Tabla derivada
+     (b"SELECT * FROM (SELECT * FROM adopciones) a JOIN callejeros c ON 1",
+          STMT_READ, set()),
+     # Subconsultas en el WHERE
+     (b"SELECT * FROM callejeros WHERE id IN (SELECT id_callejero FROM adopciones)",
+          STMT_READ, set()),
+     (b"SELECT * FROM callejeros c WHERE EXISTS ( select 1 FROM adopciones a WHERE a.id_callejero = c.id)",
+          STMT_READ, set()),
+     (b"WITH a AS (SELECT * FROM adopciones) SELECT * FROM a",
+          STMT_READ, set()),
+     (b"(SELECT nombre FROM callejeros) UNION ALL (SELECT nombre FROM adopciones)",
+          STMT_READ, set()),
+     (b"UPDATE callejeros SET estado = 'adoptado' WHERE id = 7",
+          STMT_WRITE, {'callejeros_db.callejeros'}),
+]
+
+def revisar():
+     errores = 0
+     for consulta, tipo, tablas in CASOS:
+          obtenido = parse_statement(consulta, ESQUEMA)
+          if obtenido != (tipo, frozenset(tablas)):
+               print(f"{consulta.decode()}\n     esperado {tipo} {sorted(tablas)}, obtenido {obtenido[0]} {sorted(obtenido[1])}")
+               errores += 1
+     return errores
+
+def medir(consulta, repeticiones=7, numero=10000):
+     # Devuelve el mejor tiempo por consulta, en microsegundos
+     mejor = min(timeit.repeat(lambda: parse_statement(consulta, ESQUEMA), number=numero, repeat=repeticiones))
+     return mejor / numero * 1e6
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     errores = revisar()
+     if errores:
+          sys.exit(f"{errores} de {len(CASOS)} consultas mal clasificadas")
+     print(f"Las {len(CASOS)} consultas se clasifican bien")
+     print("-" * 60)
+     for consulta, _, _ in CASOS:
+          texto = consulta.decode()
+          texto = texto if len(texto) <= 45 else texto[:42] + "..."
+          print(f"{texto:<48}{medir(consulta):>8.2f} us")
+     print("-" * 60)
@@ -0,0 +1,75 @@
+import json
+import random
+import sys
+
+from mysqlx.protocol import benchmark_compression, select_compression_algorithm
+
+# Compara los algoritmos de compresion de mysqlx sobre documentos parecidos a
+# los de la coleccion de callejeros. La semilla fija hace que los documentos
+# sean siempre los mismos, asi los resultados se pueden repetir
+SEMILLA = 2023
+NOMBRES = ['Luli', 'Ramon', 'Mecha', 'Nacha', 'Beto', 'Toby', 'Negra', 'Manchita']
+RAZAS = ['Caniche', 'Policia', 'Labrador', 'Mestizo', 'Galgo', 'Salchicha']
+VACUNAS = ['antirrabica', 'sextuple', 'giardia', 'tos de las perreras']
+
+def generar_callejeros(cantidad, aleatorio):
+     callejeros = []
+     for id in range(1, cantidad + 1):
+          callejero = {
+               '_id': str(id),
+               'id': id,
+               'nombre': aleatorio.choice(NOMBRES),
+               'edad': aleatorio.randint(0, 15),
+               'sexo': aleatorio.choice(['Hembra', 'Macho']),
+               'tamanio': aleatorio.choice(['P', 'M', 'G']),
+               'raza': aleatorio.choice(RAZAS),
+               'ubicacion': f"https://maps.example.com/?q={aleatorio.uniform(-35, -34):.6f},{aleatorio.uniform(-59, -58):.6f}",
+               'imagen': f"static/img/{aleatorio.getrandbits(64):016x}.jpg",
+          }
+          # Algunos tienen datos medicos o de adopcion, como en la coleccion
+          if aleatorio.random() < 0.5:
+               callejero['vacunas'] = aleatorio.sample(VACUNAS, aleatorio.randint(1, 3))
+          if aleatorio.random() < 0.3:
+               callejero['adopcion'] = {'estado': aleatorio.choice(['en proceso', 'adoptado'])}
+          callejeros.append(callejero)
+     return callejeros
+
+def generar_mensajes(cantidad_mensajes, por_mensaje):
+     # Cada mensaje es un lote de documentos, como los que viajan al hacer
+     # un find() o un add() de varios callejeros
+     aleatorio = random.Random(SEMILLA)
+     mensajes = []
+     for _ in range(cantidad_mensajes):
+          callejeros = generar_callejeros(aleatorio.randint(1, por_mensaje), aleatorio)
+          mensajes.append(json.dumps(callejeros).encode('utf-8'))
+     return mensajes
+
+def comparar(mensajes, repeticiones=5):
+     # Nos quedamos con el mejor tiempo de cada algoritmo para restar ruido
+     mejores = {}
+     for _ in range(repeticiones):
+          for algoritmo, medida in benchmark_compression(mensajes).items():
+               if algoritmo not in mejores:
+                    mejores[algoritmo] = medida
+               else:
+                    for clave in ('compress_time', 'decompress_time'):
+                         mejores[algoritmo][clave] = min(mejores[algoritmo][clave], medida[clave])
+     return mejores
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+     mensajes = generar_mensajes(cantidad, 50)
+     total = sum(len(mensaje) for mensaje in mensajes)
+     print(f"{len(mensajes)} mensajes, {total} bytes")
+     print("-" * 61)
+     print(f"{'Algoritmo':<16}{'Ratio':>8}{'Comprimir (ms)':>17}{'Descomprimir (ms)':>20}")
+     medidas = comparar(mensajes)
+     for algoritmo, medida in medidas.items():
+          print(f"{algoritmo:<16}{medida['ratio']:>8.3f}"
+                f"{medida['compress_time'] * 1000:>17.2f}{medida['decompress_time'] * 1000:>20.2f}")
+     print("-" * 61)
+     elegido = select_compression_algorithm(list(medidas), mensajes)
+     print(f"Elegido con compression-algorithms=auto: {elegido}")
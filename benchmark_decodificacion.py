@@ -0,0 +1,137 @@
+import datetime
+import decimal
+import random
+import sys
+import timeit
+
+from mysqlx.result import datetime_from_protobuf, decimal_from_protobuf, varint_from_protobuf
+
+# Mide cuanto tarda el conector X (mysqlx) en decodificar los valores de las
+# filas de callejeros que manda el servidor: enteros (varint), decimales (BCD)
+# y fechas. Compara los decodificadores nuevos con los que habia antes, que
+# se copian abajo, y revisa que los dos devuelvan lo mismo
+SEMILLA = 2023
+
+def varint_viejo_stream(payload):
+     if len(payload) == 0:
+          raise ValueError("Payload is empty")
+     cur = 0
+     i = 0
+     shift = 0
+     for item in payload:
+          char = item if isinstance(item, int) else ord(item)
+          eos = (char & 0x80) == 0
+          cur_bits = char & 0x7F
+          cur_bits <<= shift
+          i |= cur_bits
+          if eos:
+               return i, payload[cur + 1 :]
+          cur += 1
+          shift += 7
+     raise EOFError("Payload too short")
+
+def varint_viejo(payload):
+     i, payload = varint_viejo_stream(payload)
+     if len(payload) != 0:
+          raise ValueError("Payload too long")
+     return i
+
+def decimal_viejo(payload):
+     digits = []
+     sign = None
+     scale = payload[0]
+     for char in payload[1:]:
+          high_bcd = (char & 0xF0) >> 4
+          low_bcd = char & 0x0F
+          if high_bcd < 0x0A:
+               digits.append(high_bcd)
+               if low_bcd < 0x0A:
+                    digits.append(low_bcd)
+               elif low_bcd == 0x0C:
+                    sign = 0
+                    break
+               elif low_bcd == 0x0D:
+                    sign = 1
+                    break
+               else:
+                    raise ValueError("Invalid BCD")
+          elif high_bcd == 0x0C:
+               sign = 0
+               break
+          elif high_bcd == 0x0D:
+               sign = 1
+               break
+          else:
+               raise ValueError(f"Invalid BCD: {high_bcd}")
+     return decimal.Decimal((sign, digits, -scale))
+
+def datetime_viejo(payload):
+     hour = minutes = seconds = useconds = 0
+     year, payload = varint_viejo_stream(payload)
+     month, payload = varint_viejo_stream(payload)
+     day, payload = varint_viejo_stream(payload)
+     try:
+          hour, payload = varint_viejo_stream(payload)
+          minutes, payload = varint_viejo_stream(payload)
+          seconds, payload = varint_viejo_stream(payload)
+          useconds, payload = varint_viejo_stream(payload)
+     except ValueError:
+          pass
+     return datetime.datetime(year, month, day, hour, minutes, seconds, useconds)
+
+def codificar_varint(valor):
+     salida = bytearray()
+     while valor >= 0x80:
+          salida.append(valor & 0x7F | 0x80)
+          valor >>= 7
+     salida.append(valor)
+     return bytes(salida)
+
+def codificar_decimal(valor):
+     # Escala, digitos en BCD y el signo en el ultimo nibble
+     signo, digitos, exponente = valor.as_tuple()
+     nibbles = "".join(str(digito) for digito in digitos) + ("d" if signo else "c")
+     if len(nibbles) % 2:
+          nibbles += "0"
+     return bytes((-exponente,)) + bytes.fromhex(nibbles)
+
+def codificar_fecha(fecha):
+     return b"".join(codificar_varint(parte) for parte in (
+          fecha.year, fecha.month, fecha.day, fecha.hour, fecha.minute, fecha.second, fecha.microsecond))
+
+def generar_valores(cantidad):
+     aleatorio = random.Random(SEMILLA)
+     return {
+          'varint 1 byte': [codificar_varint(aleatorio.randint(0, 127)) for _ in range(cantidad)],
+          'varint 2 bytes': [codificar_varint(aleatorio.randint(128, 16383)) for _ in range(cantidad)],
+          'varint 4 bytes': [codificar_varint(aleatorio.randint(2**21, 2**28 - 1)) for _ in range(cantidad)],
+          'decimal': [codificar_decimal(decimal.Decimal(aleatorio.randint(-10**7, 10**7)).scaleb(-2)) for _ in range(cantidad)],
+          'datetime': [codificar_fecha(datetime.datetime(2023, 1, 1) + datetime.timedelta(seconds=aleatorio.randint(0, 10**8), microseconds=aleatorio.randint(0, 999999))) for _ in range(cantidad)],
+     }
+
+DECODIFICADORES = {
+     'varint 1 byte': (varint_viejo, varint_from_protobuf),
+     'varint 2 bytes': (varint_viejo, varint_from_protobuf),
+     'varint 4 bytes': (varint_viejo, varint_from_protobuf),
+     'decimal': (decimal_viejo, decimal_from_protobuf),
+     'datetime': (datetime_viejo, datetime_from_protobuf),
+}
+
+def medir(funcion, valores, repeticiones=7):
+     # Devuelve el mejor tiempo por valor, en microsegundos
+     mejor = min(timeit.repeat(lambda: [funcion(valor) for valor in valores], number=1, repeat=repeticiones))
+     return mejor / len(valores) * 1e6
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+     valores = generar_valores(cantidad)
+     print(f"{'Tipo':<18}{'Viejo (us)':>14}{'Nuevo (us)':>14}")
+     print("-" * 46)
+     for tipo, (viejo, nuevo) in DECODIFICADORES.items():
+          if [viejo(valor) for valor in valores[tipo]] != [nuevo(valor) for valor in valores[tipo]]:
+               sys.exit(f"Los decodificadores de {tipo} no devuelven lo mismo")
+          print(f"{tipo:<18}{medir(viejo, valores[tipo]):>14.2f}{medir(nuevo, valores[tipo]):>14.2f}")
+     print("-" * 46)
@@ -0,0 +1,104 @@
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+
+from mysql.connector.network import MAX_PAYLOAD_LENGTH, NetworkBrokerPlain
+
+# Compara la memoria pico que usa el conector para mandar un INSERT enorme,
+# como cuando se cargan de una vez todos los callejeros con sus fotos. El
+# envio viejo pegaba la cabecera de cada paquete a un pedazo copiado de la
+# consulta; el nuevo manda la cabecera y una vista de la consulta con
+# sendmsg(). No hace falta MySQL: del otro lado de un socketpair un hilo lee
+# y descarta los bytes
+SEMILLA = 2023
+MEGA = 1024 * 1024
+
+class EnvioViejo(NetworkBrokerPlain):
+     # Como mandaba los paquetes NetworkBrokerPlain.send() antes del cambio
+     def send(self, sock, address, payload, packet_number=None, compressed_packet_number=None):
+          if packet_number is None:
+               self._set_next_pktnr()
+          else:
+               self._pktnr = packet_number
+          if len(payload) >= MAX_PAYLOAD_LENGTH:
+               offset = 0
+               for _ in range(len(payload) // MAX_PAYLOAD_LENGTH):
+                    self._send_pkt(
+                         sock,
+                         address,
+                         b"\xff\xff\xff"
+                         + struct.pack("<B", self._pktnr)
+                         + payload[offset : offset + MAX_PAYLOAD_LENGTH],
+                    )
+                    self._set_next_pktnr()
+                    offset += MAX_PAYLOAD_LENGTH
+               payload = payload[offset:]
+          self._send_pkt(
+               sock,
+               address,
+               struct.pack("<I", len(payload))[0:3]
+               + struct.pack("<B", self._pktnr)
+               + payload,
+          )
+
+def generar_insert(megas):
+     # Un INSERT de varias filas hasta llegar a los megas pedidos
+     aleatorio = random.Random(SEMILLA)
+     filas = []
+     largo = 0
+     id = 0
+     while largo < megas * MEGA:
+          id += 1
+          fila = f"({id},'Callejero {id}',{aleatorio.randint(0, 15)},'{aleatorio.getrandbits(256):064x}')".encode()
+          filas.append(fila)
+          largo += len(fila) + 1
+     return b"INSERT INTO callejeros (id,nombre,edad,imagen) VALUES " + b",".join(filas)
+
+def leer_todo(sock, esperados, recibidos):
+     buffer = bytearray(MEGA)
+     while recibidos[0] < esperados:
+          leidos = sock.recv_into(buffer)
+          if not leidos:
+               break
+          recibidos[0] += leidos
+
+def medir(broker, payload):
+     # Devuelve la memoria pico usada durante el envio, en bytes, y los segundos
+     envio, lectura = socket.socketpair()
+     # Cabecera de 4 bytes por cada paquete de hasta MAX_PAYLOAD_LENGTH
+     esperados = len(payload) + 4 * (len(payload) // MAX_PAYLOAD_LENGTH + 1)
+     recibidos = [0]
+     lector = threading.Thread(target=leer_todo, args=(lectura, esperados, recibidos))
+     lector.start()
+     tracemalloc.start()
+     inicio = time.perf_counter()
+     broker.send(envio, 'socketpair', payload)
+     segundos = time.perf_counter() - inicio
+     pico = tracemalloc.get_traced_memory()[1]
+     tracemalloc.stop()
+     lector.join()
+     envio.close()
+     lectura.close()
+     if recibidos[0] != esperados:
+          sys.exit(f"Se esperaban {esperados} bytes y llegaron {recibidos[0]}")
+     return pico, segundos
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     megas = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+     payload = generar_insert(megas)
+     print(f"INSERT de {len(payload) / MEGA:.1f} MB")
+     print("-" * 50)
+     picos = {}
+     for nombre, broker in (('Envio viejo', EnvioViejo()), ('sendmsg', NetworkBrokerPlain())):
+          pico, segundos = medir(broker, payload)
+          picos[nombre] = pico
+          print(f"{nombre:<16}{pico / 1024:>12.1f} KB pico{segundos * 1000:>12.1f} ms")
+     print("-" * 50)
+     print(f"El envio nuevo ahorra {(picos['Envio viejo'] - picos['sendmsg']) / MEGA:.1f} MB")
@@ -0,0 +1,40 @@
+import sys
+import timeit
+
+from mysqlx.expr import ExprParser
+
+# Mide cuanto tarda el conector X (mysqlx) en armar las condiciones de los
+# find(), modify() y remove() sobre la coleccion de callejeros. Compara el
+# parseo completo de cada expresion con ExprParser.parse_cached(), que la
+# parsea una sola vez y despues devuelve una copia del arbol guardado
+EXPRESIONES = [
+     ('expr', "edad > :edad"),
+     ('expr', "raza = :raza AND sexo = :sexo AND edad BETWEEN :desde AND :hasta"),
+     ('expr', "estado IN ('perdido', 'en transito') AND (tamanio = 'P' OR vacunas LIKE :vacuna) AND ubicacion.barrio = :barrio"),
+     ('parse_order_spec', "edad DESC, nombre ASC"),
+     ('parse_table_select_projection', "nombre, edad, raza AS tipo, imagen"),
+]
+
+def parsear(regla, expresion):
+     parser = ExprParser(expresion)
+     return getattr(parser, regla)(), parser.placeholder_name_to_position
+
+def medir(funcion, repeticiones=7, numero=500):
+     # Devuelve el mejor tiempo por llamada, en microsegundos
+     mejor = min(timeit.repeat(funcion, number=numero, repeat=repeticiones))
+     return mejor / numero * 1e6
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     numero = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+     print(f"{'Expresion':<44}{'Parseo (us)':>14}{'Cache (us)':>14}")
+     print("-" * 72)
+     for regla, expresion in EXPRESIONES:
+          completo = medir(lambda: parsear(regla, expresion), numero=numero)
+          ExprParser.parse_cached(expresion, rule=regla)
+          cache = medir(lambda: ExprParser.parse_cached(expresion, rule=regla), numero=numero)
+          texto = expresion if len(expresion) <= 41 else expresion[:38] + "..."
+          print(f"{texto:<44}{completo:>14.2f}{cache:>14.2f}")
+     print("-" * 72)
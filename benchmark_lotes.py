@@ -0,0 +1,72 @@
+import sys
+import time
+
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor, RE_SQL_SPLIT_STMTS
+
+# Mide executemany() con multi_statement_batching=True sobre muchos UPDATE,
+# como cuando se marcan de una vez los callejeros adoptados. La conexion no
+# se abre: el servidor se simula respondiendo un OK por cada sentencia del lote.
+# Tambien mide lo que tardaba volver a partir el lote entero con la expresion
+# regular, que es cuadratico y con lotes grandes dejaba colgado executemany()
+SENTENCIA = "UPDATE callejeros SET estado=%s WHERE id=%s"
+OK = {"affected_rows": 1, "insert_id": 0, "warning_count": 0, "status_flag": 0}
+
+def crear_conexion(lotes):
+     conexion = MySQLConnection()
+     conexion.config(multi_statement_batching=True)
+     conexion.set_converter_class(MySQLConverter)
+     # Valores que la conexion le consultaria al servidor
+     conexion._sql_mode = ''
+     conexion._server_max_allowed_packet = 64 * 1024 * 1024
+     conexion.handle_unread_result = lambda: None
+
+     def cmd_query_iter(lote):
+          lotes.append(lote)
+          for _ in range(lote.count(b";") + 1):
+               yield OK
+
+     conexion.cmd_query_iter = cmd_query_iter
+     return conexion
+
+def medir_executemany(cantidad):
+     # Devuelve los segundos que tarda executemany() y los lotes enviados
+     lotes = []
+     # El cursor guarda una referencia debil, la conexion tiene que seguir viva
+     conexion = crear_conexion(lotes)
+     cursor = MySQLCursor(conexion)
+     filas = [('adoptado', id) for id in range(cantidad)]
+     inicio = time.perf_counter()
+     cursor.executemany(SENTENCIA, filas)
+     segundos = time.perf_counter() - inicio
+     if cursor.rowcount != cantidad:
+          sys.exit(f"Se esperaban {cantidad} filas y se contaron {cursor.rowcount}")
+     return segundos, lotes
+
+def medir_particion(lotes):
+     # Lo que tardaba antes partir de nuevo un lote con todas las sentencias
+     lote = b";".join(lotes)
+     inicio = time.perf_counter()
+     RE_SQL_SPLIT_STMTS.split(lote)
+     return time.perf_counter() - inicio
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     cantidades = [int(valor) for valor in sys.argv[1:]] or [1000, 4000, 16000]
+     print(f"{'Sentencias':<12}{'Lotes':>8}{'executemany (ms)':>20}{'us/sentencia':>16}{'Particion vieja (ms)':>24}")
+     print("-" * 80)
+     por_sentencia = []
+     for cantidad in cantidades:
+          segundos, lotes = medir_executemany(cantidad)
+          por_sentencia.append(segundos / cantidad)
+          # La particion vieja se mide solo hasta 4000 sentencias, con 16000 tarda casi un minuto
+          vieja = f"{medir_particion(lotes) * 1000:.1f}" if cantidad <= 4000 else "-"
+          print(f"{cantidad:<12}{len(lotes):>8}{segundos * 1000:>20.1f}{segundos / cantidad * 1e6:>16.2f}{vieja:>24}")
+     print("-" * 80)
+     # El tiempo por sentencia no tiene que crecer con el tamanio del lote
+     if max(por_sentencia) > 3 * min(por_sentencia):
+          sys.exit("executemany() no escala de forma lineal con la cantidad de sentencias")
+     print("executemany() escala de forma lineal")
@@ -0,0 +1,59 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from mysql.connector.cursor import _dict_row_factory
+
+# Compara la memoria que ocupan las filas de un cursor con dictionary=True
+# cuando son diccionarios y cuando son filas compactas (compact_rows=True).
+# Las filas se arman igual que las arma el cursor, a partir de las tuplas
+# que devuelve el servidor, asi no hace falta tener MySQL andando
+SEMILLA = 2023
+COLUMNAS = ('id', 'nombre', 'edad', 'sexo', 'tamanio', 'raza', 'ubicacion', 'imagen')
+NOMBRES = ['Luli', 'Ramon', 'Mecha', 'Nacha', 'Beto', 'Toby', 'Negra', 'Manchita']
+RAZAS = ['Caniche', 'Policia', 'Labrador', 'Mestizo', 'Galgo', 'Salchicha']
+
+class Conexion:
+     # Lo unico que el cursor le pregunta a la conexion para armar las filas
+     def __init__(self, compact_rows):
+          self.compact_rows = compact_rows
+
+def generar_tuplas(cantidad):
+     aleatorio = random.Random(SEMILLA)
+     return [(
+          id,
+          aleatorio.choice(NOMBRES),
+          aleatorio.randint(0, 15),
+          aleatorio.choice(['Hembra', 'Macho']),
+          aleatorio.choice(['P', 'M', 'G']),
+          aleatorio.choice(RAZAS),
+          'URL',
+          'foto',
+     ) for id in range(1, cantidad + 1)]
+
+def medir(tuplas, compact_rows):
+     # Devuelve los bytes que ocupan las filas y los segundos que llevo armarlas
+     armar_fila = _dict_row_factory(Conexion(compact_rows), COLUMNAS)
+     tracemalloc.start()
+     inicio = time.perf_counter()
+     filas = [armar_fila(tupla) for tupla in tuplas]
+     segundos = time.perf_counter() - inicio
+     memoria = tracemalloc.get_traced_memory()[0]
+     tracemalloc.stop()
+     del filas
+     return memoria, segundos
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+     tuplas = generar_tuplas(cantidad)
+     print(f"{cantidad} filas de {len(COLUMNAS)} columnas")
+     print("-" * 50)
+     print(f"{'Filas':<16}{'Memoria (MB)':>16}{'Tiempo (ms)':>16}")
+     for nombre, compact_rows in (('dict', False), ('compact_rows', True)):
+          memoria, segundos = medir(tuplas, compact_rows)
+          print(f"{nombre:<16}{memoria / 1024 / 1024:>16.2f}{segundos * 1000:>16.1f}")
+     print("-" * 50)
@@ -0,0 +1,70 @@
+import random
+import sys
+import timeit
+
+from mysqlx.protobuf import SERVER_MESSAGES, Message, Protobuf
+
+# Mide cuanto tarda el conector X (mysqlx) en decodificar los mensajes que el
+# servidor manda por cada fila de un resultado de callejeros. Compara el
+# decodificador especializado que usa Message.from_server_message() con el
+# parser generico de protobuf, y revisa que los dos lean los mismos campos
+SEMILLA = 2023
+TIPOS = {nombre: tipo for tipo, nombre in SERVER_MESSAGES.items()}
+
+def generar_mensajes():
+     # Nombre, tipo de mensaje, bytes que manda el servidor y campos a comparar
+     aleatorio = random.Random(SEMILLA)
+     fila = Message('Mysqlx.Resultset.Row')
+     fila['field'].extend(aleatorio.getrandbits(64).to_bytes(8, 'little') for _ in range(20))
+     columna = Message(
+          'Mysqlx.Resultset.ColumnMetaData',
+          type=7, name=b'nombre', original_name=b'nombre', table=b'callejeros',
+          original_table=b'callejeros', schema=b'callejeros_db', catalog=b'def',
+          collation=255, fractional_digits=0, length=80, flags=0,
+     )
+     aviso = Message('Mysqlx.Notice.Frame', type=3, scope=2, payload=b'\n\x0frows_affected\x12\x04\x08\x02\x18\x07')
+     fin = Message('Mysqlx.Sql.StmtExecuteOk')
+     return [
+          ('Row, 20 campos', 'Mysqlx.Resultset.Row', fila.serialize_to_string(), ['field']),
+          ('ColumnMetaData', 'Mysqlx.Resultset.ColumnMetaData', columna.serialize_to_string(),
+               ['type', 'name', 'original_name', 'table', 'original_table', 'schema', 'catalog', 'collation', 'length', 'flags']),
+          ('Notice.Frame', 'Mysqlx.Notice.Frame', aviso.serialize_to_string(), ['type', 'scope', 'payload']),
+          ('StmtExecuteOk', 'Mysqlx.Sql.StmtExecuteOk', fin.serialize_to_string(), []),
+     ]
+
+def generico(tipo, payload):
+     # Lo que hacia Message.from_server_message() antes del decodificador especializado
+     mensaje = Message()
+     mensaje.set_message(Protobuf.mysqlxpb.parse_server_message(tipo, payload))
+     return mensaje
+
+def especializado(tipo, payload):
+     return Message.from_server_message(tipo, payload)
+
+def leer(mensaje, campos):
+     valores = []
+     for campo in campos:
+          valor = mensaje[campo]
+          valores.append(list(valor) if campo == 'field' else valor)
+     return mensaje.type, valores
+
+def medir(funcion, tipo, payload, repeticiones=7, numero=20000):
+     # Devuelve el mejor tiempo por mensaje, en microsegundos
+     mejor = min(timeit.repeat(lambda: funcion(tipo, payload), number=numero, repeat=repeticiones))
+     return mejor / numero * 1e6
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     if not Protobuf.use_pure:
+          sys.exit("El decodificador especializado solo se usa con protobuf en Python puro")
+     numero = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+     print(f"{'Mensaje':<18}{'Generico (us)':>16}{'Especializado (us)':>22}")
+     print("-" * 56)
+     for nombre, nombre_tipo, payload, campos in generar_mensajes():
+          tipo = TIPOS[nombre_tipo]
+          if leer(generico(tipo, payload), campos) != leer(especializado(tipo, payload), campos):
+               sys.exit(f"Los decodificadores de {nombre} no leen lo mismo")
+          print(f"{nombre:<18}{medir(generico, tipo, payload, numero=numero):>16.2f}{medir(especializado, tipo, payload, numero=numero):>22.2f}")
+     print("-" * 56)
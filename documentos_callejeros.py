@@ -0,0 +1,179 @@
+import mysqlx
+from mysqlx.errors import OperationalError
+
+# Indices sobre los campos por los que filtramos. MySQL los guarda como
+# columnas generadas de la coleccion
+INDICES = {
+     'idx_id': {"fields": [{"field": "$.id", "type": "INT", "required": True}]},
+     'idx_sexo': {"fields": [{"field": "$.sexo", "type": "TEXT(30)"}]},
+     'idx_tamanio': {"fields": [{"field": "$.tamanio", "type": "TEXT(30)"}]},
+}
+# Error del servidor cuando el indice ya existe
+ER_DUP_KEYNAME = 1061
+
+class Animal:
+     # Guarda cada callejero como un documento JSON en una coleccion, asi
+     # podemos sumar datos medicos o de adopcion distintos para cada animal
+     def __init__(self, host, user, password, database, port=33060):
+          self.session = mysqlx.get_session(
+               host=host,
+               user=user,
+               password=password,
+               port=port
+               )
+          esquema = self.session.get_schema(database)
+          if not esquema.exists_in_database():
+               esquema = self.session.create_schema(database)
+          self.coleccion = esquema.create_collection('callejeros', reuse_existing=True)
+
+          for nombre, campos in INDICES.items():
+               try:
+                    self.coleccion.create_index(nombre, campos).execute()
+               except OperationalError as err:
+                    if err.errno != ER_DUP_KEYNAME:
+                         raise err
+
+     def _documento(self, id, nombre, edad, sexo, tamanio, raza, ubicacion, imagen, extras):
+          # El id del callejero tambien es el _id del documento
+          documento = {
+               '_id': str(id),
+               'id': int(id),
+               'nombre': nombre,
+               'edad': int(edad),
+               'sexo': sexo,
+               'tamanio': tamanio,
+               'raza': raza,
+               'ubicacion': ubicacion,
+               'imagen': imagen,
+          }
+          documento.update(extras)
+          return documento
+
+     def _enviar(self, sentencias):
+          # Manda todas las sentencias juntas dentro de un bloque Expect, sin
+          # esperar la respuesta de cada una
+          if not sentencias:
+               return []
+          return self.session.get_connection().send_pipeline(sentencias)
+
+     def agregar_callejero(self, id, nombre, edad, sexo, tamanio, raza, ubicacion, imagen, **extras):
+          # Si ese id YA EXISTE, con false salis del metodo Agregar
+          if self.consultar_callejero(id):
+               return False
+          documento = self._documento(id, nombre, edad, sexo, tamanio, raza, ubicacion, imagen, extras)
+          self.coleccion.add(documento).execute()
+          return True
+
+     def agregar_callejeros(self, callejeros):
+          # Agrega varios callejeros (diccionarios con los mismos campos que
+          # agregar_callejero) en un solo viaje al servidor. Devuelve los ids
+          # agregados; los que ya existian se saltean
+          ids = [int(callejero['id']) for callejero in callejeros]
+          existentes = set()
+          if ids:
+               condicion = f"id IN ({', '.join(str(id) for id in ids)})"
+               resultado = self.coleccion.find(condicion).fields("_id").execute()
+               existentes = {documento['_id'] for documento in resultado.fetch_all()}
+
+          sentencias = []
+          agregados = []
+          for callejero in callejeros:
+               datos = dict(callejero)
+               id = str(datos['id'])
+               if id in existentes:
+                    continue
+               existentes.add(id)
+               extras = {clave: datos.pop(clave) for clave in list(datos) if clave not in (
+                    'id', 'nombre', 'edad', 'sexo', 'tamanio', 'raza', 'ubicacion', 'imagen')}
+               datos['extras'] = extras
+               documento = self._documento(**datos)
+               sentencias.append(self.coleccion.add(documento))
+               agregados.append(int(id))
+          self._enviar(sentencias)
+          return agregados
+
+     def consultar_callejero(self, id):
+          # Buscamos el documento a partir del id pasado como parametro
+          documento = self.coleccion.find("_id = :id").bind("id", str(id)).execute().fetch_one()
+          if documento is None:
+               return None
+          return dict(documento)
+
+     def modificar_callejero(self, id, nuevo_nombre, nueva_edad, nuevo_sexo, nuevo_tamanio, nueva_raza, nueva_ubicacion, nueva_imagen, **extras):
+          # Modificamos los datos del callejero, cuyo id pasamos como parametro
+          cambios = {
+               'nombre': nuevo_nombre,
+               'edad': int(nueva_edad),
+               'sexo': nuevo_sexo,
+               'tamanio': nuevo_tamanio,
+               'raza': nueva_raza,
+               'ubicacion': nueva_ubicacion,
+               'imagen': nueva_imagen,
+          }
+          cambios.update(extras)
+          resultado = self.coleccion.modify("_id = :id").patch(cambios).bind("id", str(id)).execute()
+          return resultado.get_affected_items_count() > 0
+
+     def modificar_callejeros(self, cambios):
+          # Recibe un diccionario {id: {campo: valor, ...}} y manda todas las
+          # modificaciones juntas. Devuelve cuantos callejeros se modificaron
+          sentencias = [
+               self.coleccion.modify("_id = :id").patch(campos).bind("id", str(id))
+               for id, campos in cambios.items()
+          ]
+          resultados = self._enviar(sentencias)
+          return sum(resultado.get_affected_items_count() for resultado in resultados)
+
+     def mostrar_callejero(self, id):
+          callejero = self.consultar_callejero(id)
+          if callejero:
+               print("-" * 50)
+               print(f"Id_Callejero.....: {callejero['id']}")
+               print(f"Nombre...........: {callejero['nombre']}")
+               print(f"Edad.............: {callejero['edad']}")
+               print(f"Sexo.............: {callejero['sexo']}")
+               print(f"raza.............: {callejero['raza']}")
+               print(f"ubicacion........: {callejero['ubicacion']}")
+               print(f"imagen...........: {callejero['imagen']}")
+               print("-"*50)
+          else:
+               print("NO SE ENCONTRO callejero con ese ID, por favor verifique el codigo")
+
+     def listar_callejero(self, condicion=None, **valores):
+          # Sin condicion trae todos; por ejemplo listar_callejero("tamanio = :t", t='G')
+          busqueda = self.coleccion.find(condicion).sort("id")
+          if valores:
+               busqueda = busqueda.bind(valores)
+          return [dict(documento) for documento in busqueda.execute().fetch_all()]
+
+     def eliminar_callejero(self, id):
+          # Eliminamos un callejero a partir de su id
+          resultado = self.coleccion.remove_one(str(id))
+          return resultado.get_affected_items_count() > 0
+
+     def cerrar(self):
+          self.session.close()
+
+
+# Programa principal
+
+if __name__ == "__main__":
+     animal = Animal(host='localhost', user='root', password='', database='miapp', port=33060)
+
+     animal.agregar_callejeros([
+          {'id': 1, 'nombre': 'Luli', 'edad': 3, 'sexo': 'Hembra', 'tamanio': 'P', 'raza': 'Caniche', 'ubicacion': 'URL', 'imagen': 'foto'},
+          {'id': 2, 'nombre': 'Ramon', 'edad': 10, 'sexo': 'Macho', 'tamanio': 'G', 'raza': 'Policia', 'ubicacion': 'URL', 'imagen': 'foto',
+           'vacunas': ['antirrabica']},
+          {'id': 3, 'nombre': 'Mecha', 'edad': 7, 'sexo': 'Hembra', 'tamanio': 'M', 'raza': 'Labrador', 'ubicacion': 'URL', 'imagen': 'foto',
+           'adopcion': {'estado': 'en proceso'}},
+     ])
+     # No deberia dejar agregarlo, id duplicado
+     animal.agregar_callejero(1, 'NACHA', 7, 'Hembra', 'M', 'Labrador', 'URL', 'foto')
+     animal.mostrar_callejero(1)
+     animal.modificar_callejeros({1: {'nombre': 'BETO', 'edad': 20}, 3: {'castrado': True}})
+     animal.mostrar_callejero(1)
+     for callejero in animal.listar_callejero("tamanio = :tamanio", tamanio='G'):
+          print(callejero)
+     animal.eliminar_callejero(2)
+     print(animal.listar_callejero())
+     animal.cerrar()
@@ -87,6 +87,7 @@ from .errors import (
     OperationalError,
     ProgrammingError,
 )
+from .metrics import ConnectionMetrics
 from .opentelemetry.constants import (
     CONNECTION_SPAN_NAME,
     OPTION_CNX_SPAN,
@@ -103,6 +104,7 @@ if OTEL_ENABLED:
     )
 
 from .optionfiles import read_option_files
+from .query_cache import QueryResultCache
 from .types import (
     ConnAttrsType,
     DescriptionType,
@@ -115,6 +117,9 @@ from .utils import import_object
 
 NAMED_TUPLE_CACHE: weakref.WeakValueDictionary[Any, Any] = weakref.WeakValueDictionary()
 
+# Bytes of max_allowed_packet left for the command byte and query attributes
+BATCH_PACKET_HEADROOM = 1024
+
 DUPLICATED_IN_LIST_ERROR = (
     "The '{list}' list must not contain repeated values, the value "
     "'{value}' is duplicated."
@@ -219,6 +224,17 @@ class MySQLConnectionAbstract(ABC):
         self._converter_class: Optional[Type[MySQLConverter]] = None
         self._converter_str_fallback: bool = False
         self._compress: bool = False
+        self._compress_algorithm: str = DEFAULT_CONFIGURATION["compress_algorithm"]
+        self._compress_level: Optional[int] = DEFAULT_CONFIGURATION["compress_level"]
+        self._compress_threshold: int = DEFAULT_CONFIGURATION["compress_threshold"]
+        self._result_cache: Optional[QueryResultCache] = None
+        self._max_batch_size: Optional[int] = DEFAULT_CONFIGURATION["max_batch_size"]
+        self._server_max_allowed_packet: Optional[int] = None
+        self._multi_statement_batching: bool = DEFAULT_CONFIGURATION[
+            "multi_statement_batching"
+        ]
+        self._compact_rows: bool = DEFAULT_CONFIGURATION["compact_rows"]
+        self._metrics: Optional[ConnectionMetrics] = None
 
         self._consume_results: bool = False
         self._init_command: Optional[str] = None
@@ -478,6 +494,57 @@ class MySQLConnectionAbstract(ABC):
         """Set the current database"""
         self.cmd_query(f"USE {value}")
 
+    @property
+    def result_cache(self) -> Optional[QueryResultCache]:
+        """Cache of query results, None when result caching is disabled"""
+        return self._result_cache
+
+    @property
+    def max_batch_size(self) -> int:
+        """Maximum size in bytes of the statements built by executemany()
+
+        Returns the max_batch_size option when set, otherwise the server's
+        max_allowed_packet, queried once per connection, minus the room taken
+        by the packet header and query attributes.
+        """
+        if self._max_batch_size:
+            return self._max_batch_size
+        if self._server_max_allowed_packet is None:
+            row = self.info_query("SELECT @@max_allowed_packet")
+            self._server_max_allowed_packet = int(row[0])
+        return max(self._server_max_allowed_packet - BATCH_PACKET_HEADROOM, 1)
+
+    @property
+    def multi_statement_batching(self) -> bool:
+        """Whether executemany() packs statements in multi-statement batches
+
+        Requires the MULTI_STATEMENTS client flag, which is set by default.
+        """
+        return bool(
+            self._multi_statement_batching
+            and self._client_flags & ClientFlag.MULTI_STATEMENTS
+        )
+
+    @property
+    def compact_rows(self) -> bool:
+        """Whether dictionary cursors return rows as compact Row objects
+
+        Row objects store the values of a row in slots instead of a
+        dictionary per row, and can be used as mappings of the column names
+        to the values.
+        """
+        return self._compact_rows
+
+    @property
+    def metrics(self) -> Optional[Dict[str, Any]]:
+        """Snapshot of the connection metrics, None when metrics are disabled
+
+        See `metrics.ConnectionMetrics` for the counters and histograms.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
     @property
     def can_consume_results(self) -> bool:
         """Returns whether to consume results"""
@@ -651,6 +718,22 @@ class MySQLConnectionAbstract(ABC):
             self._init_command = config["init_command"]
             del config["init_command"]
 
+        # Keep the counters of a connection already collecting metrics, e.g.
+        # when a pool applies a new configuration to its connections
+        if "metrics" in config:
+            metrics = config.pop("metrics")
+            if metrics is True:
+                if self._metrics is None:
+                    self._metrics = ConnectionMetrics()
+            elif not metrics:
+                self._metrics = None
+            elif isinstance(metrics, ConnectionMetrics):
+                self._metrics = metrics
+            else:
+                raise AttributeError(
+                    "metrics must be a boolean or a ConnectionMetrics instance"
+                )
+
         # Other configuration
         set_ssl_flag = False
         for key, value in config.items():
@@ -712,6 +795,55 @@ class MySQLConnectionAbstract(ABC):
             ):
                 self._validate_tls_ciphersuites()
 
+        if self._compress_algorithm not in ("zlib", "zstd"):
+            raise AttributeError("compress_algorithm must be either 'zlib' or 'zstd'")
+        if self._compress_level is not None:
+            if self._compress_algorithm == "zlib":
+                min_level, max_level = -1, 9
+            else:
+                min_level, max_level = 1, 22
+            if (
+                not isinstance(self._compress_level, int)
+                or isinstance(self._compress_level, bool)
+                or not min_level <= self._compress_level <= max_level
+            ):
+                raise AttributeError(
+                    f"compress_level must be an integer between {min_level} and "
+                    f"{max_level} for '{self._compress_algorithm}' compression"
+                )
+        if (
+            not isinstance(self._compress_threshold, int)
+            or isinstance(self._compress_threshold, bool)
+            or self._compress_threshold < 0
+        ):
+            raise AttributeError("compress_threshold must be a non-negative integer")
+
+        if self._result_cache is True:
+            self._result_cache = QueryResultCache()
+        elif not self._result_cache:
+            self._result_cache = None
+        elif not isinstance(self._result_cache, QueryResultCache):
+            raise AttributeError(
+                "result_cache must be a boolean or a QueryResultCache instance"
+            )
+
+        if self._max_batch_size is not None and (
+            not isinstance(self._max_batch_size, int)
+            or isinstance(self._max_batch_size, bool)
+            or self._max_batch_size <= 0
+        ):
+            raise AttributeError("max_batch_size must be a positive integer or None")
+
+        if not isinstance(self._multi_statement_batching, bool):
+            raise AttributeError("multi_statement_batching must be a boolean")
+
+        if not isinstance(self._compact_rows, bool):
+            raise AttributeError("compact_rows must be a boolean")
+
+        if getattr(self, "_socket", None) is not None:
+            # the socket of an open pure Python connection counts the bytes
+            self._socket.metrics = self._metrics
+
         if self._conn_attrs is None:
             self._conn_attrs = {}
         elif not isinstance(self._conn_attrs, dict):
@@ -1235,6 +1367,7 @@ class MySQLConnectionAbstract(ABC):
 
         self.disconnect()
         self._open_connection()
+        self._server_max_allowed_packet = None
 
         charset, collation = (
             kwargs.pop("charset", None),
@@ -1281,7 +1414,10 @@ class MySQLConnectionAbstract(ABC):
         counter = 0
         span = None
 
-        if self._tracer:
+        if self._tracer and self._span is trace.INVALID_SPAN:
+            # the connection was not sampled by the instrumentor
+            span = self._span
+        elif self._tracer:
             span = self._tracer.start_span(
                 name=CONNECTION_SPAN_NAME, kind=trace.SpanKind.CLIENT
             )
@@ -1335,6 +1471,7 @@ class MySQLConnectionAbstract(ABC):
         cursor_class: Optional[type] = None,
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        columnar: Optional[bool] = None,
     ) -> "MySQLCursorAbstract":
         """Instantiates and returns a cursor"""
 
@@ -1607,6 +1744,7 @@ class MySQLCursorAbstract(ABC):
         self._executed: Optional[StrOrBytes] = None
         self._executed_list: List[StrOrBytes] = []
         self._stored_results: List[Any] = []
+        self._rowcounts: List[int] = []
         self.arraysize: int = 1
 
     def __enter__(self) -> MySQLCursorAbstract:
@@ -1759,6 +1897,20 @@ class MySQLCursorAbstract(ABC):
         """
         return self._description
 
+    @property
+    def rowcounts(self) -> List[int]:
+        """Returns the number of rows of each statement sent by executemany()
+
+        The list holds the rowcount of every statement the last executemany()
+        call sent to the server: one per parameter set, or one per batch when
+        the rows of an INSERT are batched using the multiple rows syntax.
+        Prepared statement executions the server reported an error for
+        while pipelined count -1.
+
+        Returns a list of integers.
+        """
+        return self._rowcounts
+
     @property
     @abstractmethod
     def rowcount(self) -> int:
@@ -31,7 +31,7 @@ from __future__ import annotations
 
 import copy
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .errors import InterfaceError, NotSupportedError, get_exception
 from .logger import logger
@@ -51,6 +51,11 @@ from .types import ConnAttrsType, HandShakeType
 if TYPE_CHECKING:
     from .network import MySQLSocket
 
+# Authentication plugin accepted by the server for an account, indexed by
+# (server address, username, SSL enabled). Used as the initial plugin when
+# none is configured, so the server doesn't need to ask for an auth switch
+NEGOTIATED_AUTH_PLUGINS: Dict[Tuple[Any, str, bool], str] = {}
+
 
 class MySQLAuthenticator:
     """Implements the authentication phase.
@@ -64,6 +69,10 @@ class MySQLAuthenticator:
         - setup_ssl (method): Set up an SSL communication channel.
 
         - authenticate (method): Performs the authentication phase.
+
+    When `server_address` is given in the plugin configuration, the plugin
+    accepted by the server is remembered in `NEGOTIATED_AUTH_PLUGINS` and
+    used for the next connections to the same account.
     """
 
     def __init__(self) -> None:
@@ -74,6 +83,7 @@ class MySQLAuthenticator:
         self._ssl_enabled: bool = False
         self._auth_strategy: Optional[MySQLAuthPlugin] = None
         self._auth_plugin_class: Optional[str] = None
+        self._first_factor_plugin: Optional[str] = None
 
     @property
     def ssl_enabled(self) -> bool:
@@ -279,11 +289,13 @@ class MySQLAuthenticator:
                 sock, auth_data, **self._plugin_config
             )
 
+        self._first_factor_plugin = self._auth_strategy.name
         if pkt[4] == OK_STATUS:
             logger.debug("%s completed succesfully", self._auth_strategy.name)
             return pkt
 
         if pkt[4] == MFA_STATUS:
+            self._first_factor_plugin = None
             logger.debug("Starting multi-factor authentication")
             logger.debug("MFA 1 factor %s", self._auth_strategy.name)
             return self._mfa_n_factor(sock, pkt)
@@ -309,6 +321,7 @@ class MySQLAuthenticator:
         auth_plugin_class: Optional[str] = None,
         conn_attrs: Optional[ConnAttrsType] = None,
         is_change_user_request: bool = False,
+        zstd_compression_level: Optional[int] = None,
         **plugin_config: Any,
     ) -> bytes:
         """Performs the authentication phase.
@@ -331,6 +344,8 @@ class MySQLAuthenticator:
                 than the authorization plugin name).
             conn_attrs: Connection attributes.
             is_change_user_request: Whether is a `change user request` operation or not.
+            zstd_compression_level: Compression level requested when zstd
+                compression is enabled via `client_flags`.
             plugin_config: Custom configuration to be passed to the auth plugin
                 when invoked. The parameters defined here will override the ones
                 defined in the auth plugin itself.
@@ -350,6 +365,13 @@ class MySQLAuthenticator:
         self._passwords = {1: password1, 2: password2, 3: password3}
         self._plugin_config = copy.deepcopy(plugin_config)
         self._auth_plugin_class = auth_plugin_class
+        self._first_factor_plugin = None
+
+        cache_key = None
+        if plugin_config.get("server_address") and not is_change_user_request:
+            cache_key = (plugin_config["server_address"], username, self.ssl_enabled)
+            if not auth_plugin and not auth_plugin_class:
+                auth_plugin = NEGOTIATED_AUTH_PLUGINS.get(cache_key)
 
         # client's handshake response
         response_payload, self._auth_strategy = MySQLProtocol.make_auth(
@@ -366,6 +388,7 @@ class MySQLAuthenticator:
             is_change_user_request=is_change_user_request,
             ssl_enabled=self.ssl_enabled,
             plugin_config=self.plugin_config,
+            zstd_compression_level=zstd_compression_level,
         )
 
         # client sends transaction response
@@ -379,4 +402,7 @@ class MySQLAuthenticator:
         if ok_pkt is None:
             raise InterfaceError("Got a NULL ok_pkt") from None
 
+        if cache_key and self._first_factor_plugin:
+            NEGOTIATED_AUTH_PLUGINS[cache_key] = self._first_factor_plugin
+
         return ok_pkt
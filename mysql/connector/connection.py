@@ -40,15 +40,21 @@ import warnings
 
 from decimal import Decimal
 from io import IOBase
+from itertools import islice
 from typing import (
     Any,
     BinaryIO,
     Dict,
+    FrozenSet,
     Generator,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -73,6 +79,7 @@ from .cursor import (
     MySQLCursorBufferedDict,
     MySQLCursorBufferedNamedTuple,
     MySQLCursorBufferedRaw,
+    MySQLCursorColumnar,
     MySQLCursorDict,
     MySQLCursorNamedTuple,
     MySQLCursorPrepared,
@@ -92,10 +99,19 @@ from .errors import (
     get_exception,
 )
 from .logger import logger
-from .network import MySQLSocket, MySQLTCPSocket, MySQLUnixSocket
+from .metrics import with_metrics
+from .network import HAVE_ZSTD, MySQLSocket, MySQLTCPSocket, MySQLUnixSocket
 from .opentelemetry.constants import OTEL_ENABLED
 from .opentelemetry.context_propagation import with_context_propagation
 from .protocol import MySQLProtocol
+from .query_cache import (
+    ALL_TABLES,
+    STMT_READ,
+    STMT_USE,
+    STMT_WRITE,
+    normalize_statement,
+    parse_statement,
+)
 from .types import (
     ConnAttrsType,
     DescriptionType,
@@ -113,6 +129,9 @@ from .utils import get_platform, int1store, int4store, lc_int
 if OTEL_ENABLED:
     from .opentelemetry.instrumentation import end_span, record_exception_event
 
+# Number of Statement Execute packets sent before reading their responses
+STMT_EXECUTE_PIPELINE_SIZE = 128
+
 
 class MySQLConnection(MySQLConnectionAbstract):
     """Connection to a MySQL Server"""
@@ -162,6 +181,16 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._columns_desc: List[DescriptionType] = []
         self._mfa_nfactor: int = 1
 
+        # result cache state: default schema, tables written by the ongoing
+        # transaction, cached rows being replayed and rows being recorded
+        self._result_cache_schema: Optional[str] = None
+        self._result_cache_dirty: Set[str] = set()
+        self._result_cache_replay: Optional[Iterator[RowType]] = None
+        self._result_cache_record: Optional[
+            Tuple[Hashable, FrozenSet[str], int, List[RowType]]
+        ] = None
+        self._result_cache_stmts: Dict[int, bytes] = {}
+
         self._authenticator: MySQLAuthenticator = MySQLAuthenticator()
 
         if kwargs:
@@ -236,6 +265,22 @@ class MySQLConnection(MySQLConnectionAbstract):
         if handshake["capabilities"] & ClientFlag.MULTI_FACTOR_AUTHENTICATION:
             self.set_client_flags([ClientFlag.MULTI_FACTOR_AUTHENTICATION])
 
+        if self._compress and self._compress_algorithm == "zstd":
+            # Fall back to zlib when either side can't do zstd
+            if HAVE_ZSTD and (
+                handshake["capabilities"] & ClientFlag.ZSTD_COMPRESSION_ALGORITHM
+            ):
+                self.set_client_flags(
+                    [-ClientFlag.COMPRESS, ClientFlag.ZSTD_COMPRESSION_ALGORITHM]
+                )
+            else:
+                logger.warning(
+                    "zstd compression is not available, falling back to zlib"
+                )
+                self.set_client_flags(
+                    [ClientFlag.COMPRESS, -ClientFlag.ZSTD_COMPRESSION_ALGORITHM]
+                )
+
         self._handshake = handshake
 
     def _do_auth(
@@ -298,11 +343,13 @@ class MySQLConnection(MySQLConnectionAbstract):
             auth_plugin=self._auth_plugin,
             auth_plugin_class=self._auth_plugin_class,
             conn_attrs=conn_attrs,
+            zstd_compression_level=self._compress_level,
             krb_service_principal=self._krb_service_principal,
             oci_config_file=self._oci_config_file,
             oci_config_profile=self._oci_config_profile,
             webauthn_callback=self._webauthn_callback,
             fido_callback=self._fido_callback,
+            server_address=self._unix_socket or (self.server_host, self.server_port),
         )
         self._handle_ok(ok_pkt)
 
@@ -345,6 +392,12 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         self._protocol = MySQLProtocol()
         self._socket = self._get_connection()
+        self._socket.metrics = self._metrics
+        if self._result_cache is not None:
+            # a transaction interrupted by reconnecting was rolled back
+            self._result_cache_end_transaction()
+            self._result_cache_schema = self._database or None
+            self._result_cache_stmts = {}
         try:
             self._socket.open_connection()
 
@@ -365,7 +418,19 @@ class MySQLConnection(MySQLConnectionAbstract):
 
             if self._client_flags & ClientFlag.COMPRESS:
                 # update the network layer accordingly
-                self._socket.switch_to_compressed_mode()
+                # zstd levels don't apply when falling back to zlib
+                self._socket.switch_to_compressed_mode(
+                    compress_level=self._compress_level
+                    if self._compress_algorithm == "zlib"
+                    else None,
+                    compress_threshold=self._compress_threshold,
+                )
+            elif self._client_flags & ClientFlag.ZSTD_COMPRESSION_ALGORITHM:
+                self._socket.switch_to_compressed_mode(
+                    compress_algorithm="zstd",
+                    compress_level=self._compress_level,
+                    compress_threshold=self._compress_threshold,
+                )
 
             self._socket.set_connection_timeout(None)
         except Exception:
@@ -406,6 +471,9 @@ class MySQLConnection(MySQLConnectionAbstract):
         if not self._socket:
             return
 
+        if self._result_cache is not None:
+            self._result_cache_end_transaction()
+
         try:
             self.cmd_quit()
         except (AttributeError, Error):
@@ -450,6 +518,7 @@ class MySQLConnection(MySQLConnectionAbstract):
         Returns a MySQL packet or None.
         """
         self.handle_unread_result()
+        self._result_cache_replay = self._result_cache_record = None
 
         try:
             self._socket.send(
@@ -511,6 +580,16 @@ class MySQLConnection(MySQLConnectionAbstract):
         """MySQL session has started a transaction"""
         return self._in_transaction
 
+    @property
+    def compression_stats(self) -> Optional[Dict[str, int]]:
+        """Bytes sent and received before and after compression
+
+        Returns a dict(), or None when the connection isn't compressed.
+        """
+        if not self._socket:
+            return None
+        return self._socket.compression_stats
+
     def _handle_ok(self, packet: bytes) -> OkPacketType:
         """Handle a MySQL OK packet
 
@@ -678,6 +757,9 @@ class MySQLConnection(MySQLConnectionAbstract):
         if not self.unread_result:
             raise InternalError("No result set available")
 
+        if self._result_cache_replay is not None:
+            return self._result_cache_replay_rows(count, raw)
+
         rows: Tuple[List[Tuple[Any, ...]], Optional[EofPacketType]] = ([], None)
         try:
             if binary:
@@ -696,6 +778,10 @@ class MySQLConnection(MySQLConnectionAbstract):
             raise err
 
         rows, eof_p = rows
+        if self._metrics is not None:
+            self._metrics.rows_fetched += len(rows)
+        if self._result_cache_record is not None and not binary:
+            self._result_cache_record_rows(rows, eof_p)
         if (
             not (binary or raw)
             and self._columns_desc is not None
@@ -729,11 +815,14 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         Returns a dict()
         """
-        return self._handle_ok(
+        ok_pkt = self._handle_ok(
             self._send_cmd(ServerCmd.INIT_DB, database.encode("utf-8"))
         )
+        self._result_cache_schema = database
+        return ok_pkt
 
     @with_context_propagation
+    @with_metrics("queries", "query_latency")
     def cmd_query(
         self,
         query: StrOrBytes,
@@ -759,6 +848,7 @@ class MySQLConnection(MySQLConnectionAbstract):
             if isinstance(query, str):
                 query = query.encode("utf-8")
             query = bytearray(query)
+        statement = query
         # Prepare query attrs
         charset = self.charset if self.charset != "utf8mb4" else "utf8"
         packet = bytearray()
@@ -854,8 +944,121 @@ class MySQLConnection(MySQLConnectionAbstract):
                 "Use cmd_query_iter for statements with multiple queries."
             )
 
+        if self._result_cache is not None:
+            self._result_cache_track(statement)
         return result
 
+    def cmd_query_cached(self, query: StrOrBytes) -> ResultType:
+        """Send a query to the MySQL server unless its result is cached
+
+        Works like cmd_query(), but when a result cache is configured a
+        cacheable SELECT is answered from the cache, without contacting the
+        server; its rows are then returned by get_rows() as usual. Results
+        read from the server are added to the cache once all their rows were
+        fetched.
+
+        Results are keyed by the statement text with only the surrounding
+        whitespace and trailing semicolons removed (see
+        `query_cache.normalize_statement()`). Statements differing in inner
+        whitespace or keyword case are cached separately, as the server names
+        the result columns after the text of the selected expressions.
+
+        Returns a dict()
+        """
+        cache = self._result_cache
+        if cache is None or self._result_cache_dirty or self._query_attrs:
+            # the ongoing transaction has uncommitted changes which must not
+            # be shared through the cache
+            return self.cmd_query(query)
+        if isinstance(query, str):
+            query = query.encode("utf-8")
+
+        kind, tables = parse_statement(query, self._result_cache_schema)
+        if kind != STMT_READ or not tables:
+            return self.cmd_query(query)
+
+        key = (
+            self._host,
+            self._port,
+            self._unix_socket,
+            self._user,
+            self._charset_id,
+            self._result_cache_schema,
+            normalize_statement(bytes(query)),
+        )
+        entry = cache.get(key)
+        if entry is None:
+            generation = cache.generation
+            result = self.cmd_query(query)
+            if "columns" in result:
+                self._result_cache_record = (key, tables, generation, [])
+            return result
+
+        self.handle_unread_result()
+        self._result_cache_record = None
+        self._result_cache_replay = iter(entry.rows)
+        self._columns_desc = entry.columns
+        self.unread_result = True
+        return {
+            "columns": entry.columns,
+            "eof": {"warning_count": 0, "status_flag": 0},
+        }
+
+    def _result_cache_track(self, statement: bytes) -> None:
+        """Invalidate cached results affected by an executed statement"""
+        kind, tables = parse_statement(statement, self._result_cache_schema)
+        if kind == STMT_WRITE:
+            self._result_cache.invalidate(tables)
+            if self._in_transaction:
+                # other connections might cache the old rows until commit
+                self._result_cache_dirty.update(tables)
+        elif kind == STMT_USE:
+            self._result_cache_schema = next(iter(tables))
+        if self._result_cache_dirty and not self._in_transaction:
+            self._result_cache_end_transaction()
+
+    def _result_cache_end_transaction(self) -> None:
+        """Invalidate cached results of tables written by the transaction"""
+        if self._result_cache_dirty:
+            self._result_cache.invalidate(self._result_cache_dirty)
+            self._result_cache_dirty = set()
+
+    def _result_cache_replay_rows(
+        self, count: Optional[int], raw: Optional[bool]
+    ) -> Tuple[List[RowType], Optional[EofPacketType]]:
+        """Get rows of a cached result, like get_rows() does"""
+        if count:
+            rows = list(islice(self._result_cache_replay, count))
+        else:
+            rows = list(self._result_cache_replay)
+        eof_p: Optional[EofPacketType] = None
+        if not count or len(rows) < count:
+            self._result_cache_replay = None
+            self.unread_result = False
+            eof_p = {"warning_count": 0, "status_flag": 0}
+        if raw is None:
+            raw = self._raw
+        if not raw and rows and hasattr(self, "converter"):
+            row_to_python = self.converter.row_to_python
+            rows = [row_to_python(row, self._columns_desc) for row in rows]
+        return rows, eof_p
+
+    def _result_cache_record_rows(
+        self, rows: List[RowType], eof_p: Optional[EofPacketType]
+    ) -> None:
+        """Collect rows read from the server and cache them once complete"""
+        key, tables, generation, recorded = self._result_cache_record
+        recorded.extend(rows)
+        if eof_p is None:
+            return
+        self._result_cache_record = None
+        status = eof_p.get("status_flag", eof_p.get("server_status", 0))
+        if eof_p["warning_count"] or status & ServerFlag.MORE_RESULTS_EXISTS:
+            return
+        self._result_cache.put(
+            key, self._columns_desc, recorded, tables, generation=generation
+        )
+
     def cmd_query_iter(
         self, statements: StrOrBytes
     ) -> Generator[ResultType, None, None]:
@@ -890,6 +1093,10 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         packet.extend(statements)
         query = bytes(packet)
+        if self._result_cache is not None:
+            # the statements can't be told apart reliably, assume the worst
+            self._result_cache.invalidate()
+            self._result_cache_dirty.add(ALL_TABLES)
         # Handle the first query result
         yield self._handle_result(self._send_cmd(ServerCmd.QUERY, query))
 
@@ -1067,6 +1274,9 @@ class MySQLConnection(MySQLConnectionAbstract):
             self.cmd_init_db(database)
 
         self._charset_id = charset
+        if self._result_cache is not None:
+            self._result_cache_end_transaction()
+            self._result_cache_schema = database or None
         self._post_connection()
 
         # return ok_pkt
@@ -1189,6 +1399,7 @@ class MySQLConnection(MySQLConnectionAbstract):
         cursor_class: Optional[Type[MySQLCursor]] = None,
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        columnar: Optional[bool] = None,
     ) -> MySQLCursor:
         """Instantiates and returns a cursor
 
@@ -1198,7 +1409,8 @@ class MySQLConnection(MySQLConnectionAbstract):
         returned as dictionary or named tuple.
 
         Dictionary and namedtuple based cursors are available with buffered
-        output but not raw.
+        output but not raw. Columnar cursors, returning the fetched rows as
+        columns, are always buffered.
 
         It is possible to also give a custom cursor through the
         cursor_class parameter, but it needs to be a subclass of
@@ -1234,6 +1446,8 @@ class MySQLConnection(MySQLConnectionAbstract):
             cursor_type |= 8
         if prepared is True:
             cursor_type |= 16
+        if columnar is True:
+            cursor_type |= 32
 
         types = {
             0: MySQLCursor,  # 0
@@ -1248,14 +1462,23 @@ class MySQLConnection(MySQLConnectionAbstract):
             18: MySQLCursorPreparedRaw,
             20: MySQLCursorPreparedDict,
             24: MySQLCursorPreparedNamedTuple,
+            32: MySQLCursorColumnar,
+            33: MySQLCursorColumnar,
         }
         try:
             return (types[cursor_type])(self)
         except KeyError:
-            args = ("buffered", "raw", "dictionary", "named_tuple", "prepared")
+            args = (
+                "buffered",
+                "raw",
+                "dictionary",
+                "named_tuple",
+                "prepared",
+                "columnar",
+            )
             raise ValueError(
                 "Cursor not available with given criteria: "
-                + ", ".join([args[i] for i in range(5) if cursor_type & (1 << i) != 0])
+                + ", ".join([args[i] for i in range(6) if cursor_type & (1 << i) != 0])
             ) from None
 
     def commit(self) -> None:
@@ -1365,6 +1588,8 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         packet = self._send_cmd(ServerCmd.STMT_PREPARE, statement)
         result = self._handle_binary_ok(packet)
+        if self._result_cache is not None:
+            self._result_cache_stmts[result["statement_id"]] = bytes(statement)
 
         result["columns"] = []
         result["parameters"] = []
@@ -1388,6 +1613,7 @@ class MySQLConnection(MySQLConnectionAbstract):
         return result
 
     @with_context_propagation
+    @with_metrics("stmt_executes", "stmt_execute_latency")
     def cmd_stmt_execute(
         self,
         statement_id: int,
@@ -1437,8 +1663,94 @@ class MySQLConnection(MySQLConnectionAbstract):
             )
         packet = self._send_cmd(ServerCmd.STMT_EXECUTE, packet=execute_packet)
         result = self._handle_binary_result(packet)
+        if self._result_cache is not None:
+            self._result_cache_track(
+                self._result_cache_stmts.get(statement_id, b"CALL unknown()")
+            )
         return result
 
+    def cmd_stmt_execute_many(
+        self,
+        statement_id: int,
+        seq_data: Iterable[Sequence[SupportedMysqlBinaryProtocolTypes]],
+        parameters: Sequence[Any] = (),
+        results: Optional[List[Optional[OkPacketType]]] = None,
+    ) -> List[Optional[OkPacketType]]:
+        """Execute a prepared MySQL statement once for each set of parameters
+
+        The Statement Execute packets are sent in windows of
+        STMT_EXECUTE_PIPELINE_SIZE packets without waiting for the server,
+        then all the responses of the window are read. The statement must
+        not produce result sets and the parameters can not be file-like
+        objects.
+
+        If the server reports an error, the executions already sent after
+        the failing one in the same window still run on the server. Their
+        responses are read, no more windows are sent and the first error is
+        raised. Pass a `results` list to know which executions ran: the OK
+        packet of each execution is appended to it as it is read, or None
+        when the server reported an error for it.
+
+        Returns a list with the OK packet of each execution.
+
+        .. versionadded:: 8.2.0
+        """
+        if not self._query_attrs_supported and self._query_attrs:
+            warnings.warn(
+                "This version of the server does not support Query Attributes",
+                category=Warning,
+            )
+        query_attrs = None
+        if self._client_flags & ClientFlag.CLIENT_QUERY_ATTRIBUTES:
+            query_attrs = self.query_attrs
+        packets = self._protocol.make_stmt_execute_many(
+            statement_id,
+            seq_data,
+            tuple(parameters),
+            self.charset,
+            query_attrs,
+            self._converter_str_fallback,
+        )
+        if results is None:
+            results = []
+        executed = 0
+        error = None
+        while error is None:
+            # Build the whole window first, so a bad parameter set does not
+            # leave packets sent whose responses are never read
+            window = list(islice(packets, STMT_EXECUTE_PIPELINE_SIZE))
+            if not window:
+                break
+            for execute_packet in window:
+                self._send_cmd(
+                    ServerCmd.STMT_EXECUTE,
+                    packet=execute_packet,
+                    expect_response=False,
+                )
+            for _ in window:
+                try:
+                    result = self._handle_binary_result(self._socket.recv())
+                except Error as err:
+                    results.append(None)
+                    if error is None:
+                        error = err
+                    continue
+                if not isinstance(result, dict):
+                    raise InterfaceError(
+                        "Statements producing result sets can not be pipelined"
+                    )
+                results.append(result)
+                executed += 1
+        if self._metrics is not None:
+            self._metrics.stmt_executes += executed
+        if self._result_cache is not None:
+            self._result_cache_track(
+                self._result_cache_stmts.get(statement_id, b"CALL unknown()")
+            )
+        if error is not None:
+            raise error
+        return results
+
     def cmd_stmt_close(self, statement_id: int) -> None:
         """Deallocate a prepared MySQL statement
 
@@ -1451,6 +1763,7 @@ class MySQLConnection(MySQLConnectionAbstract):
             int4store(statement_id),
             expect_response=False,
         )
+        self._result_cache_stmts.pop(statement_id, None)
 
     def cmd_stmt_send_long_data(
         self, statement_id: int, param_id: int, data: BinaryIO
@@ -1510,6 +1823,9 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         try:
             self._handle_ok(self._send_cmd(ServerCmd.RESET_CONNECTION))
+            if self._result_cache is not None:
+                # the ongoing transaction, if any, was rolled back
+                self._result_cache_end_transaction()
             self._post_connection()
             return True
         except (NotSupportedError, OperationalError):
@@ -73,6 +73,7 @@ try:
         CMySQLCursorBufferedDict,
         CMySQLCursorBufferedNamedTuple,
         CMySQLCursorBufferedRaw,
+        CMySQLCursorColumnar,
         CMySQLCursorDict,
         CMySQLCursorNamedTuple,
         CMySQLCursorPrepared,
@@ -88,6 +89,7 @@ except ImportError as exc:
         f"MySQL Connector/Python C Extension not available ({exc})"
     ) from exc
 
+from .metrics import with_metrics
 from .opentelemetry.constants import OTEL_ENABLED
 from .opentelemetry.context_propagation import with_context_propagation
 
@@ -473,6 +475,8 @@ class CMySQLConnection(MySQLConnectionAbstract):
                 msg=err.msg, errno=err.errno, sqlstate=err.sqlstate
             ) from err
 
+        if self._metrics is not None:
+            self._metrics.rows_fetched += counter
         return rows, _eof
 
     def get_row(
@@ -591,6 +595,7 @@ class CMySQLConnection(MySQLConnectionAbstract):
         except MySQLInterfaceError as err:
             raise InterfaceError(str(err)) from err
 
+    @with_metrics("stmt_executes", "stmt_execute_latency")
     def cmd_stmt_execute(
         self, statement_id: MySQLPrepStmt, *args: Any
     ) -> Optional[Union[CextEofPacketType, CextResultType]]:
@@ -622,6 +627,7 @@ class CMySQLConnection(MySQLConnectionAbstract):
         statement_id.stmt_reset()
 
     @with_context_propagation
+    @with_metrics("queries", "query_latency")
     def cmd_query(
         self,
         query: StrOrBytes,
@@ -672,6 +678,7 @@ class CMySQLConnection(MySQLConnectionAbstract):
         cursor_class: Optional[Type[CMySQLCursor]] = None,
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        columnar: Optional[bool] = None,
     ) -> CMySQLCursor:
         """Instantiates and returns a cursor using C Extension
 
@@ -681,7 +688,8 @@ class CMySQLConnection(MySQLConnectionAbstract):
         returned as dictionary or named tuple.
 
         Dictionary and namedtuple based cursors are available with buffered
-        output but not raw.
+        output but not raw. Columnar cursors, returning the fetched rows as
+        columns, are always buffered.
 
         It is possible to also give a custom cursor through the
         cursor_class parameter, but it needs to be a subclass of
@@ -698,6 +706,7 @@ class CMySQLConnection(MySQLConnectionAbstract):
         :param cursor_class: Use a custom cursor class
         :param dictionary: Rows are returned as dictionary
         :param named_tuple: Rows are returned as named tuple
+        :param columnar: Rows are returned as columns
         :return: Subclass of CMySQLCursor
         :rtype: CMySQLCursor or subclass
         """
@@ -725,6 +734,8 @@ class CMySQLConnection(MySQLConnectionAbstract):
             cursor_type |= 8
         if prepared is True:
             cursor_type |= 16
+        if columnar is True:
+            cursor_type |= 32
 
         types = {
             0: CMySQLCursor,  # 0
@@ -739,14 +750,23 @@ class CMySQLConnection(MySQLConnectionAbstract):
             18: CMySQLCursorPreparedRaw,
             20: CMySQLCursorPreparedDict,
             24: CMySQLCursorPreparedNamedTuple,
+            32: CMySQLCursorColumnar,
+            33: CMySQLCursorColumnar,
         }
         try:
             return (types[cursor_type])(self)
         except KeyError:
-            args = ("buffered", "raw", "dictionary", "named_tuple", "prepared")
+            args = (
+                "buffered",
+                "raw",
+                "dictionary",
+                "named_tuple",
+                "prepared",
+                "columnar",
+            )
             raise ValueError(
                 "Cursor not available with given criteria: "
-                + ", ".join([args[i] for i in range(5) if cursor_type & (1 << i) != 0])
+                + ", ".join([args[i] for i in range(6) if cursor_type & (1 << i) != 0])
             ) from None
 
     @property
@@ -38,6 +38,7 @@ from .errors import ProgrammingError
 
 NET_BUFFER_LENGTH: int = 8192
 MAX_MYSQL_TABLE_COLUMNS: int = 4096
+DEFAULT_ZSTD_COMPRESSION_LEVEL: int = 3
 # Flag used to send the Query Attributes with 0 (or more) parameters.
 PARAMETER_COUNT_AVAILABLE: int = 8
 
@@ -64,6 +65,9 @@ DEFAULT_CONFIGURATION: Dict[str, Optional[Union[str, bool, int]]] = {
     "connection_timeout": None,
     "client_flags": 0,
     "compress": False,
+    "compress_algorithm": "zlib",
+    "compress_level": None,
+    "compress_threshold": 50,
     "buffered": False,
     "raw": False,
     "ssl_ca": None,
@@ -94,10 +98,39 @@ DEFAULT_CONFIGURATION: Dict[str, Optional[Union[str, bool, int]]] = {
     "webauthn_callback": None,
     "kerberos_auth_mode": None,
     "init_command": None,
+    "result_cache": False,
+    "max_batch_size": None,
+    "multi_statement_batching": False,
+    "compact_rows": False,
+    "metrics": False,
 }
 
 CNX_POOL_ARGS: Tuple[str, str, str] = ("pool_name", "pool_size", "pool_reset_session")
 
+# Connection arguments which pooled connections can pick up by resetting the
+# session (COM_RESET_CONNECTION) instead of connecting again
+CNX_POOL_SESSION_ARGS: Tuple[str, ...] = (
+    "database",
+    "db",
+    "charset",
+    "collation",
+    "use_unicode",
+    "converter_str_fallback",
+    "autocommit",
+    "time_zone",
+    "sql_mode",
+    "get_warnings",
+    "raise_on_warnings",
+    "buffered",
+    "raw",
+    "consume_results",
+    "init_command",
+    "max_batch_size",
+    "multi_statement_batching",
+    "compact_rows",
+    "metrics",
+)
+
 TLS_VERSIONS: List[str] = ["TLSv1.2", "TLSv1.3"]
 
 DEPRECATED_TLS_VERSIONS: List[str] = ["TLSv1", "TLSv1.1"]
@@ -475,6 +508,7 @@ class ClientFlag(_Flags):
     SESION_TRACK: int = 1 << 23  # deprecated
     SESSION_TRACK: int = 1 << 23
     DEPRECATE_EOF: int = 1 << 24
+    ZSTD_COMPRESSION_ALGORITHM: int = 1 << 26
     CLIENT_QUERY_ATTRIBUTES: int = 1 << 27
     SSL_VERIFY_SERVER_CERT: int = 1 << 30
     REMEMBER_OPTIONS: int = 1 << 31
@@ -519,6 +553,10 @@ class ClientFlag(_Flags):
             "Capable of handling server state change information",
         ),
         "DEPRECATE_EOF": (1 << 24, "Client no longer needs EOF packet"),
+        "ZSTD_COMPRESSION_ALGORITHM": (
+            1 << 26,
+            "Can use zstd compression in the compression protocol",
+        ),
         "CLIENT_QUERY_ATTRIBUTES": (
             1 << 27,
             "Support optional extension for query parameters",
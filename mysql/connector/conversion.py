@@ -35,7 +35,7 @@ import struct
 import time
 
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from .constants import CharacterSet, FieldFlag, FieldType
 from .custom_types import HexLiteral
@@ -51,6 +51,27 @@ from .utils import NUMERIC_TYPES
 
 CONVERT_ERROR = "Could not convert '{value}' to python {pytype}"
 
+# Bytes MySQLConverter.escape() escapes when backslash escapes are enabled
+ESCAPED_BYTES = b"\\\n\r\047\042\032"
+
+# Python types whose conversion to MySQL is looked up when a MySQLConverter
+# is created, other types are looked up the first time they are converted
+TO_MYSQL_TYPES = (
+    int,
+    float,
+    str,
+    bytes,
+    bytearray,
+    bool,
+    type(None),
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    time.struct_time,
+    Decimal,
+)
+
 
 class MySQLConverterBase:
     """Base class for conversion classes
@@ -177,6 +198,31 @@ class MySQLConverter(MySQLConverterBase):
             int,
             Callable[[bytes, DescriptionType], ToPythonOutputTypes],
         ] = {}
+        self._cache_to_mysql: Dict[
+            type, Optional[Callable[[Any], ToMysqlOutputTypes]]
+        ] = {}
+        for python_type in TO_MYSQL_TYPES:
+            self._get_to_mysql(python_type)
+        if type(self)._str_to_mysql is MySQLConverter._str_to_mysql:
+            # Skip the indirection when _str_to_mysql() is not overridden
+            self._cache_to_mysql[str] = self._unicode_to_mysql
+
+    def _get_to_mysql(
+        self, python_type: type
+    ) -> Optional[Callable[[Any], ToMysqlOutputTypes]]:
+        """Get the function converting values of a Python type to MySQL
+
+        The function is looked up using the name of the type and cached.
+
+        Returns the function, or None if the type can not be converted.
+        """
+        try:
+            return self._cache_to_mysql[python_type]
+        except KeyError:
+            pass
+        func = getattr(self, f"_{python_type.__name__.lower()}_to_mysql", None)
+        self._cache_to_mysql[python_type] = func
+        return func
 
     @staticmethod
     def escape(value: Any, sql_mode: Optional[str] = None) -> Any:
@@ -190,6 +236,9 @@ class MySQLConverter(MySQLConverterBase):
         if isinstance(value, (bytes, bytearray)):
             if sql_mode == "NO_BACKSLASH_ESCAPES":
                 return value.replace(b"'", b"''")
+            if len(value.translate(None, ESCAPED_BYTES)) == len(value):
+                # Nothing to escape
+                return value
             value = value.replace(b"\\", b"\\\\")
             value = value.replace(b"\n", b"\\n")
             value = value.replace(b"\r", b"\\r")
@@ -225,18 +274,16 @@ class MySQLConverter(MySQLConverterBase):
 
     def to_mysql(self, value: ToMysqlInputTypes) -> ToMysqlOutputTypes:
         """Convert Python data type to MySQL"""
-        type_name = value.__class__.__name__.lower()
-        try:
-            converted: ToMysqlOutputTypes = getattr(self, f"_{type_name}_to_mysql")(
-                value
-            )
+        func = self._cache_to_mysql.get(value.__class__)
+        if func is None:
+            func = self._get_to_mysql(value.__class__)
+        if func is not None:
+            converted: ToMysqlOutputTypes = func(value)
             return converted
-        except AttributeError:
-            if self.str_fallback:
-                return str(value).encode()
-            raise TypeError(
-                f"Python '{type_name}' cannot be converted to a MySQL type"
-            ) from None
+        if self.str_fallback:
+            return str(value).encode()
+        type_name = value.__class__.__name__.lower()
+        raise TypeError(f"Python '{type_name}' cannot be converted to a MySQL type")
 
     def to_python(
         self,
@@ -504,6 +551,53 @@ class MySQLConverter(MySQLConverterBase):
 
         return tuple(result)
 
+    def column_to_python(
+        self, values: Sequence[Optional[bytes]], field: DescriptionType
+    ) -> List[ToPythonOutputTypes]:
+        """Convert a column of MySQL text result values to Python types
+
+        The values argument holds the values of one column, as found in the
+        text result rows returned by a MySQL server. The conversion function
+        is resolved once for the whole column using the field argument.
+
+        Returns a list.
+
+        .. versionadded:: 8.2.0
+        """
+        if not self._cache_field_types:
+            self._cache_field_types = {}
+            for name, info in FieldType.desc.items():
+                try:
+                    self._cache_field_types[info[0]] = getattr(
+                        self, f"_{name.lower()}_to_python"
+                    )
+                except AttributeError:
+                    # We ignore field types which has no method
+                    pass
+
+        func = self._cache_field_types.get(field[1])
+        if func is None:
+            # If the type is not defined, we just return the value as str
+            result: List[ToPythonOutputTypes] = []
+            for value in values:
+                try:
+                    result.append(None if value is None else value.decode("utf-8"))
+                except UnicodeDecodeError:
+                    result.append(value)
+            return result
+
+        is_bit = field[1] == FieldType.BIT
+        try:
+            return [
+                None
+                if value is None or (value == 0 and not is_bit)
+                else func(value, field)
+                for value in values
+            ]
+        except (ValueError, TypeError) as err:
+            err.message = f"{err} (field {field[0]})"  # type: ignore[union-attr]
+            raise
+
     # pylint: disable=unused-argument
     @staticmethod
     def _float_to_python(value: bytes, desc: Optional[DescriptionType] = None) -> float:
@@ -31,16 +31,24 @@
 """Cursor classes."""
 from __future__ import annotations
 
+import dataclasses
 import re
 import warnings
 import weakref
 
+from array import array
 from collections import namedtuple
+from collections.abc import Mapping
 from decimal import Decimal
+from functools import lru_cache
+from io import IOBase
+from keyword import iskeyword
 from typing import (
     Any,
+    Callable,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
     NoReturn,
@@ -52,8 +60,15 @@ from typing import (
 )
 from weakref import CallableProxyType
 
+try:
+    import numpy
+
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
 from .abstracts import NAMED_TUPLE_CACHE, MySQLConnectionAbstract, MySQLCursorAbstract
-from .constants import ServerFlag
+from .constants import FieldFlag, FieldType, ServerFlag
 from .errors import (
     Error,
     InterfaceError,
@@ -62,8 +77,10 @@ from .errors import (
     get_mysql_exception,
 )
 from .types import (
+    ColumnsType,
     DescriptionType,
     EofPacketType,
+    OkPacketType,
     ParamsDictType,
     ParamsSequenceOrDictType,
     ParamsSequenceType,
@@ -108,8 +125,160 @@ RE_SQL_PYTHON_CAPTURE_PARAM_NAME = re.compile(r"%\((.*?)\)s")
 
 ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
+STMT_TEMPLATE_CACHE_SIZE = 256
+ROW_CLASS_CACHE_SIZE = 128
+# Maximum number of statements sent in one multi-statement batch by executemany()
+MAX_BATCH_STATEMENTS = 100
+
 MAX_RESULTS = 4294967295
 
+INTEGER_FIELD_TYPES = frozenset(
+    (
+        FieldType.TINY,
+        FieldType.SHORT,
+        FieldType.INT24,
+        FieldType.LONG,
+        FieldType.LONGLONG,
+        FieldType.YEAR,
+    )
+)
+FLOAT_FIELD_TYPES = frozenset((FieldType.FLOAT, FieldType.DOUBLE))
+STRING_FIELD_TYPES = frozenset(
+    (FieldType.VARCHAR, FieldType.VAR_STRING, FieldType.STRING, FieldType.ENUM)
+)
+
+Categorical = namedtuple("Categorical", ["codes", "categories"])
+Categorical.__doc__ = """String column encoded as codes into a list of categories
+
+The code of a NULL value is -1.
+"""
+
+
+def _pack_column(
+    values: List[Any], description: DescriptionType, categorical: bool = False
+) -> Union[List[Any], array, Categorical]:
+    """Pack the values of a result set column
+
+    Integer and floating point columns without NULL values are packed into
+    NumPy arrays when NumPy is available, or into array.array otherwise.
+    String columns are encoded as Categorical when categorical is True.
+    Other columns are returned as lists.
+    """
+    field_type = description[1]
+    if field_type in INTEGER_FIELD_TYPES or field_type in FLOAT_FIELD_TYPES:
+        if None in values:
+            return values
+        if field_type in FLOAT_FIELD_TYPES:
+            typecode = "d"
+        elif description[7] & FieldFlag.UNSIGNED:
+            typecode = "Q"
+        else:
+            typecode = "q"
+        if HAVE_NUMPY:
+            return numpy.array(values, dtype=typecode)
+        return array(typecode, values)
+    if categorical and field_type in STRING_FIELD_TYPES:
+        categories: Dict[Any, int] = {}
+        codes = [
+            -1 if value is None else categories.setdefault(value, len(categories))
+            for value in values
+        ]
+        if HAVE_NUMPY:
+            return Categorical(numpy.array(codes, dtype="i"), list(categories))
+        return Categorical(array("i", codes), list(categories))
+    return values
+
+
+class Row(Mapping):
+    """Base class of the compact rows returned by dictionary cursors
+
+    A subclass is generated for each set of column names. Its instances
+    store the values in slots, so they take a fraction of the memory of a
+    dictionary. Rows are mappings of the column names to the values and
+    dataclasses, which web frameworks such as Flask serialize to JSON
+    objects; _asdict() returns a dictionary.
+
+    .. versionadded:: 8.2.0
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    @classmethod
+    def _make(cls, values: Sequence[Any]) -> Row:
+        """Make a row from a sequence of values"""
+        return cls(*values)
+
+    def _asdict(self) -> Dict[str, ToPythonOutputTypes]:
+        """Return the row as a dictionary"""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __getitem__(self, key: str) -> ToPythonOutputTypes:
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: ToPythonOutputTypes) -> None:
+        if key not in self._field_set:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[Tuple[str, ...], Tuple[Any, ...]]]:
+        # Generated classes can't be looked up by name, pickle the column
+        # names and get the class back from _get_row_class()
+        return (
+            _make_compact_row,
+            (self._fields, tuple(getattr(self, name) for name in self._fields)),
+        )
+
+
+@lru_cache(maxsize=ROW_CLASS_CACHE_SIZE)
+def _get_row_class(column_names: Tuple[str, ...]) -> Optional[Type[Row]]:
+    """Get the Row subclass for a set of column names
+
+    Returns None when the column names can not be attributes of a Row.
+    """
+    if len(set(column_names)) != len(column_names):
+        return None
+    for name in column_names:
+        if not name.isidentifier() or iskeyword(name) or hasattr(Row, name):
+            return None
+    namespace = {
+        "__slots__": column_names,
+        "__annotations__": dict.fromkeys(column_names, Any),
+        "_fields": column_names,
+        "_field_set": frozenset(column_names),
+        "__module__": __name__,
+    }
+    return dataclasses.dataclass(eq=False)(type("Row", (Row,), namespace))
+
+
+def _make_compact_row(column_names: Tuple[str, ...], values: Sequence[Any]) -> Row:
+    """Make a Row from its column names and values, used to unpickle rows"""
+    return _get_row_class(column_names)._make(values)  # type: ignore[union-attr]
+
+
+def _dict_row_factory(
+    connection: Any, column_names: Tuple[str, ...]
+) -> Callable[[Sequence[Any]], Mapping]:
+    """Get the function making dictionary cursor rows from row tuples
+
+    Rows are Row objects when the connection uses compact rows and the
+    column names allow it, dictionaries otherwise.
+    """
+    if getattr(connection, "compact_rows", False):
+        row_class = _get_row_class(column_names)
+        if row_class is not None:
+            return row_class._make
+    return lambda row: dict(zip(column_names, row))
+
 
 class _ParamSubstitutor:
     """
@@ -168,6 +337,112 @@ def _bytestr_format_dict(bytestr: bytes, value_dict: Dict[bytes, bytes]) -> byte
     return stmt
 
 
+class _StatementTemplate:
+    """
+    Statement split around its parameter markers.
+
+    The literal segments and parameter slots are computed once, so
+    substituting the parameters is a join over the precomputed pieces.
+    Positional templates split on %s markers, mapping templates on
+    %(name)s markers, where %% is replaced with %.
+    """
+
+    __slots__ = ("segments", "keys")
+
+    def __init__(self, stmt: bytes, mapping: bool = False) -> None:
+        self.segments: List[bytes] = []
+        self.keys: Optional[List[bytes]] = None
+        if not mapping:
+            self.segments = RE_PY_PARAM.split(stmt)[::2]
+            return
+        self.keys = []
+        literal = []
+        pos = 0
+        for match in RE_PY_MAPPING_PARAM.finditer(stmt):
+            literal.append(stmt[pos : match.start()])
+            pos = match.end()
+            conversion_type = match.group("conversion_type")
+            if conversion_type == b"%":
+                literal.append(b"%")
+            elif conversion_type == b"s":
+                self.segments.append(b"".join(literal))
+                self.keys.append(match.group("mapping_key"))
+                literal = []
+            else:
+                raise ValueError(f"Unsupported conversion_type: {conversion_type}")
+        literal.append(stmt[pos:])
+        self.segments.append(b"".join(literal))
+
+    def format(self, params: Sequence[bytes]) -> bytes:
+        """Returns the statement with the given positional parameters"""
+        segments = self.segments
+        if len(params) != len(segments) - 1:
+            if len(params) < len(segments) - 1:
+                raise ProgrammingError("Not enough parameters for the SQL statement")
+            raise ProgrammingError("Not all parameters were used in the SQL statement")
+        parts = [segments[0]]
+        for value, segment in zip(params, segments[1:]):
+            parts.append(bytes(value))
+            parts.append(segment)
+        return b"".join(parts)
+
+    def format_dict(self, value_dict: Dict[bytes, bytes]) -> bytes:
+        """Returns the statement with the given mapping parameters"""
+        segments = self.segments
+        parts = [segments[0]]
+        for key, segment in zip(self.keys, segments[1:]):
+            parts.append(value_dict[key])
+            parts.append(segment)
+        return b"".join(parts)
+
+
+@lru_cache(maxsize=STMT_TEMPLATE_CACHE_SIZE)
+def _get_statement_template(stmt: bytes, mapping: bool = False) -> _StatementTemplate:
+    """Returns the cached template of a statement"""
+    return _StatementTemplate(stmt, mapping)
+
+
+def _remove_comments(match: re.Match) -> str:
+    """Remove comments from INSERT statements.
+
+    This function is used while removing comments from INSERT
+    statements. If the matched string is a comment not enclosed
+    by quotes, it returns an empty string, else the string itself.
+    """
+    if match.group(1):
+        return ""
+    return match.group(2)
+
+
+@lru_cache(maxsize=STMT_TEMPLATE_CACHE_SIZE)
+def _get_insert_template(
+    operation: str, charset: str
+) -> Optional[Tuple[bytes, bytes, bytes]]:
+    """Splits an INSERT statement for multi row insert
+
+    Returns the statement before the VALUES row, the row and the statement
+    after the row, encoded with the given charset, or None when the row is
+    not found in the statement.
+    """
+    tmp = re.sub(
+        RE_SQL_ON_DUPLICATE,
+        "",
+        re.sub(RE_SQL_COMMENT, _remove_comments, operation),
+    )
+
+    matches = re.search(RE_SQL_INSERT_VALUES, tmp)
+    if not matches:
+        raise InterfaceError(
+            "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
+        )
+    fmt = matches.group(1).encode(charset)
+    stmt = operation.encode(charset)
+    if fmt not in stmt:
+        return None
+    prefix, suffix = stmt.split(fmt, 1)
+    return prefix, fmt, suffix
+
+
 class CursorBase(MySQLCursorAbstract):
     """
     Base for defining MySQLCursor. This class is a skeleton and defines
@@ -520,16 +795,20 @@ class MySQLCursor(CursorBase):
             raise InterfaceError("Invalid result")
 
     def _execute_iter(
-        self, query_iter: Generator[ResultType, None, None]
+        self,
+        query_iter: Generator[ResultType, None, None],
+        executed_list: Optional[List[bytes]] = None,
     ) -> Generator[MySQLCursor, None, None]:
         """Generator returns MySQLCursor objects for multiple statements
 
         This method is only used when multiple statements are executed
         by the execute() method. It uses zip() to make an iterator from the
         given query_iter (result of MySQLConnection.cmd_query_iter()) and
-        the list of statements that were executed.
+        the list of statements that were executed, split from the executed
+        operation unless given in executed_list.
         """
-        executed_list = RE_SQL_SPLIT_STMTS.split(self._executed)
+        if executed_list is None:
+            executed_list = RE_SQL_SPLIT_STMTS.split(self._executed)
 
         i = 0
         while True:
@@ -593,15 +872,16 @@ class MySQLCursor(CursorBase):
             raise ProgrammingError(str(err)) from err
 
         if params:
+            if isinstance(stmt, bytearray):
+                stmt = bytes(stmt)
             if isinstance(params, dict):
-                stmt = _bytestr_format_dict(stmt, self._process_params_dict(params))
+                stmt = _get_statement_template(stmt, True).format_dict(
+                    self._process_params_dict(params)
+                )
             elif isinstance(params, (list, tuple)):
-                psub = _ParamSubstitutor(self._process_params(params))
-                stmt = RE_PY_PARAM.sub(psub, stmt)
-                if psub.remaining != 0:
-                    raise ProgrammingError(
-                        "Not all parameters were used in the SQL statement"
-                    )
+                stmt = _get_statement_template(stmt).format(
+                    self._process_params(params)
+                )
             else:
                 raise ProgrammingError(
                     f"Could not process parameters: {type(params).__name__}({params}),"
@@ -614,7 +894,11 @@ class MySQLCursor(CursorBase):
             return self._execute_iter(self._connection.cmd_query_iter(stmt))
 
         try:
-            self._handle_result(self._connection.cmd_query(stmt))
+            if self._connection.result_cache is not None:
+                result = self._connection.cmd_query_cached(stmt)
+            else:
+                result = self._connection.cmd_query(stmt)
+            self._handle_result(result)
         except InterfaceError as err:
             if self._connection.have_next_result:
                 raise InterfaceError(
@@ -623,61 +907,110 @@ class MySQLCursor(CursorBase):
             raise
         return None
 
-    def _batch_insert(
-        self, operation: str, seq_params: Sequence[ParamsSequenceOrDictType]
-    ) -> Optional[bytes]:
-        """Implements multi row insert"""
-
-        def remove_comments(match: re.Match) -> str:
-            """Remove comments from INSERT statements.
-
-            This function is used while removing comments from INSERT
-            statements. If the matched string is a comment not enclosed
-            by quotes, it returns an empty string, else the string itself.
-            """
-            if match.group(1):
-                return ""
-            return match.group(2)
-
-        tmp = re.sub(
-            RE_SQL_ON_DUPLICATE,
-            "",
-            re.sub(RE_SQL_COMMENT, remove_comments, operation),
+    def _execute_statements(
+        self, statements: List[bytes]
+    ) -> Generator[MySQLCursor, None, None]:
+        """Executes statements in one multi-statement batch
+
+        Works like execute() with multi=True, but the statements are already
+        separated, so the batch is not split again to tell which statement
+        each result belongs to.
+        """
+        self._connection.handle_unread_result()
+        self._reset_result()
+        self._executed = b";".join(statements)
+        self._executed_list = []
+        return self._execute_iter(
+            self._connection.cmd_query_iter(self._executed), statements
         )
 
-        matches = re.search(RE_SQL_INSERT_VALUES, tmp)
-        if not matches:
-            raise InterfaceError(
-                "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
-            )
-        fmt = matches.group(1).encode(self._connection.python_charset)
-        values = []
+    def _batch_insert(
+        self, operation: str, seq_params: Iterable[ParamsSequenceOrDictType]
+    ) -> Optional[Generator[bytes, None, None]]:
+        """Implements multi row insert
+
+        Returns a generator of INSERT statements, each one holding as many
+        rows as fit in the connection max_batch_size, or None when the
+        statement can not be rewritten. The parameters are consumed as the
+        statements are generated.
+        """
+        try:
+            template = _get_insert_template(operation, self._connection.python_charset)
+        except (UnicodeDecodeError, UnicodeEncodeError) as err:
+            raise ProgrammingError(str(err)) from err
+        if template is None:
+            return None
+        prefix, fmt, suffix = template
+        chunks = self._batch_chunks(len(prefix) + len(suffix), fmt, seq_params)
+        return (b"".join((prefix, b",".join(values), suffix)) for values in chunks)
+
+    def _batch_statements(
+        self, operation: StrOrBytes, seq_params: Iterable[ParamsSequenceOrDictType]
+    ) -> Optional[Generator[List[bytes], None, None]]:
+        """Implements multi-statement batches
+
+        Returns a generator of batches of the statement, each batch being the
+        list of statements made by substituting the parameter sets, as many
+        as fit in the connection max_batch_size and up to
+        MAX_BATCH_STATEMENTS. Returns None when the operation holds more than
+        one statement.
+        """
+        try:
+            if isinstance(operation, str):
+                stmt = operation.encode(self._connection.python_charset)
+            else:
+                stmt = bytes(operation)
+        except (UnicodeDecodeError, UnicodeEncodeError) as err:
+            raise ProgrammingError(str(err)) from err
+        stmt = stmt.strip().rstrip(b";").rstrip()
+        if len(RE_SQL_SPLIT_STMTS.split(stmt)) > 1:
+            return None
+        return self._batch_chunks(0, stmt, seq_params, MAX_BATCH_STATEMENTS)
 
+    def _batch_chunks(
+        self,
+        overhead: int,
+        fmt: bytes,
+        seq_params: Iterable[ParamsSequenceOrDictType],
+        max_count: Optional[int] = None,
+    ) -> Generator[List[bytes], None, None]:
+        """Generates the chunks of _batch_insert() and _batch_statements()
+
+        Each parameter set is substituted in fmt and the results are grouped
+        in lists, starting a new one before the connection max_batch_size,
+        minus the overhead bytes of the statement, would be exceeded once the
+        values are joined with a one byte separator, or when max_count values
+        were grouped.
+        """
+        budget = self._connection.max_batch_size - overhead
+        values: List[bytes] = []
+        size = 0
         try:
-            stmt = operation.encode(self._connection.python_charset)
             for params in seq_params:
-                tmp = fmt
                 if isinstance(params, dict):
-                    tmp = _bytestr_format_dict(tmp, self._process_params_dict(params))
+                    tmp = _get_statement_template(fmt, True).format_dict(
+                        self._process_params_dict(params)
+                    )
                 else:
-                    psub = _ParamSubstitutor(self._process_params(params))
-                    tmp = RE_PY_PARAM.sub(psub, tmp)
-                    if psub.remaining != 0:
-                        raise ProgrammingError(
-                            "Not all parameters were used in the SQL statement"
-                        )
+                    tmp = _get_statement_template(fmt).format(
+                        self._process_params(params)
+                    )
+                if values and (
+                    size + len(tmp) > budget or len(values) == max_count
+                ):
+                    yield values
+                    values = []
+                    size = 0
                 values.append(tmp)
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b",".join(values), 1)
-                self._executed = stmt
-                return stmt
-            return None
+                size += len(tmp) + 1
         except (UnicodeDecodeError, UnicodeEncodeError) as err:
             raise ProgrammingError(str(err)) from err
         except Error:
             raise
         except Exception as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
+        if values:
+            yield values
 
     def executemany(
         self, operation: str, seq_params: Sequence[ParamsSequenceOrDictType]
@@ -698,10 +1031,17 @@ class MySQLCursor(CursorBase):
         cursor.executemany(stmt, data)
 
         INSERT statements are optimized by batching the data, that is
-        using the MySQL multiple rows syntax.
+        using the MySQL multiple rows syntax. The rows are split across
+        several statements so none exceeds the connection max_batch_size,
+        and seq_params can be a generator, consumed as the rows are sent.
+
+        When the connection has multi_statement_batching enabled, other
+        statements are sent in multi-statement batches instead of one
+        round trip per parameter set.
 
         Results are discarded. If they are needed, consider looping over
-        data using the execute() method.
+        data using the execute() method. The rowcount of each statement sent
+        is available in rowcounts.
         """
         if not operation or not seq_params:
             return None
@@ -712,26 +1052,41 @@ class MySQLCursor(CursorBase):
         except TypeError as err:
             raise ProgrammingError("Parameters for query must be an Iterable") from err
 
+        rowcounts: List[int] = []
+        self._rowcounts = rowcounts
         # Optimize INSERTs by batching them
         if re.match(RE_SQL_INSERT_STMT, operation):
             if not seq_params:
                 self._rowcount = 0
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                self._executed = stmt
-                return self.execute(stmt)
+            stmts = self._batch_insert(operation, seq_params)
+            if stmts is not None:
+                for stmt in stmts:
+                    self.execute(stmt)
+                    rowcounts.append(self._rowcount)
+                self._rowcount = sum(rowcounts)
+                return None
+
+        if self._connection.multi_statement_batching:
+            batches = self._batch_statements(operation, seq_params)
+            if batches is not None:
+                for statements in batches:
+                    for _ in self._execute_statements(statements):
+                        if self.with_rows and self._have_unread_result():
+                            self.fetchall()
+                        rowcounts.append(self._rowcount)
+                self._rowcount = sum(rowcounts)
+                return None
 
-        rowcnt = 0
         try:
             for params in seq_params:
                 self.execute(operation, params)
                 if self.with_rows and self._have_unread_result():
                     self.fetchall()
-                rowcnt += self._rowcount
+                rowcounts.append(self._rowcount)
         except (ValueError, TypeError) as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
-        self._rowcount = rowcnt
+        self._rowcount = sum(rowcounts)
         return None
 
     def stored_results(self) -> Iterator[MySQLCursor]:
@@ -1398,19 +1753,125 @@ class MySQLCursorPrepared(MySQLCursor):
         If the cursor instance already had a prepared statement, it is
         first closed.
 
-        executemany() simply calls execute().
+        The statement is prepared and executed with the first parameter
+        set. When it does not produce a result set, the remaining parameter
+        sets are sent without waiting for each response, reusing the
+        parameter types already bound in the server whenever they do not
+        change. Otherwise, or when a parameter is a file-like object,
+        executemany() simply calls execute() for each parameter set.
+
+        When a pipelined execution fails, the parameter sets sent after it
+        in the same window (up to STMT_EXECUTE_PIPELINE_SIZE) may already
+        have run on the server, unlike with execute() where nothing runs
+        after the failing parameter set. Before the error is raised,
+        rowcounts holds the rowcount of every execution sent, -1 for the
+        failed ones, and rowcount their total.
+
+        .. versionchanged:: 8.2.0
+           Pipeline the executions of statements without result sets.
         """
         rowcnt = 0
+        self._rowcounts = []
         try:
-            for params in seq_params:
+            if not isinstance(seq_params, (list, tuple)):
+                seq_params = list(seq_params)
+            for index, params in enumerate(seq_params):
                 self.execute(operation, params)
                 if self.with_rows and self._have_unread_result():
                     self.fetchall()
                 rowcnt += self._rowcount
+                self._rowcounts.append(self._rowcount)
+                if (
+                    index == 0
+                    and not self.with_rows
+                    and hasattr(self._connection, "cmd_stmt_execute_many")
+                ):
+                    pending = self._pipelined_params(operation, seq_params[1:])
+                    if pending is not None:
+                        rowcnt += self._execute_pipelined(pending)
+                        break
         except (ValueError, TypeError) as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
         self._rowcount = rowcnt
 
+    def _pipelined_params(
+        self, operation: StrOrBytes, seq_params: Sequence[ParamsSequenceOrDictType]
+    ) -> Optional[List[ParamsSequenceType]]:
+        """Validate the remaining parameter sets of executemany()
+
+        Dictionaries are converted to tuples following the placeholders of
+        the operation. Parameter sets execute() would skip are dropped.
+
+        Returns None when the parameter sets can not be pipelined.
+        """
+        keys = None
+        if isinstance(operation, bytes):
+            operation = operation.decode(self._connection.python_charset)
+        if "%(" in operation:
+            keys = re.findall(RE_SQL_PYTHON_CAPTURE_PARAM_NAME, operation)
+        num_params = len(self._prepared["parameters"])
+        pending = []
+        for params in seq_params:
+            if keys is not None and isinstance(params, dict):
+                try:
+                    params = tuple(params[key] for key in keys)
+                except KeyError as err:
+                    raise ProgrammingError(
+                        "Not all placeholders were found in the parameters dict"
+                    ) from err
+            if num_params and not params:
+                continue
+            if params:
+                if not isinstance(params, (tuple, list)):
+                    raise ProgrammingError(
+                        errno=1210,
+                        msg="Incorrect type of argument: "
+                        f"{type(params).__name__}({params}), it must be of type "
+                        "tuple or list the argument given to the prepared statement",
+                    )
+                if num_params != len(params):
+                    raise ProgrammingError(
+                        errno=1210,
+                        msg="Incorrect number of arguments executing prepared "
+                        "statement",
+                    )
+                if any(isinstance(value, IOBase) for value in params):
+                    return None
+            pending.append(params or ())
+        return pending
+
+    def _execute_pipelined(self, seq_params: List[ParamsSequenceType]) -> int:
+        """Execute the prepared statement once for each parameter set
+        without waiting for each response
+
+        When an execution fails, rowcounts and rowcount are updated with
+        the executions that ran before the error is raised.
+
+        Returns the number of affected rows.
+        """
+        if not seq_params:
+            return 0
+        results: List[Optional[OkPacketType]] = []
+        error = None
+        try:
+            self._connection.cmd_stmt_execute_many(
+                self._prepared["statement_id"],
+                seq_params,
+                parameters=self._prepared["parameters"],
+                results=results,
+            )
+        except Error as err:
+            error = err
+        rowcounts = [
+            -1 if result is None else result["affected_rows"] for result in results
+        ]
+        self._rowcounts.extend(rowcounts)
+        if error is not None:
+            self._rowcount = sum(count for count in self._rowcounts if count > 0)
+            raise error
+        self._handle_result(results[-1])  # type: ignore[arg-type]
+        return sum(rowcounts)
+
     def fetchone(self) -> Optional[RowType]:
         """Return next row of a query result set.
 
@@ -1476,6 +1937,7 @@ class MySQLCursorDict(MySQLCursor):
             "col1": value1,
             "col2": value2
         }
+    When the connection uses compact rows, rows are Row objects instead.
     """
 
     def _row_to_python(
@@ -1485,9 +1947,11 @@ class MySQLCursorDict(MySQLCursor):
     ) -> Optional[Dict[str, ToPythonOutputTypes]]:
         """Convert a MySQL text result row to Python types
 
-        Returns a dictionary.
+        Returns a dictionary, or a Row when using compact rows.
         """
-        return dict(zip(self.column_names, rowdata)) if rowdata else None
+        if not rowdata:
+            return None
+        return _dict_row_factory(self._connection, self.column_names)(rowdata)
 
     def fetchone(self) -> Optional[Dict[str, ToPythonOutputTypes]]:
         """Return next row of a query result set.
@@ -1504,11 +1968,9 @@ class MySQLCursorDict(MySQLCursor):
             list: A list of dictionaries with all rows of a query
                   result set where column names are used as keys.
         """
-        return [
-            self._row_to_python(row, self.description)
-            for row in super().fetchall()
-            if row
-        ]
+        rows = super().fetchall()
+        make_row = _dict_row_factory(self._connection, self.column_names)
+        return [make_row(row) for row in rows if row]
 
 
 class MySQLCursorNamedTuple(MySQLCursor):
@@ -1594,9 +2056,8 @@ class MySQLCursorBufferedDict(MySQLCursorDict, MySQLCursorBuffered):
         """
         if self._executed is None or self._rows is None:
             raise InterfaceError(ERR_NO_RESULT_TO_FETCH)
-        res = []
-        for row in self._rows[self._next_row :]:
-            res.append(self._row_to_python(row, self.description))
+        make_row = _dict_row_factory(self._connection, self.column_names)
+        res = [make_row(row) for row in self._rows[self._next_row :]]
         self._next_row = len(self._rows)
         return res
 
@@ -1633,6 +2094,96 @@ class MySQLCursorBufferedNamedTuple(MySQLCursorNamedTuple, MySQLCursorBuffered):
         return res
 
 
+class MySQLCursorColumnar(MySQLCursorBuffered):
+    """
+    Buffered cursor fetching rows as columns.
+
+    The rows are read within execute() without converting them. fetchall()
+    and fetchmany() convert the fetched rows one column at a time and
+    return a dictionary mapping the column names to their values:
+        columns = {
+            "col1": array("q", [1, 2, 3]),
+            "col2": ["a", "b", "c"],
+        }
+    Integer and floating point columns without NULL values are NumPy arrays
+    when NumPy is installed, array.array otherwise. When the categorical
+    attribute is True, string columns are returned as Categorical.
+
+    .. versionadded:: 8.2.0
+    """
+
+    def __init__(
+        self, connection: Optional[Type[MySQLConnectionAbstract]] = None
+    ) -> None:
+        super().__init__(connection)
+        self.categorical: bool = False
+
+    def _handle_resultset(self) -> None:
+        (self._rows, eof) = self._connection.get_rows(raw=True)
+        self._rowcount = len(self._rows)
+        self._handle_eof(eof)
+        self._next_row = 0
+        try:
+            self._connection.unread_result = False
+        except AttributeError:
+            pass
+
+    def _rows_to_columns(self, rows: List[RowType]) -> ColumnsType:
+        """Convert text result rows to columns of Python values"""
+        converter = self._connection.converter
+        column_to_python = getattr(converter, "column_to_python", None)
+        description = self.description
+        columns = list(zip(*rows)) if rows else [()] * len(description)
+        result = {}
+        for desc, values in zip(description, columns):
+            if column_to_python is not None:
+                values = column_to_python(values, desc)
+            else:
+                values = [converter.to_python(desc, value) for value in values]
+            result[desc[0]] = _pack_column(values, desc, self.categorical)
+        return result
+
+    def fetchone(self) -> Optional[RowType]:
+        """Return next row of a query result set.
+
+        Returns:
+            tuple or None: A row from query result set.
+        """
+        self._check_executed()
+        row = self._fetch_row()
+        if row:
+            return self._connection.converter.row_to_python(row, self.description)
+        return None
+
+    def fetchmany(  # type: ignore[override]
+        self, size: Optional[int] = None
+    ) -> ColumnsType:
+        """Return the next set of rows of a query result set as columns.
+
+        The number of rows returned can be specified using the size argument,
+        which defaults to one.
+
+        Returns:
+            dict: The values of each column of the fetched rows.
+        """
+        self._check_executed()
+        rows = self._rows[self._next_row : self._next_row + (size or self.arraysize)]
+        self._next_row += len(rows)
+        return self._rows_to_columns(rows)
+
+    def fetchall(self) -> ColumnsType:  # type: ignore[override]
+        """Return all rows of a query result set as columns.
+
+        Returns:
+            dict: The values of each column of the result set.
+        """
+        if self._executed is None or self._rows is None:
+            raise InterfaceError(ERR_NO_RESULT_TO_FETCH)
+        rows = self._rows[self._next_row :]
+        self._next_row = len(self._rows)
+        return self._rows_to_columns(rows)
+
+
 class MySQLCursorPreparedDict(MySQLCursorDict, MySQLCursorPrepared):  # type: ignore[misc]
     """
     This class is a blend of features from MySQLCursorDict and MySQLCursorPrepared
@@ -1664,11 +2215,9 @@ class MySQLCursorPreparedDict(MySQLCursorDict, MySQLCursorPrepared):  # type: ig
             list: The next set of rows of a query result set represented
                   as a list of dictionaries where column names are used as keys.
         """
-        return [
-            self._row_to_python(row, self.description)
-            for row in super().fetchmany(size=size)
-            if row
-        ]
+        rows = super().fetchmany(size=size)
+        make_row = _dict_row_factory(self._connection, self.column_names)
+        return [make_row(row) for row in rows if row]
 
 
 class MySQLCursorPreparedNamedTuple(MySQLCursorNamedTuple, MySQLCursorPrepared):
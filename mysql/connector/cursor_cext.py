@@ -40,6 +40,7 @@ from typing import (
     Any,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
     NoReturn,
@@ -57,6 +58,7 @@ from _mysql_connector import MySQLInterfaceError, MySQLPrepStmt
 from .types import (
     CextEofPacketType,
     CextResultType,
+    ColumnsType,
     DescriptionType,
     ParamsSequenceOrDictType,
     ParamsSequenceType,
@@ -71,15 +73,16 @@ from .types import (
 
 from .abstracts import NAMED_TUPLE_CACHE, MySQLConnectionAbstract, MySQLCursorAbstract
 from .cursor import (
-    RE_PY_PARAM,
-    RE_SQL_COMMENT,
+    MAX_BATCH_STATEMENTS,
     RE_SQL_FIND_PARAM,
     RE_SQL_INSERT_STMT,
-    RE_SQL_INSERT_VALUES,
-    RE_SQL_ON_DUPLICATE,
     RE_SQL_PYTHON_CAPTURE_PARAM_NAME,
     RE_SQL_PYTHON_REPLACE_PARAM,
     RE_SQL_SPLIT_STMTS,
+    _dict_row_factory,
+    _get_insert_template,
+    _get_statement_template,
+    _pack_column,
 )
 from .errorcode import CR_NO_RESULT_SET
 from .errors import (
@@ -93,32 +96,6 @@ from .errors import (
 ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
 
-class _ParamSubstitutor:
-
-    """
-    Substitutes parameters into SQL statement.
-    """
-
-    def __init__(self, params: Sequence[bytes]) -> None:
-        self.params: Sequence[bytes] = params
-        self.index: int = 0
-
-    def __call__(self, matchobj: object) -> bytes:
-        index = self.index
-        self.index += 1
-        try:
-            return self.params[index]
-        except IndexError:
-            raise ProgrammingError(
-                "Not enough parameters for the SQL statement"
-            ) from None
-
-    @property
-    def remaining(self) -> int:
-        """Returns number of parameters remaining to be substituted"""
-        return len(self.params) - self.index
-
-
 class CMySQLCursor(MySQLCursorAbstract):
 
     """Default cursor for interacting with MySQL using C Extension"""
@@ -248,7 +225,9 @@ class CMySQLCursor(MySQLCursorAbstract):
         if not self._cnx.more_results:
             self._cnx.free_result()
 
-    def _execute_iter(self) -> Generator[CMySQLCursor, None, None]:
+    def _execute_iter(
+        self, executed_list: Optional[List[bytes]] = None
+    ) -> Generator[CMySQLCursor, None, None]:
         """Generator returns MySQLCursor objects for multiple statements
 
         Deprecated: use nextset() method directly.
@@ -256,9 +235,11 @@ class CMySQLCursor(MySQLCursorAbstract):
         This method is only used when multiple statements are executed
         by the execute() method. It uses zip() to make an iterator from the
         given query_iter (result of MySQLConnection.cmd_query_iter()) and
-        the list of statements that were executed.
+        the list of statements that were executed, split from the executed
+        operation unless given in executed_list.
         """
-        executed_list = RE_SQL_SPLIT_STMTS.split(self._executed)
+        if executed_list is None:
+            executed_list = RE_SQL_SPLIT_STMTS.split(self._executed)
         i = 0
         self._executed = executed_list[i]
         yield self
@@ -319,12 +300,9 @@ class CMySQLCursor(MySQLCursorAbstract):
                 for key, value in prepared.items():
                     stmt = stmt.replace(f"%({key})s".encode(), value)
             elif isinstance(prepared, (list, tuple)):
-                psub = _ParamSubstitutor(prepared)
-                stmt = RE_PY_PARAM.sub(psub, stmt)  # type: ignore[call-overload]
-                if psub.remaining != 0:
-                    raise ProgrammingError(
-                        "Not all parameters were used in the SQL statement"
-                    )
+                if isinstance(stmt, bytearray):
+                    stmt = bytes(stmt)
+                stmt = _get_statement_template(stmt).format(prepared)
 
         try:
             result = self._cnx.cmd_query(
@@ -346,40 +324,98 @@ class CMySQLCursor(MySQLCursorAbstract):
 
         return None
 
+    def _execute_statements(
+        self, statements: List[bytes]
+    ) -> Generator[CMySQLCursor, None, None]:
+        """Executes statements in one multi-statement batch
+
+        Works like execute() with multi=True, but the statements are already
+        separated, so the batch is not split again to tell which statement
+        each result belongs to.
+        """
+        self._cnx.handle_unread_result()
+        self.reset()
+        stmt = b";".join(statements)
+        try:
+            result = self._cnx.cmd_query(
+                stmt,
+                raw=self._raw,
+                buffered=self._buffered,
+                raw_as_string=self._raw_as_string,
+            )
+        except MySQLInterfaceError as err:
+            raise get_mysql_exception(
+                msg=err.msg, errno=err.errno, sqlstate=err.sqlstate
+            ) from err
+
+        self._executed = stmt
+        self._handle_result(result)
+        return self._execute_iter(statements)
+
     def _batch_insert(
         self,
         operation: str,
-        seq_params: Sequence[ParamsSequenceOrDictType],
-    ) -> Optional[bytes]:
-        """Implements multi row insert"""
-
-        def remove_comments(match: re.Match) -> str:
-            """Remove comments from INSERT statements.
-
-            This function is used while removing comments from INSERT
-            statements. If the matched string is a comment not enclosed
-            by quotes, it returns an empty string, else the string itself.
-            """
-            if match.group(1):
-                return ""
-            return match.group(2)
-
-        tmp = re.sub(
-            RE_SQL_ON_DUPLICATE,
-            "",
-            re.sub(RE_SQL_COMMENT, remove_comments, operation),
-        )
-
-        matches = re.search(RE_SQL_INSERT_VALUES, tmp)
-        if not matches:
-            raise InterfaceError(
-                "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
-            )
-        fmt = matches.group(1).encode(self._cnx.python_charset)
-        values = []
+        seq_params: Iterable[ParamsSequenceOrDictType],
+    ) -> Optional[Generator[bytes, None, None]]:
+        """Implements multi row insert
+
+        Returns a generator of INSERT statements, each one holding as many
+        rows as fit in the connection max_batch_size, or None when the
+        statement can not be rewritten. The parameters are consumed as the
+        statements are generated.
+        """
+        try:
+            template = _get_insert_template(operation, self._cnx.python_charset)
+        except (UnicodeDecodeError, UnicodeEncodeError) as err:
+            raise ProgrammingError(str(err)) from err
+        if template is None:
+            return None
+        prefix, fmt, suffix = template
+        chunks = self._batch_chunks(len(prefix) + len(suffix), fmt, seq_params)
+        return (b"".join((prefix, b",".join(values), suffix)) for values in chunks)
+
+    def _batch_statements(
+        self, operation: StrOrBytes, seq_params: Iterable[ParamsSequenceOrDictType]
+    ) -> Optional[Generator[List[bytes], None, None]]:
+        """Implements multi-statement batches
+
+        Returns a generator of batches of the statement, each batch being the
+        list of statements made by substituting the parameter sets, as many
+        as fit in the connection max_batch_size and up to
+        MAX_BATCH_STATEMENTS. Returns None when the operation holds more than
+        one statement.
+        """
+        try:
+            if isinstance(operation, str):
+                stmt = operation.encode(self._cnx.python_charset)
+            else:
+                stmt = bytes(operation)
+        except (UnicodeDecodeError, UnicodeEncodeError) as err:
+            raise ProgrammingError(str(err)) from err
+        stmt = stmt.strip().rstrip(b";").rstrip()
+        if len(RE_SQL_SPLIT_STMTS.split(stmt)) > 1:
+            return None
+        return self._batch_chunks(0, stmt, seq_params, MAX_BATCH_STATEMENTS)
 
+    def _batch_chunks(
+        self,
+        overhead: int,
+        fmt: bytes,
+        seq_params: Iterable[ParamsSequenceOrDictType],
+        max_count: Optional[int] = None,
+    ) -> Generator[List[bytes], None, None]:
+        """Generates the chunks of _batch_insert() and _batch_statements()
+
+        Each parameter set is substituted in fmt and the results are grouped
+        in lists, starting a new one before the connection max_batch_size,
+        minus the overhead bytes of the statement, would be exceeded once the
+        values are joined with a one byte separator, or when max_count values
+        were grouped.
+        """
+        budget = self._cnx.max_batch_size - overhead
+        values: List[bytes] = []
+        size = 0
         try:
-            stmt = operation.encode(self._cnx.python_charset)
             for params in seq_params:
                 tmp = fmt
                 prepared = self._cnx.prepare_for_mysql(params)
@@ -387,23 +423,21 @@ class CMySQLCursor(MySQLCursorAbstract):
                     for key, value in prepared.items():
                         tmp = tmp.replace(f"%({key})s".encode(), value)
                 elif isinstance(prepared, (list, tuple)):
-                    psub = _ParamSubstitutor(prepared)
-                    tmp = RE_PY_PARAM.sub(psub, tmp)  # type: ignore[call-overload]
-                    if psub.remaining != 0:
-                        raise ProgrammingError(
-                            "Not all parameters were used in the SQL statement"
-                        )
+                    tmp = _get_statement_template(fmt).format(prepared)
+                if values and (
+                    size + len(tmp) > budget or len(values) == max_count
+                ):
+                    yield values
+                    values = []
+                    size = 0
                 values.append(tmp)
-
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b",".join(values), 1)
-                self._executed = stmt
-                return stmt
-            return None
+                size += len(tmp) + 1
         except (UnicodeDecodeError, UnicodeEncodeError) as err:
             raise ProgrammingError(str(err)) from err
         except Exception as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
+        if values:
+            yield values
 
     def executemany(
         self,
@@ -426,10 +460,17 @@ class CMySQLCursor(MySQLCursorAbstract):
         cursor.executemany(stmt, data)
 
         INSERT statements are optimized by batching the data, that is
-        using the MySQL multiple rows syntax.
+        using the MySQL multiple rows syntax. The rows are split across
+        several statements so none exceeds the connection max_batch_size,
+        and seq_params can be a generator, consumed as the rows are sent.
+
+        When the connection has multi_statement_batching enabled, other
+        statements are sent in multi-statement batches instead of one
+        round trip per parameter set.
 
         Results are discarded! If they are needed, consider looping over
-        data using the execute() method.
+        data using the execute() method. The rowcount of each statement sent
+        is available in rowcounts.
         """
         if not operation or not seq_params:
             return None
@@ -441,35 +482,56 @@ class CMySQLCursor(MySQLCursorAbstract):
             raise ProgrammingError("Cursor is not connected") from err
         self._cnx.handle_unread_result()
 
-        if not isinstance(seq_params, (list, tuple)):
-            raise ProgrammingError("Parameters for query must be list or tuple.")
+        try:
+            _ = iter(seq_params)
+        except TypeError as err:
+            raise ProgrammingError("Parameters for query must be an Iterable") from err
 
+        rowcounts: List[int] = []
+        self._rowcounts = rowcounts
         # Optimize INSERTs by batching them
         if re.match(RE_SQL_INSERT_STMT, operation):
             if not seq_params:
                 self._rowcount = 0
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                self._executed = stmt
-                return self.execute(stmt)
+            stmts = self._batch_insert(operation, seq_params)
+            if stmts is not None:
+                for stmt in stmts:
+                    self.execute(stmt)
+                    rowcounts.append(self._affected_rows)
+                self._rowcount = sum(rowcounts)
+                return None
+
+        # When processing read ops (e.g., SELECT), rowcounts are updated
+        # based on self._rowcount. For write ops (e.g., INSERT) are
+        # updated based on self._affected_rows.
+        # The variable self._description is None for write ops, that's
+        # why we use it as indicator for updating rowcounts.
+        if self._cnx.multi_statement_batching:
+            batches = self._batch_statements(operation, seq_params)
+            if batches is not None:
+                for statements in batches:
+                    for _ in self._execute_statements(statements):
+                        if self.with_rows and self._cnx.unread_result:
+                            self.fetchall()
+                        rowcounts.append(
+                            self._rowcount if self.description else self._affected_rows
+                        )
+                self._rowcount = sum(rowcounts)
+                return None
 
-        rowcnt = 0
         try:
-            # When processing read ops (e.g., SELECT), rowcnt is updated
-            # based on self._rowcount. For write ops (e.g., INSERT) is
-            # updated based on self._affected_rows.
-            # The variable self._description is None for write ops, that's
-            # why we use it as indicator for updating rowcnt.
             for params in seq_params:
                 self.execute(operation, params)
                 if self.with_rows and self._cnx.unread_result:
                     self.fetchall()
-                rowcnt += self._rowcount if self.description else self._affected_rows
+                rowcounts.append(
+                    self._rowcount if self.description else self._affected_rows
+                )
         except (ValueError, TypeError) as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
 
-        self._rowcount = rowcnt
+        self._rowcount = sum(rowcounts)
         return None
 
     @property
@@ -887,7 +949,9 @@ class CMySQLCursorDict(CMySQLCursor):
             dict or None: A dict from query result set.
         """
         row = super().fetchone()
-        return dict(zip(self.column_names, row)) if row else None
+        if not row:
+            return None
+        return _dict_row_factory(self._cnx, self.column_names)(row)
 
     def fetchmany(self, size: int = 1) -> List[Dict[str, ToPythonOutputTypes]]:
         """Return the next set of rows of a query result set.
@@ -901,7 +965,8 @@ class CMySQLCursorDict(CMySQLCursor):
                   as a list of dictionaries where column names are used as keys.
         """
         res = super().fetchmany(size=size)
-        return [dict(zip(self.column_names, row)) for row in res]
+        make_row = _dict_row_factory(self._cnx, self.column_names)
+        return [make_row(row) for row in res]
 
     def fetchall(self) -> List[Dict[str, ToPythonOutputTypes]]:
         """Return all rows of a query result set.
@@ -911,7 +976,8 @@ class CMySQLCursorDict(CMySQLCursor):
                   result set where column names are used as keys.
         """
         res = super().fetchall()
-        return [dict(zip(self.column_names, row)) for row in res]
+        make_row = _dict_row_factory(self._cnx, self.column_names)
+        return [make_row(row) for row in res]
 
 
 class CMySQLCursorBufferedDict(CMySQLCursorBuffered):
@@ -922,7 +988,7 @@ class CMySQLCursorBufferedDict(CMySQLCursorBuffered):
     def _fetch_row(self) -> Optional[Dict[str, ToPythonOutputTypes]]:
         row = super()._fetch_row()
         if row:
-            return dict(zip(self.column_names, row))
+            return _dict_row_factory(self._cnx, self.column_names)(row)
         return None
 
     def fetchall(self) -> List[Dict[str, ToPythonOutputTypes]]:
@@ -932,7 +998,8 @@ class CMySQLCursorBufferedDict(CMySQLCursorBuffered):
             list: A list of tuples with all rows of a query result set.
         """
         res = super().fetchall()
-        return [dict(zip(self.column_names, row)) for row in res]
+        make_row = _dict_row_factory(self._cnx, self.column_names)
+        return [make_row(row) for row in res]
 
 
 class CMySQLCursorNamedTuple(CMySQLCursor):
@@ -1011,6 +1078,52 @@ class CMySQLCursorBufferedNamedTuple(CMySQLCursorBuffered):
         return [self.named_tuple(*row) for row in res]
 
 
+class CMySQLCursorColumnar(CMySQLCursorBuffered):
+    """Cursor using C Extension buffering and returning rows as columns
+
+    The rows are converted by the C Extension. fetchall() and fetchmany()
+    return a dictionary mapping the column names to their values, packed
+    like MySQLCursorColumnar does.
+
+    .. versionadded:: 8.2.0
+    """
+
+    def __init__(self, connection: Type[MySQLConnectionAbstract]):
+        super().__init__(connection)
+        self.categorical: bool = False
+
+    def _rows_to_columns(self, rows: List[RowType]) -> ColumnsType:
+        """Transpose rows to columns"""
+        description = self.description
+        columns = list(zip(*rows)) if rows else [()] * len(description)
+        return {
+            desc[0]: _pack_column(list(values), desc, self.categorical)
+            for desc, values in zip(description, columns)
+        }
+
+    def fetchmany(self, size: int = 1) -> ColumnsType:  # type: ignore[override]
+        """Return the next set of rows of a query result set as columns.
+
+        The number of rows returned can be specified using the size argument,
+        which defaults to one.
+
+        Returns:
+            dict: The values of each column of the fetched rows.
+        """
+        self._check_executed()
+        rows = self._rows[self._next_row : self._next_row + (size or self.arraysize)]
+        self._next_row += len(rows)
+        return self._rows_to_columns(rows)
+
+    def fetchall(self) -> ColumnsType:  # type: ignore[override]
+        """Return all rows of a query result set as columns.
+
+        Returns:
+            dict: The values of each column of the result set.
+        """
+        return self._rows_to_columns(super().fetchall())
+
+
 class CMySQLCursorPrepared(CMySQLCursor):
     """Cursor using MySQL Prepared Statements"""
 
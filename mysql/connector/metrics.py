@@ -0,0 +1,178 @@
+"""Lightweight connection and pool metrics.
+
+Counters and fixed-bucket latency histograms kept in plain Python objects,
+without creating OpenTelemetry spans. A connection is used by one thread at
+a time, so its metrics are updated without locking: a `ConnectionMetrics`
+instance must not be shared by connections used from different threads, and
+pools refuse one. Pool metrics are updated while holding the pool lock.
+
+Enable them with the `metrics` connection option and read them through the
+`metrics` property of connections and pools, which return a snapshot
+dictionary.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from bisect import bisect_left
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .connection import MySQLConnection
+    from .connection_cext import CMySQLConnection
+
+# Upper bounds, in seconds, of the latency histogram buckets. Latencies above
+# the last bound are counted in an extra overflow bucket.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class LatencyHistogram:
+    """Histogram of latencies with fixed buckets (see `LATENCY_BUCKETS`)."""
+
+    __slots__ = ("counts", "count", "total", "maximum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a latency."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the histogram as a dictionary.
+
+        The buckets are indexed by their upper bound in seconds, the overflow
+        bucket by `float("inf")`. Counts are not cumulative.
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.maximum,
+            "buckets": dict(zip(LATENCY_BUCKETS + (float("inf"),), self.counts)),
+        }
+
+
+class ConnectionMetrics:
+    """Counters and latency histograms of a connection.
+
+    `bytes_sent` counts the bytes of the payloads written to the socket and
+    `bytes_received` the bytes of the packets read from it, headers included.
+    Both stay at 0 for C extension connections, whose network layer is not
+    visible from Python.
+    """
+
+    __slots__ = (
+        "queries",
+        "stmt_executes",
+        "errors",
+        "rows_fetched",
+        "bytes_sent",
+        "bytes_received",
+        "query_latency",
+        "stmt_execute_latency",
+    )
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.stmt_executes = 0
+        self.errors = 0
+        self.rows_fetched = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.query_latency = LatencyHistogram()
+        self.stmt_execute_latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values as a dictionary."""
+        return {
+            "queries": self.queries,
+            "stmt_executes": self.stmt_executes,
+            "errors": self.errors,
+            "rows_fetched": self.rows_fetched,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "query_latency": self.query_latency.snapshot(),
+            "stmt_execute_latency": self.stmt_execute_latency.snapshot(),
+        }
+
+
+class PoolMetrics:
+    """Counters and latency histogram of a connection pool.
+
+    `wait_latency` records the time spent in `get_connection()`, including
+    waiting for the pool lock and reconnecting or resetting the connection.
+    """
+
+    __slots__ = ("connections_given", "pool_exhausted", "wait_latency")
+
+    def __init__(self) -> None:
+        self.connections_given = 0
+        self.pool_exhausted = 0
+        self.wait_latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values as a dictionary."""
+        return {
+            "connections_given": self.connections_given,
+            "pool_exhausted": self.pool_exhausted,
+            "wait_latency": self.wait_latency.snapshot(),
+        }
+
+
+def with_metrics(counter: str, histogram: str) -> Callable:
+    """Count the calls of a connection method and record their latency.
+
+    `counter` and `histogram` are the names of the `ConnectionMetrics`
+    attributes to update. When metrics are disabled the method is called
+    right away.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(
+            cnx: Union["MySQLConnection", "CMySQLConnection"],
+            *args: Any,
+            **kwargs: Any,
+        ) -> Any:
+            """Metrics decorator."""
+            metrics: Optional[ConnectionMetrics] = cnx._metrics
+            if metrics is None:
+                return method(cnx, *args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return method(cnx, *args, **kwargs)
+            except Exception:
+                metrics.errors += 1
+                raise
+            finally:
+                setattr(metrics, counter, getattr(metrics, counter) + 1)
+                getattr(metrics, histogram).observe(perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -38,7 +38,7 @@ import zlib
 
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Any, Deque, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 try:
     import ssl
@@ -55,17 +55,31 @@ except ImportError:
     TLS_V1_3_SUPPORTED = False
     ssl = None
 
+try:
+    import zstandard as zstd
+
+    HAVE_ZSTD = True
+except ImportError:
+    HAVE_ZSTD = False
+
+from .constants import DEFAULT_ZSTD_COMPRESSION_LEVEL
 from .errors import (
     InterfaceError,
     NotSupportedError,
     OperationalError,
     ProgrammingError,
 )
+from .metrics import ConnectionMetrics
 
 MIN_COMPRESS_LENGTH: int = 50
 MAX_PAYLOAD_LENGTH: int = 2**24 - 1
 PACKET_HEADER_LENGTH: int = 4
 COMPRESSED_PACKET_HEADER_LENGTH: int = 7
+READ_AHEAD_SIZE: int = 16384
+# Payloads from this length on are sent without copying them behind the header
+MIN_VECTORED_SEND_LENGTH: int = 65536
+# Maximum number of buffers handed to a single `sendmsg` call
+SENDMSG_MAX_BUFFERS: int = 64
 
 
 def _strioerror(err: IOError) -> str:
@@ -148,10 +162,20 @@ class NetworkBroker(ABC):
 
 
 class NetworkBrokerPlain(NetworkBroker):
-    """Broker class for MySQL socket communication."""
+    """Broker class for MySQL socket communication.
 
-    def __init__(self) -> None:
+    Incoming data is read ahead into a buffer of `read_ahead_size` bytes, so a
+    single `recv_into` syscall usually serves the header and payload of many
+    small packets (e.g. the rows of a result set).
+    """
+
+    def __init__(self, read_ahead_size: int = READ_AHEAD_SIZE) -> None:
         self._pktnr: int = -1  # packet number
+        self._read_ahead_size: int = read_ahead_size
+        self._rbuf: bytearray = bytearray(read_ahead_size)
+        self._rbuf_view: memoryview = memoryview(self._rbuf)
+        self._rbuf_start: int = 0  # position of the first unread byte
+        self._rbuf_end: int = 0  # position after the last buffered byte
 
     def _set_next_pktnr(self) -> None:
         """Increment packet id."""
@@ -168,18 +192,101 @@ class NetworkBrokerPlain(NetworkBroker):
         except AttributeError as err:
             raise OperationalError(errno=2006) from err
 
+    def _send_pkts(
+        self, sock: socket.socket, address: str, buffers: List[memoryview]
+    ) -> None:
+        """Write packets given as header and payload buffers to the comm channel.
+
+        Buffers are written with vectored I/O (`sendmsg`) when the socket
+        supports it, so headers are never concatenated to their payloads.
+        Otherwise each packet is written with `sendall`.
+        """
+        buffers = [buf for buf in buffers if buf.nbytes]
+        try:
+            if not hasattr(sock, "sendmsg") or (
+                ssl is not None and isinstance(sock, ssl.SSLSocket)
+            ):
+                for buf in buffers:
+                    sock.sendall(buf)
+                return
+            while buffers:
+                sent = sock.sendmsg(buffers[:SENDMSG_MAX_BUFFERS])
+                # Drop the fully sent buffers and trim a partially sent one
+                while sent:
+                    if sent >= buffers[0].nbytes:
+                        sent -= buffers.pop(0).nbytes
+                    else:
+                        buffers[0] = buffers[0][sent:]
+                        sent = 0
+        except IOError as err:
+            raise OperationalError(
+                errno=2055, values=(address, _strioerror(err))
+            ) from err
+        except AttributeError as err:
+            raise OperationalError(errno=2006) from err
+
+    def _recv_into(self, sock: socket.socket, view: memoryview) -> None:
+        """Fill `view` with bytes from the comm channel.
+
+        Bytes already read ahead are served first. Requests smaller than the
+        read-ahead buffer refill it with as much as the socket has available,
+        bigger ones are read straight into `view`.
+        """
+        size = len(view)
+        start, end = self._rbuf_start, self._rbuf_end
+        available = end - start
+        if size <= available:
+            view[:] = self._rbuf_view[start : start + size]
+            self._rbuf_start = start + size
+            return
+
+        if available:
+            view[:available] = self._rbuf_view[start:end]
+            view = view[available:]
+            size -= available
+        self._rbuf_start = self._rbuf_end = 0
+
+        if size >= self._read_ahead_size:
+            while size:
+                read = sock.recv_into(view, size)
+                if read == 0:
+                    raise InterfaceError(errno=2013)
+                view = view[read:]
+                size -= read
+            return
+
+        end = 0
+        while end < size:
+            read = sock.recv_into(
+                self._rbuf_view[end:], self._read_ahead_size - end
+            )
+            if read == 0:
+                raise InterfaceError(errno=2013)
+            end += read
+        view[:] = self._rbuf_view[:size]
+        self._rbuf_start, self._rbuf_end = size, end
+
     def _recv_chunk(self, sock: socket.socket, size: int = 0) -> bytearray:
         """Read `size` bytes from the comm channel."""
         pkt = bytearray(size)
-        pkt_view = memoryview(pkt)
-        while size:
-            read = sock.recv_into(pkt_view, size)
-            if read == 0 and size > 0:
-                raise InterfaceError(errno=2013)
-            pkt_view = pkt_view[read:]
-            size -= read
+        if size:
+            self._recv_into(sock, memoryview(pkt))
         return pkt
 
+    def get_read_ahead(self) -> bytes:
+        """Get the bytes read ahead from the comm channel but not consumed yet."""
+        return bytes(self._rbuf_view[self._rbuf_start : self._rbuf_end])
+
+    def set_read_ahead(self, data: bytes) -> None:
+        """Seed the read-ahead buffer, e.g. when taking over from another broker."""
+        if len(data) > self._read_ahead_size:
+            self._read_ahead_size = len(data)
+            self._rbuf = bytearray(data)
+            self._rbuf_view = memoryview(self._rbuf)
+        else:
+            self._rbuf_view[: len(data)] = data
+        self._rbuf_start, self._rbuf_end = 0, len(data)
+
     def send(
         self,
         sock: socket.socket,
@@ -198,31 +305,42 @@ class NetworkBrokerPlain(NetworkBroker):
         else:
             self._pktnr = packet_number
 
+        if len(payload) < MIN_VECTORED_SEND_LENGTH:
+            # Small packet, cheaper to concatenate and write in one go
+            self._send_pkt(
+                sock,
+                address,
+                struct.pack("<I", len(payload))[0:3]
+                + struct.pack("<B", self._pktnr)
+                + payload,
+            )
+            return
+
         # If the payload is larger than or equal to MAX_PAYLOAD_LENGTH
         # the length is set to 2^24 - 1 (ff ff ff) and additional
         # packets are sent with the rest of the payload until the
         # payload of a packet is less than MAX_PAYLOAD_LENGTH.
-        if len(payload) >= MAX_PAYLOAD_LENGTH:
-            offset = 0
-            for _ in range(len(payload) // MAX_PAYLOAD_LENGTH):
-                # payload_len, sequence_id, payload
-                self._send_pkt(
-                    sock,
-                    address,
-                    b"\xff\xff\xff"
-                    + struct.pack("<B", self._pktnr)
-                    + payload[offset : offset + MAX_PAYLOAD_LENGTH],
-                )
-                self._set_next_pktnr()
-                offset += MAX_PAYLOAD_LENGTH
-            payload = payload[offset:]
-        self._send_pkt(
-            sock,
-            address,
-            struct.pack("<I", len(payload))[0:3]
-            + struct.pack("<B", self._pktnr)
-            + payload,
+        # Packets are sent as (header, payload view) buffers, so the payload
+        # is never copied.
+        payload_view = memoryview(payload).cast("B")
+        buffers: List[memoryview] = []
+        offset = 0
+        for _ in range(len(payload_view) // MAX_PAYLOAD_LENGTH):
+            # payload_len, sequence_id, payload
+            buffers.append(
+                memoryview(b"\xff\xff\xff" + struct.pack("<B", self._pktnr))
+            )
+            buffers.append(payload_view[offset : offset + MAX_PAYLOAD_LENGTH])
+            self._set_next_pktnr()
+            offset += MAX_PAYLOAD_LENGTH
+        buffers.append(
+            memoryview(
+                struct.pack("<I", len(payload_view) - offset)[0:3]
+                + struct.pack("<B", self._pktnr)
+            )
         )
+        buffers.append(payload_view[offset:])
+        self._send_pkts(sock, address, buffers)
 
     def recv(self, sock: socket.socket, address: str) -> bytearray:
         """Receive `one` packet from the MySQL server."""
@@ -232,12 +350,16 @@ class NetworkBrokerPlain(NetworkBroker):
 
             # Pull the payload length and sequence id
             payload_len, self._pktnr = (
-                struct.unpack("<I", header[0:3] + b"\x00")[0],
+                header[0] | header[1] << 8 | header[2] << 16,
                 header[3],
             )
 
-            # Read the payload, and return packet
-            return header + self._recv_chunk(sock, size=payload_len)
+            # Read the payload straight behind the header, and return packet
+            pkt = bytearray(PACKET_HEADER_LENGTH + payload_len)
+            pkt[:PACKET_HEADER_LENGTH] = header
+            if payload_len:
+                self._recv_into(sock, memoryview(pkt)[PACKET_HEADER_LENGTH:])
+            return pkt
         except IOError as err:
             raise OperationalError(
                 errno=2055, values=(address, _strioerror(err))
@@ -245,12 +367,67 @@ class NetworkBrokerPlain(NetworkBroker):
 
 
 class NetworkBrokerCompressed(NetworkBrokerPlain):
-    """Broker class for MySQL socket communication."""
+    """Broker class for MySQL socket communication.
+
+    Args:
+        read_ahead_size: Size of the read-ahead buffer.
+        compress_algorithm: Compression algorithm negotiated with the server,
+                            `zlib` or `zstd`.
+        compress_level: Compression level, `None` for the algorithm's default.
+        compress_threshold: Data shorter than this is sent uncompressed.
+    """
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        read_ahead_size: int = READ_AHEAD_SIZE,
+        compress_algorithm: str = "zlib",
+        compress_level: Optional[int] = None,
+        compress_threshold: int = MIN_COMPRESS_LENGTH,
+    ) -> None:
+        super().__init__(read_ahead_size)
         self._compressed_pktnr = -1
         self._queue_read: Deque[bytearray] = deque()
+        self._compress_threshold: int = compress_threshold
+        if compress_algorithm == "zstd":
+            if not HAVE_ZSTD:
+                raise InterfaceError(
+                    "zstd compression requires the 'zstandard' package"
+                )
+            zstd_compressor = zstd.ZstdCompressor(
+                level=DEFAULT_ZSTD_COMPRESSION_LEVEL
+                if compress_level is None
+                else compress_level
+            )
+            zstd_decompressor = zstd.ZstdDecompressor()
+            self._compress: Callable[[bytes], bytes] = zstd_compressor.compress
+            self._decompress: Callable[[bytes, int], bytes] = (
+                lambda data, size: zstd_decompressor.decompress(
+                    data, max_output_size=size
+                )
+            )
+        elif compress_algorithm == "zlib":
+            zlib_level = -1 if compress_level is None else compress_level
+            self._compress = lambda data: zlib.compress(data, zlib_level)
+            self._decompress = lambda data, _: zlib.decompress(data)
+        else:
+            raise InterfaceError(
+                f"Unsupported compression algorithm '{compress_algorithm}'"
+            )
+        self._stats: Dict[str, int] = {
+            "bytes_sent_uncompressed": 0,
+            "bytes_sent_compressed": 0,
+            "bytes_received_compressed": 0,
+            "bytes_received_uncompressed": 0,
+        }
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Bytes handled before and after compression, in both directions.
+
+        Compressed counts are what travelled on the wire (packet headers
+        excluded), uncompressed counts are the MySQL packets they carried.
+        """
+        return self._stats.copy()
 
     @staticmethod
     def _prepare_packets(payload: bytes, pktnr: int) -> List[bytes]:
@@ -283,13 +460,30 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
         self._compressed_pktnr = (self._compressed_pktnr + 1) % 256
 
     def _send_pkt(self, sock: socket.socket, address: str, pkt: bytes) -> None:
-        """Compress packet and write it to the comm channel."""
-        compressed_pkt = zlib.compress(pkt)
+        """Compress packet and write it to the comm channel.
+
+        For small packets it may be too costly to compress the packet.
+        Usually payloads less than 50 bytes (MIN_COMPRESS_LENGTH) aren't
+        compressed (see MySQL source code Documentation). Data that does not
+        shrink when compressed is sent as is too.
+        """
+        self._stats["bytes_sent_uncompressed"] += len(pkt)
+        uncompressed_pll = len(pkt)
+        if len(pkt) > self._compress_threshold:
+            compressed_pkt = self._compress(pkt)
+            if len(compressed_pkt) < len(pkt):
+                pkt = compressed_pkt
+            else:
+                uncompressed_pll = 0
+        else:
+            # an uncompressed payload length of 0 signals data isn't compressed
+            uncompressed_pll = 0
+        self._stats["bytes_sent_compressed"] += len(pkt)
         pkt = (
-            struct.pack("<I", len(compressed_pkt))[0:3]
+            struct.pack("<I", len(pkt))[0:3]
             + struct.pack("<B", self._compressed_pktnr)
-            + struct.pack("<I", len(pkt))[0:3]
-            + compressed_pkt
+            + struct.pack("<I", uncompressed_pll)[0:3]
+            + pkt
         )
         return super()._send_pkt(sock, address, pkt)
 
@@ -337,22 +531,7 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
             self._send_pkt(sock, address, payload_prep[offset:])
         else:
             # send one MySQL packet
-            # For small packets it may be too costly to compress the packet.
-            # Usually payloads less than 50 bytes (MIN_COMPRESS_LENGTH)
-            # aren't compressed (see MySQL source code Documentation).
-            if len(payload) > MIN_COMPRESS_LENGTH:
-                # perform compression
-                self._send_pkt(sock, address, payload_prep)
-            else:
-                # skip compression
-                super()._send_pkt(
-                    sock,
-                    address,
-                    struct.pack("<I", len(payload_prep))[0:3]
-                    + struct.pack("<B", self._compressed_pktnr)
-                    + struct.pack("<I", 0)[0:3]
-                    + payload_prep,
-                )
+            self._send_pkt(sock, address, payload_prep)
 
     def _recv_compressed_pkt(
         self, sock: socket.socket, compressed_pll: int, uncompressed_pll: int
@@ -365,8 +544,10 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
         pkt = (
             compressed_pkt
             if uncompressed_pll == 0
-            else bytearray(zlib.decompress(compressed_pkt))
+            else bytearray(self._decompress(compressed_pkt, uncompressed_pll))
         )
+        self._stats["bytes_received_compressed"] += compressed_pll
+        self._stats["bytes_received_uncompressed"] += len(pkt)
 
         offset = 0
         while offset < len(pkt):
@@ -393,11 +574,11 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
 
                 # recalling that if uncompressed payload length == 0, the packet
                 # comes in uncompressed, so no decompression is needed.
-                pkt += (
-                    compressed_pkt
-                    if uncompressed_pll == 0
-                    else zlib.decompress(compressed_pkt)
-                )
+                if uncompressed_pll != 0:
+                    compressed_pkt = self._decompress(compressed_pkt, uncompressed_pll)
+                self._stats["bytes_received_compressed"] += compressed_pll
+                self._stats["bytes_received_uncompressed"] += len(compressed_pkt)
+                pkt += compressed_pkt
 
             self._queue_read.append(pkt[offset : offset + PACKET_HEADER_LENGTH + pll])
             offset += PACKET_HEADER_LENGTH + pll
@@ -451,11 +632,40 @@ class MySQLSocket(ABC):
         self.sock: Optional[socket.socket] = None
         self._connection_timeout: Optional[int] = None
         self.server_host: Optional[str] = None
-        self._netbroker: NetworkBroker = NetworkBrokerPlain()
+        self._read_ahead_size: int = READ_AHEAD_SIZE
+        self._netbroker: NetworkBroker = NetworkBrokerPlain(self._read_ahead_size)
+        # counts the bytes sent and received when set by the connection
+        self.metrics: Optional[ConnectionMetrics] = None
 
-    def switch_to_compressed_mode(self) -> None:
-        """Enable network layer where transactions are made with compressed packets."""
-        self._netbroker = NetworkBrokerCompressed()
+    def switch_to_compressed_mode(
+        self,
+        compress_algorithm: str = "zlib",
+        compress_level: Optional[int] = None,
+        compress_threshold: int = MIN_COMPRESS_LENGTH,
+    ) -> None:
+        """Enable network layer where transactions are made with compressed packets.
+
+        Args:
+            compress_algorithm: Compression algorithm negotiated with the server.
+            compress_level: Compression level, `None` for the algorithm's default.
+            compress_threshold: Data shorter than this is sent uncompressed.
+        """
+        netbroker = NetworkBrokerCompressed(
+            self._read_ahead_size,
+            compress_algorithm=compress_algorithm,
+            compress_level=compress_level,
+            compress_threshold=compress_threshold,
+        )
+        # Hand over anything the plain broker read ahead but did not consume
+        netbroker.set_read_ahead(self._netbroker.get_read_ahead())
+        self._netbroker = netbroker
+
+    @property
+    def compression_stats(self) -> Optional[Dict[str, int]]:
+        """Compression counters, `None` if compression is not enabled."""
+        if isinstance(self._netbroker, NetworkBrokerCompressed):
+            return self._netbroker.stats
+        return None
 
     def shutdown(self) -> None:
         """Shut down the socket before closing it."""
@@ -618,6 +828,8 @@ class MySQLSocket(ABC):
         compressed_packet_number: Optional[int] = None,
     ) -> None:
         """Send `payload` to the MySQL server."""
+        if self.metrics is not None:
+            self.metrics.bytes_sent += len(payload)
         return self._netbroker.send(
             self.sock,
             self.address,
@@ -628,7 +840,10 @@ class MySQLSocket(ABC):
 
     def recv(self) -> bytearray:
         """Get packet from the MySQL server comm channel."""
-        return self._netbroker.recv(self.sock, self.address)
+        pkt = self._netbroker.recv(self.sock, self.address)
+        if self.metrics is not None:
+            self.metrics.bytes_received += len(pkt)
+        return pkt
 
     @abstractmethod
     def open_connection(self) -> None:
@@ -5,10 +5,12 @@
 from __future__ import annotations
 
 import functools
+import random
 import re
 
 from abc import ABC, abstractmethod
 from contextlib import nullcontext
+from time import time_ns
 from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Optional, Union
 
 # pylint: disable=cyclic-import
@@ -78,6 +80,51 @@ from .constants import (
 leading_comment_remover: re.Pattern = re.compile(r"^/\*.*?\*/")
 
 
+class TraceSampler:
+    """Decides which connections and statements are traced.
+
+    Sampling is head-based: whether an operation is traced is decided, with
+    probability `sample_ratio`, before it runs. Operations not sampled create
+    no span and build no attributes.
+
+    When `slow_query_threshold` (in seconds) is set, statements not sampled
+    are still timed, and the ones taking at least that long are traced after
+    the fact.
+    """
+
+    def __init__(
+        self, sample_ratio: float = 1.0, slow_query_threshold: Optional[float] = None
+    ) -> None:
+        """Constructor."""
+        if (
+            not isinstance(sample_ratio, (int, float))
+            or isinstance(sample_ratio, bool)
+            or not 0 <= sample_ratio <= 1
+        ):
+            raise connector.errors.ProgrammingError(
+                "sample_ratio must be a number between 0 and 1"
+            )
+        if slow_query_threshold is not None and (
+            not isinstance(slow_query_threshold, (int, float))
+            or isinstance(slow_query_threshold, bool)
+            or slow_query_threshold < 0
+        ):
+            raise connector.errors.ProgrammingError(
+                "slow_query_threshold must be a non-negative number of seconds"
+            )
+        self.sample_ratio: float = sample_ratio
+        self.slow_query_threshold_ns: Optional[int] = (
+            None if slow_query_threshold is None else int(slow_query_threshold * 1e9)
+        )
+
+    def should_sample(self) -> bool:
+        """Whether the next operation is traced."""
+        return self.sample_ratio >= 1 or random.random() < self.sample_ratio
+
+
+ALWAYS_SAMPLE = TraceSampler()
+
+
 def record_exception_event(span: trace.Span, exc: Optional[Exception]) -> None:
     """Records an exeception event."""
     if not span or not span.is_recording() or not exc:
@@ -203,18 +250,10 @@ def with_connection_span_attached(method: Callable) -> Callable:
     return wrapper
 
 
-def _instrument_execution(
-    query_method: Callable,
-    tracer: trace.Tracer,
-    connection_span_link: trace.Link,
-    wrapped: Union["MySQLCursor", "CMySQLCursor"],
-    *args: Any,
-    **kwargs: Any,
-) -> Callable:
-    """Instruments the execution of `query_method`.
-
-    A query span with a link to the corresponding connection span is generated.
-    """
+def _get_query_span_attributes(
+    wrapped: Union["MySQLCursor", "CMySQLCursor"]
+) -> Dict[str, Any]:
+    """Return the attributes of a query span."""
     connection: Union["MySQLConnection", "CMySQLConnection"] = (
         getattr(wrapped, "_connection")
         if hasattr(wrapped, "_connection")
@@ -224,18 +263,86 @@ def _instrument_execution(
     # SpanAttributes.DB_NAME: connection.database or ""; introduces performance
     # degradation, at this time the database attribute is something nice to have but
     # not a requirement.
-    query_span_attributes: Dict = {
+    return {
         SpanAttributes.DB_SYSTEM: DB_SYSTEM,
         SpanAttributes.DB_USER: connection._user,
         SpanAttributes.THREAD_ID: DEFAULT_THREAD_ID,
         SpanAttributes.THREAD_NAME: DEFAULT_THREAD_NAME,
         "cursor_type": wrapped.__class__.__name__,
     }
+
+
+def _instrument_slow_execution(
+    query_method: Callable,
+    tracer: trace.Tracer,
+    connection_span_link: trace.Link,
+    threshold_ns: int,
+    wrapped: Union["MySQLCursor", "CMySQLCursor"],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Times the execution of `query_method`, tracing it only if it was slow.
+
+    The query span is created once the execution finished, with its real start
+    and end times, when it took at least `threshold_ns` nanoseconds.
+    """
+    error = None
+    start = time_ns()
+    try:
+        return query_method(*args, **kwargs)
+    except Exception as err:
+        error = err
+        raise
+    finally:
+        end = time_ns()
+        if end - start >= threshold_ns:
+            attributes = _get_query_span_attributes(wrapped)
+            attributes["slow_query"] = True
+            span = tracer.start_span(
+                name=get_operation_name(args[0]) or "SQL statement",
+                kind=trace.SpanKind.CLIENT,
+                links=[connection_span_link]
+                if connection_span_link.context.is_valid
+                else None,
+                attributes=attributes,
+                start_time=start,
+            )
+            record_exception_event(span, error)
+            span.end(end_time=end)
+
+
+def _instrument_execution(
+    query_method: Callable,
+    tracer: trace.Tracer,
+    connection_span_link: trace.Link,
+    sampler: TraceSampler,
+    wrapped: Union["MySQLCursor", "CMySQLCursor"],
+    *args: Any,
+    **kwargs: Any,
+) -> Callable:
+    """Instruments the execution of `query_method`.
+
+    A query span with a link to the corresponding connection span is generated
+    when the execution is sampled, see `TraceSampler`.
+    """
+    if not sampler.should_sample():
+        if sampler.slow_query_threshold_ns is None:
+            return query_method(*args, **kwargs)
+        return _instrument_slow_execution(
+            query_method,
+            tracer,
+            connection_span_link,
+            sampler.slow_query_threshold_ns,
+            wrapped,
+            *args,
+            **kwargs,
+        )
+
     with tracer.start_as_current_span(
         name=get_operation_name(args[0]) or "SQL statement",
         kind=trace.SpanKind.CLIENT,
-        links=[connection_span_link],
-        attributes=query_span_attributes,
+        links=[connection_span_link] if connection_span_link.context.is_valid else None,
+        attributes=_get_query_span_attributes(wrapped),
     ):
         return query_method(*args, **kwargs)
 
@@ -294,12 +401,16 @@ class TracedMySQLCursor(BaseMySQLTracer):
         wrapped: Union["MySQLCursor", "CMySQLCursor"],
         tracer: trace.Tracer,
         connection_span: trace.Span,
+        sampler: TraceSampler = ALWAYS_SAMPLE,
     ):
         """Constructor."""
         self._wrapped: Union["MySQLCursor", "CMySQLCursor"] = wrapped
-        self._tracer: trace.Tracer = tracer
-        self._connection_span_link: trace.Link = trace.Link(
-            connection_span.get_span_context()
+        # Kept in the wrapper itself, they are read on every execution and
+        # looking up attributes proxied to the wrapped object is slow
+        self.__dict__.update(
+            _tracer=tracer,
+            _connection_span_link=trace.Link(connection_span.get_span_context()),
+            _sampler=sampler,
         )
 
     def execute(self, *args: Any, **kwargs: Any) -> Any:
@@ -308,6 +419,7 @@ class TracedMySQLCursor(BaseMySQLTracer):
             self._wrapped.execute,
             self._tracer,
             self._connection_span_link,
+            self._sampler,
             self._wrapped,
             *args,
             **kwargs,
@@ -319,6 +431,7 @@ class TracedMySQLCursor(BaseMySQLTracer):
             self._wrapped.executemany,
             self._tracer,
             self._connection_span_link,
+            self._sampler,
             self._wrapped,
             *args,
             **kwargs,
@@ -330,6 +443,7 @@ class TracedMySQLCursor(BaseMySQLTracer):
             self._wrapped.callproc,
             self._tracer,
             self._connection_span_link,
+            self._sampler,
             self._wrapped,
             *args,
             **kwargs,
@@ -339,9 +453,14 @@ class TracedMySQLCursor(BaseMySQLTracer):
 class TracedMySQLConnection(BaseMySQLTracer):
     """Wrapper class for a `MySQLConnection` or `CMySQLConnection` object."""
 
-    def __init__(self, wrapped: Union["MySQLConnection", "CMySQLConnection"]) -> None:
+    def __init__(
+        self,
+        wrapped: Union["MySQLConnection", "CMySQLConnection"],
+        sampler: TraceSampler = ALWAYS_SAMPLE,
+    ) -> None:
         """Constructor."""
         self._wrapped: Union["MySQLConnection", "CMySQLConnection"] = wrapped
+        self.__dict__["_sampler"] = sampler
 
         # call `sql_mode` so its value is cached internally and querying it does not
         # interfere when recording query span events later.
@@ -353,6 +472,7 @@ class TracedMySQLConnection(BaseMySQLTracer):
             wrapped=self._wrapped.cursor(*args, **kwargs),
             tracer=self._tracer,
             connection_span=self._span,
+            sampler=self._sampler,
         )
 
     @with_connection_span_attached
@@ -366,6 +486,7 @@ def _instrument_connect(
         ..., Union["MySQLConnection", "CMySQLConnection", "PooledMySQLConnection"]
     ],
     tracer_provider: Optional[trace.TracerProvider] = None,
+    sampler: TraceSampler = ALWAYS_SAMPLE,
 ) -> Callable[
     ..., Union["MySQLConnection", "CMySQLConnection", "PooledMySQLConnection"]
 ]:
@@ -390,6 +511,15 @@ def _instrument_connect(
             tracer_provider=tracer_provider,
         )
 
+        if not sampler.should_sample():
+            # No connection span, statements are still sampled on their own
+            kwargs[OPTION_CNX_SPAN] = trace.INVALID_SPAN
+            kwargs[OPTION_CNX_TRACER] = tracer
+            return TracedMySQLConnection(
+                wrapped=connect(*args, **kwargs),  # type: ignore[arg-type]
+                sampler=sampler,
+            )
+
         # The connection span is passed in as an argument so the connection object can
         # keep a pointer to it.
         kwargs[OPTION_CNX_SPAN] = tracer.start_span(
@@ -411,6 +541,7 @@ def _instrument_connect(
 
             return TracedMySQLConnection(
                 wrapped=cnx,  # type: ignore[return-value, arg-type]
+                sampler=sampler,
             )
 
     return wrapper
@@ -444,6 +575,10 @@ class MySQLInstrumentor:
         Args:
             trace_module: reference to the 'trace' module from opentelemetry.
             tracer_provider (optional): TracerProvider instance.
+            sample_ratio (optional): Ratio of connections and statements traced,
+                from 0 to 1 (default), see `TraceSampler`.
+            slow_query_threshold (optional): Statements taking at least this
+                many seconds are traced even if they were not sampled.
 
         NOTE: Instrumentation for pooled connections not supported.
         """
@@ -453,12 +588,18 @@ class MySQLInstrumentor:
         connector.connect = _instrument_connect(
             connect=getattr(self, "_original_connect"),
             tracer_provider=kwargs.get("tracer_provider"),
+            sampler=TraceSampler(
+                sample_ratio=kwargs.get("sample_ratio", 1.0),
+                slow_query_threshold=kwargs.get("slow_query_threshold"),
+            ),
         )
 
     def instrument_connection(
         self,
         connection: Union["MySQLConnection", "CMySQLConnection"],
         tracer_provider: Optional[trace.TracerProvider] = None,
+        sample_ratio: float = 1.0,
+        slow_query_threshold: Optional[float] = None,
     ) -> Union["MySQLConnection", "CMySQLConnection"]:
         """Enable instrumentation in a MySQL connection.
 
@@ -466,6 +607,11 @@ class MySQLInstrumentor:
             connection: uninstrumented connection instance.
             trace_module: reference to the 'trace' module from opentelemetry.
             tracer_provider (optional): TracerProvider instance.
+            sample_ratio (optional): Ratio of statements traced, from 0 to 1
+                (default), see `TraceSampler`. The connection span is sampled
+                with the same ratio.
+            slow_query_threshold (optional): Statements taking at least this
+                many seconds are traced even if they were not sampled.
 
         Returns:
             connection: instrumented connection instace.
@@ -488,14 +634,19 @@ class MySQLInstrumentor:
             instrumenting_library_version=VERSION_TEXT,
             tracer_provider=tracer_provider,
         )
-        connection._span = tracer.start_span(
-            name=CONNECTION_SPAN_NAME, kind=trace.SpanKind.CLIENT
-        )
+        sampler = TraceSampler(sample_ratio, slow_query_threshold)
         connection._tracer = tracer
+        if not sampler.should_sample():
+            connection._span = trace.INVALID_SPAN
+        else:
+            connection._span = tracer.start_span(
+                name=CONNECTION_SPAN_NAME, kind=trace.SpanKind.CLIENT
+            )
+            set_connection_span_attrs(connection, connection._span)
 
-        set_connection_span_attrs(connection, connection._span)
-
-        return TracedMySQLConnection(wrapped=connection)  # type: ignore[return-value]
+        return TracedMySQLConnection(  # type: ignore[return-value]
+            wrapped=connection, sampler=sampler
+        )
 
     def uninstrument(self, **kwargs: Any) -> None:
         """Uninstrument the library."""
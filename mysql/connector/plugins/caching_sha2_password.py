@@ -31,27 +31,52 @@
 import struct
 
 from hashlib import sha256
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from ..errors import InterfaceError
 from ..logger import logger
 from . import MySQLAuthPlugin
 
+try:
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    HAVE_CRYPTOGRAPHY = True
+except ImportError:
+    HAVE_CRYPTOGRAPHY = False
+
 if TYPE_CHECKING:
     from ..network import MySQLSocket
 
 AUTHENTICATION_PLUGIN_CLASS = "MySQLCachingSHA2PasswordAuthPlugin"
 
+# RSA public keys (PEM) sent by the servers during full authentication,
+# indexed by server address, new connections to the same server reuse them
+# instead of asking for the key again
+SERVER_PUBLIC_KEYS: Dict[Any, bytes] = {}
+
 
 class MySQLCachingSHA2PasswordAuthPlugin(MySQLAuthPlugin):
     """Class implementing the MySQL caching_sha2_password authentication plugin
 
-    Note that encrypting using RSA is not supported since the Python
-    Standard Library does not provide this OpenSSL functionality.
+    When the server asks for a full authentication over an insecure channel,
+    the password is encrypted with the server's RSA public key. This requires
+    the `cryptography` package, without it the password is sent as clear text
+    like in previous versions.
+
+    .. versionchanged:: 8.2.0
+        The server's RSA public key is cached per server address, see
+        `SERVER_PUBLIC_KEYS`.
     """
 
+    request_public_key: int = 2
     perform_full_authentication: int = 4
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        self._nonce: bytes = b""
+
     def _scramble(self, auth_data: bytes) -> bytes:
         """Return a scramble of the password using a Nonce sent by the
         server.
@@ -62,6 +87,7 @@ class MySQLCachingSHA2PasswordAuthPlugin(MySQLAuthPlugin):
         if not auth_data:
             raise InterfaceError("Missing authentication data (seed)")
 
+        self._nonce = auth_data
         if not self._password:
             return b""
 
@@ -74,6 +100,62 @@ class MySQLCachingSHA2PasswordAuthPlugin(MySQLAuthPlugin):
         hash3 = struct.pack("32B", *xored)
         return hash3
 
+    def _encrypt_password(self, public_key: bytes) -> bytes:
+        """Encrypt the password using the server's RSA public key.
+
+        The password (null terminated) is XORed with the nonce sent by the
+        server before encrypting it with RSA OAEP padding.
+        """
+        password = self._password.encode() + b"\x00"
+        xored = bytes(
+            char ^ self._nonce[i % len(self._nonce)]
+            for i, char in enumerate(password)
+        )
+        key = serialization.load_pem_public_key(public_key)
+        return key.encrypt(  # type: ignore[union-attr]
+            xored,
+            padding.OAEP(
+                mgf=padding.MGF1(algorithm=hashes.SHA1()),
+                algorithm=hashes.SHA1(),
+                label=None,
+            ),
+        )
+
+    def _full_authentication(self, sock: "MySQLSocket", **kwargs: Any) -> bytes:
+        """Send the password to the server when the fast authentication failed.
+
+        Over an insecure channel the password is encrypted with the server's
+        RSA public key, which is requested to the server unless it is already
+        cached for the server address given in `server_address`.
+
+        Returns:
+            packet: Server's response.
+        """
+        if self.ssl_enabled or not self._nonce or not HAVE_CRYPTOGRAPHY:
+            logger.debug("# sending password as clear text")
+            sock.send(self._password.encode() + b"\x00")
+            return bytes(sock.recv())
+
+        address = kwargs.get("server_address")
+        public_key = SERVER_PUBLIC_KEYS.get(address) if address else None
+        if public_key is None:
+            logger.debug("# requesting server's RSA public key")
+            sock.send(bytes([self.request_public_key]))
+            pkt = bytes(sock.recv())
+            if pkt[4] != 1:
+                return pkt
+            public_key = pkt[5:]
+        sock.send(self._encrypt_password(public_key))
+
+        pkt = bytes(sock.recv())
+        if address:
+            if pkt[4] == 255:
+                # the server might have been restarted with new keys
+                SERVER_PUBLIC_KEYS.pop(address, None)
+            else:
+                SERVER_PUBLIC_KEYS[address] = public_key
+        return pkt
+
     @property
     def name(self) -> str:
         """Plugin official name."""
@@ -123,6 +205,9 @@ class MySQLCachingSHA2PasswordAuthPlugin(MySQLAuthPlugin):
             packet: Last server's response after back-and-forth
                 communication.
         """
+        if auth_data and auth_data[0] == self.perform_full_authentication:
+            return self._full_authentication(sock, **kwargs)
+
         response = self.auth_response(auth_data, **kwargs)
         if response:
             sock.send(response)
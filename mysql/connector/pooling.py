@@ -34,9 +34,10 @@ import random
 import re
 import threading
 
+from time import perf_counter
 from types import TracebackType
 from typing import Any, Dict, NoReturn, Optional, Tuple, Type, Union
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 try:
     import dns.exception
@@ -52,7 +53,7 @@ except ImportError:
     CMySQLConnection = None  # type: ignore[misc]
 
 from .connection import MySQLConnection
-from .constants import CNX_POOL_ARGS, DEFAULT_CONFIGURATION
+from .constants import CNX_POOL_ARGS, CNX_POOL_SESSION_ARGS, DEFAULT_CONFIGURATION
 from .errors import (
     Error,
     InterfaceError,
@@ -60,7 +61,9 @@ from .errors import (
     PoolError,
     ProgrammingError,
 )
+from .metrics import ConnectionMetrics, PoolMetrics
 from .optionfiles import read_option_files
+from .query_cache import QueryResultCache
 
 CONNECTION_POOL_LOCK = threading.RLock()
 CNX_POOL_MAXSIZE = 32
@@ -418,6 +421,8 @@ class MySQLConnectionPool:
         self._set_pool_size(pool_size)
         self._set_pool_name(pool_name or generate_pool_name(**kwargs))
         self._cnx_config: Dict[str, Any] = {}
+        self._cnx_configs: Dict[UUID, Dict[str, Any]] = {}
+        self._metrics: Optional[PoolMetrics] = None
         self._cnx_queue: queue.Queue[
             Union[MySQLConnection, CMySQLConnection]
         ] = queue.Queue(self._pool_size)
@@ -445,6 +450,17 @@ class MySQLConnectionPool:
         """Return whether to reset session"""
         return self._reset_session
 
+    @property
+    def metrics(self) -> Optional[Dict[str, Any]]:
+        """Snapshot of the pool metrics, None when metrics are disabled
+
+        Metrics are enabled with the `metrics` connection option, see
+        `metrics.PoolMetrics`. Each connection keeps its own metrics.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
     def set_config(self, **kwargs: Any) -> None:
         """Set the connection configuration for MySQLConnection instances
 
@@ -457,12 +473,35 @@ class MySQLConnectionPool:
         if not kwargs:
             return
 
+        if kwargs.get("result_cache") is True:
+            # all pooled connections share the same cache
+            kwargs["result_cache"] = QueryResultCache()
+        if isinstance(kwargs.get("metrics"), ConnectionMetrics):
+            # metrics are updated without locking, each pooled connection
+            # needs its own
+            raise PoolError(
+                "Connection configuration not valid: metrics must be a boolean "
+                "for pooled connections"
+            )
+
         with CONNECTION_POOL_LOCK:
             try:
                 test_cnx = connect()
                 test_cnx.config(**kwargs)
                 self._cnx_config = kwargs
                 self._config_version = uuid4()
+                # keep the configurations still used by queued connections
+                versions = {cnx.pool_config_version for cnx in self._cnx_queue.queue}
+                self._cnx_configs = {
+                    version: config
+                    for version, config in self._cnx_configs.items()
+                    if version in versions
+                }
+                self._cnx_configs[self._config_version] = kwargs
+                if not kwargs.get("metrics"):
+                    self._metrics = None
+                elif self._metrics is None:
+                    self._metrics = PoolMetrics()
             except AttributeError as err:
                 raise PoolError(f"Connection configuration not valid: {err}") from err
 
@@ -567,32 +606,82 @@ class MySQLConnectionPool:
         MySQL connection.
 
         When the MySQL connection is not connect, a reconnect is attempted.
+        When the pool configuration changed since the connection was made
+        and only session arguments (see `constants.CNX_POOL_SESSION_ARGS`)
+        differ, the session is reset instead of reconnecting.
 
         Raises PoolError on errors.
 
         Returns a PooledMySQLConnection instance.
         """
+        start = perf_counter()
         with CONNECTION_POOL_LOCK:
             try:
                 cnx = self._cnx_queue.get(block=False)
             except queue.Empty as err:
+                if self._metrics is not None:
+                    self._metrics.pool_exhausted += 1
                 raise PoolError("Failed getting connection; pool exhausted") from err
 
-            if (
-                not cnx.is_connected()
-                or self._config_version != cnx.pool_config_version
-            ):
+            connected = cnx.is_connected()
+            if not connected or self._config_version != cnx.pool_config_version:
+                config = self._cnx_configs.get(cnx.pool_config_version)
                 cnx.config(**self._cnx_config)
                 try:
-                    cnx.reconnect()
-                except InterfaceError:
+                    reset = (
+                        connected
+                        and config is not None
+                        and self._reset_with_config(cnx, config)
+                    )
+                except Error:
+                    # Session left half reset, start a new one instead
+                    reset = False
+                try:
+                    if not reset:
+                        cnx.reconnect()
+                except Error:
                     # Failed to reconnect, give connection back to pool
                     self._queue_connection(cnx)
                     raise
                 cnx.pool_config_version = self._config_version
 
+            if self._metrics is not None:
+                self._metrics.connections_given += 1
+                self._metrics.wait_latency.observe(perf_counter() - start)
             return PooledMySQLConnection(self, cnx)
 
+    def _reset_with_config(
+        self, cnx: Union[MySQLConnection, CMySQLConnection], config: Dict[str, Any]
+    ) -> bool:
+        """Apply the pool configuration to a connection by resetting its session
+
+        The connection was already configured with the current pool
+        configuration, `config` is the one it was connected with. Returns
+        False when the connection needs to reconnect, that is when any of
+        the changed arguments is not a session argument, the database is no
+        longer set or the server doesn't support COM_RESET_CONNECTION.
+
+        Returns bool.
+        """
+        changed = {
+            key
+            for key in config.keys() | self._cnx_config.keys()
+            if config.get(key) != self._cnx_config.get(key)
+        }
+        if not changed.issubset(CNX_POOL_SESSION_ARGS):
+            return False
+        database = self._cnx_config.get("database", self._cnx_config.get("db"))
+        old_database = config.get("database", config.get("db"))
+        if old_database and not database:
+            # COM_RESET_CONNECTION keeps the current schema, a new
+            # connection has none
+            return False
+        if not cnx.cmd_reset_connection():
+            return False
+        if database and database != old_database:
+            cnx.cmd_init_db(database)
+        return True
+
     def _remove_connections(self) -> int:
         """Close all connections
 
@@ -34,10 +34,21 @@ import datetime
 import struct
 
 from decimal import Decimal, DecimalException
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from . import utils
 from .constants import (
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
     PARAMETER_COUNT_AVAILABLE,
     ClientFlag,
     FieldFlag,
@@ -285,6 +296,7 @@ class MySQLProtocol:
         is_change_user_request: bool = False,
         ssl_enabled: bool = False,
         plugin_config: Optional[Dict[str, Any]] = None,
+        zstd_compression_level: Optional[int] = None,
     ) -> Tuple[bytes, MySQLAuthPlugin]:
         """Make a MySQL Authentication packet.
 
@@ -305,6 +317,8 @@ class MySQLProtocol:
             plugin_config: Custom configuration to be passed to the auth plugin
                 when invoked. The parameters defined here will override the ones
                 defined in the auth plugin itself.
+            zstd_compression_level: Compression level sent to the server when
+                zstd compression is requested via `client_flags`.
 
         Returns:
             handshake_response: Handshake response as per [1].
@@ -386,6 +400,15 @@ class MySQLProtocol:
         if (client_flags & ClientFlag.CONNECT_ARGS) and conn_attrs is not None:
             response_payload += MySQLProtocol.make_conn_attrs(conn_attrs)
 
+        # zstd compression level
+        if client_flags & ClientFlag.ZSTD_COMPRESSION_ALGORITHM:
+            response_payload += struct.pack(
+                "<B",
+                DEFAULT_ZSTD_COMPRESSION_LEVEL
+                if zstd_compression_level is None
+                else zstd_compression_level,
+            )
+
         return bytes(response_payload), auth_strategy
 
     @staticmethod
@@ -610,29 +633,34 @@ class MySQLProtocol:
         # Keep unused 'version' for API backward compatibility
         _ = version
         rows = []
+        append_row = rows.append
+        recv = sock.recv
+        read_lc_string_list = utils.read_lc_string_list
         eof = None
         rowdata = None
         i = 0
         while True:
             if eof or i == count:
                 break
-            packet = sock.recv()
+            packet = recv()
             if packet.startswith(b"\xff\xff\xff"):
-                datas = [packet[4:]]
-                packet = sock.recv()
+                # Row split across several packets; glue the payloads together
+                # in a single buffer without copying each one first
+                data = bytearray(memoryview(packet)[4:])
+                packet = recv()
                 while packet.startswith(b"\xff\xff\xff"):
-                    datas.append(packet[4:])
-                    packet = sock.recv()
-                datas.append(packet[4:])
-                rowdata = utils.read_lc_string_list(bytearray(b"").join(datas))
+                    data += memoryview(packet)[4:]
+                    packet = recv()
+                data += memoryview(packet)[4:]
+                rowdata = read_lc_string_list(data)
             elif packet[4] == 254 and packet[0] < 7:
                 eof = self.parse_eof(packet)
                 rowdata = None
             else:
                 eof = None
-                rowdata = utils.read_lc_string_list(packet[4:])
+                rowdata = read_lc_string_list(packet, 4)
             if eof is None and rowdata is not None:
-                rows.append(rowdata)
+                append_row(rowdata)
             elif eof is None and rowdata is None:
                 raise get_exception(packet)
             i += 1
@@ -981,6 +1009,76 @@ class MySQLProtocol:
         packet: bytearray = utils.int4store(statement) + utils.int2store(param) + data
         return packet
 
+    def _prepare_stmt_execute_params(
+        self,
+        data: Sequence[SupportedMysqlBinaryProtocolTypes],
+        long_data_used: Dict[int, Tuple[bool]],
+        charset: str,
+        converter_str_fallback: bool,
+    ) -> Tuple[List[int], List[bytes], List[bytes]]:
+        """Pack the parameters of a Statement Execute packet
+
+        Returns the NULL bitmap, the type of each parameter and the packed
+        values of the parameters that are not NULL.
+        """
+        null_bitmap = [0] * ((len(data) + 7) // 8)
+        values = []
+        types = []
+        packed = b""
+        for pos, value in enumerate(data):
+            _flags = 0
+            if value is None:
+                null_bitmap[(pos // 8)] |= 1 << (pos % 8)
+                types.append(utils.int1store(FieldType.NULL) + utils.int1store(_flags))
+                continue
+            if pos in long_data_used:
+                if long_data_used[pos][0]:
+                    # We suppose binary data
+                    field_type = FieldType.BLOB
+                else:
+                    # We suppose text data
+                    field_type = FieldType.STRING
+            elif isinstance(value, int):
+                (
+                    packed,
+                    field_type,
+                    _flags,
+                ) = self.prepare_binary_integer(value)
+                values.append(packed)
+            elif isinstance(value, str):
+                value = value.encode(charset)
+                values.append(utils.lc_int(len(value)) + value)
+                field_type = FieldType.STRING
+            elif isinstance(value, bytes):
+                values.append(utils.lc_int(len(value)) + value)
+                field_type = FieldType.STRING
+            elif isinstance(value, Decimal):
+                values.append(
+                    utils.lc_int(len(str(value).encode(charset)))
+                    + str(value).encode(charset)
+                )
+                field_type = FieldType.DECIMAL
+            elif isinstance(value, float):
+                values.append(struct.pack("<d", value))
+                field_type = FieldType.DOUBLE
+            elif isinstance(value, (datetime.datetime, datetime.date)):
+                (packed, field_type) = self.prepare_binary_timestamp(value)
+                values.append(packed)
+            elif isinstance(value, (datetime.timedelta, datetime.time)):
+                (packed, field_type) = self.prepare_binary_time(value)
+                values.append(packed)
+            elif converter_str_fallback:
+                value = str(value).encode(charset)
+                values.append(utils.lc_int(len(value)) + value)
+                field_type = FieldType.STRING
+            else:
+                raise ProgrammingError(
+                    "MySQL binary protocol can not handle "
+                    f"'{value.__class__.__name__}' objects"
+                )
+            types.append(utils.int1store(field_type) + utils.int1store(_flags))
+        return null_bitmap, types, values
+
     def make_stmt_execute(
         self,
         statement_id: int,
@@ -995,9 +1093,8 @@ class MySQLProtocol:
         """Make a MySQL packet with the Statement Execute command"""
         iteration_count = 1
         null_bitmap = [0] * ((len(data) + 7) // 8)
-        values = []
-        types = []
-        packed = b""
+        values: List[bytes] = []
+        types: List[bytes] = []
         data_len = len(data)
         query_attr_names = []
         flags = flags if not query_attrs else flags + PARAMETER_COUNT_AVAILABLE
@@ -1007,72 +1104,19 @@ class MySQLProtocol:
             long_data_used = {}
         if query_attrs:
             data = list(data)
-            for _, attr_val in query_attrs:
+            for attr_name, attr_val in query_attrs:
                 data.append(attr_val)
-            null_bitmap = [0] * ((len(data) + 7) // 8)
+                name = attr_name.encode(charset)
+                query_attr_names.append(utils.lc_int(len(name)) + name)
         if parameters or data:
             if data_len != len(parameters):
                 raise InterfaceError(
                     "Failed executing prepared statement: data values does not"
                     " match number of parameters"
                 )
-            for pos, value in enumerate(data):
-                _flags = 0
-                if value is None:
-                    null_bitmap[(pos // 8)] |= 1 << (pos % 8)
-                    types.append(
-                        utils.int1store(FieldType.NULL) + utils.int1store(_flags)
-                    )
-                    continue
-                if pos in long_data_used:
-                    if long_data_used[pos][0]:
-                        # We suppose binary data
-                        field_type = FieldType.BLOB
-                    else:
-                        # We suppose text data
-                        field_type = FieldType.STRING
-                elif isinstance(value, int):
-                    (
-                        packed,
-                        field_type,
-                        _flags,
-                    ) = self.prepare_binary_integer(value)
-                    values.append(packed)
-                elif isinstance(value, str):
-                    value = value.encode(charset)
-                    values.append(utils.lc_int(len(value)) + value)
-                    field_type = FieldType.STRING
-                elif isinstance(value, bytes):
-                    values.append(utils.lc_int(len(value)) + value)
-                    field_type = FieldType.STRING
-                elif isinstance(value, Decimal):
-                    values.append(
-                        utils.lc_int(len(str(value).encode(charset)))
-                        + str(value).encode(charset)
-                    )
-                    field_type = FieldType.DECIMAL
-                elif isinstance(value, float):
-                    values.append(struct.pack("<d", value))
-                    field_type = FieldType.DOUBLE
-                elif isinstance(value, (datetime.datetime, datetime.date)):
-                    (packed, field_type) = self.prepare_binary_timestamp(value)
-                    values.append(packed)
-                elif isinstance(value, (datetime.timedelta, datetime.time)):
-                    (packed, field_type) = self.prepare_binary_time(value)
-                    values.append(packed)
-                elif converter_str_fallback:
-                    value = str(value).encode(charset)
-                    values.append(utils.lc_int(len(value)) + value)
-                    field_type = FieldType.STRING
-                else:
-                    raise ProgrammingError(
-                        "MySQL binary protocol can not handle "
-                        f"'{value.__class__.__name__}' objects"
-                    )
-                types.append(utils.int1store(field_type) + utils.int1store(_flags))
-                if query_attrs and pos + 1 > data_len:
-                    name = query_attrs[pos - data_len][0].encode(charset)
-                    query_attr_names.append(utils.lc_int(len(name)) + name)
+            null_bitmap, types, values = self._prepare_stmt_execute_params(
+                data, long_data_used, charset, converter_str_fallback
+            )
         packet = (
             utils.int4store(statement_id)
             + utils.int1store(flags)
@@ -1111,3 +1155,66 @@ class MySQLProtocol:
                 packet += a_value
 
         return packet
+
+    def make_stmt_execute_many(
+        self,
+        statement_id: int,
+        seq_data: Iterable[Sequence[SupportedMysqlBinaryProtocolTypes]],
+        parameters: Sequence[Any] = (),
+        charset: str = "utf8",
+        query_attrs: Optional[List[Tuple[str, Any]]] = None,
+        converter_str_fallback: bool = False,
+    ) -> Generator[bytes, None, None]:
+        """Make the Statement Execute packets running a statement once for
+        each parameter set
+
+        The packet header is built once. The parameter types are only sent
+        when they differ from the ones of the previous packet, otherwise the
+        new-params-bound flag is cleared and the server reuses them.
+        """
+        flags = PARAMETER_COUNT_AVAILABLE if query_attrs else 0
+        if charset == "utf8mb4":
+            charset = "utf8"
+        header = (
+            utils.int4store(statement_id) + utils.int1store(flags) + utils.int4store(1)
+        )
+        attr_values = []
+        attr_names = []
+        for attr_name, attr_val in query_attrs or ():
+            attr_values.append(attr_val)
+            name = attr_name.encode(charset)
+            attr_names.append(utils.lc_int(len(name)) + name)
+        bound_types = None
+        for data in seq_data:
+            if len(data) != len(parameters):
+                raise InterfaceError(
+                    "Failed executing prepared statement: data values does not"
+                    " match number of parameters"
+                )
+            if attr_values:
+                data = list(data) + attr_values
+            if not data:
+                yield header
+                continue
+            null_bitmap, types, values = self._prepare_stmt_execute_params(
+                data, {}, charset, converter_str_fallback
+            )
+            parts = [header]
+            # if CLIENT_QUERY_ATTRIBUTES is on
+            if query_attrs is not None:
+                parts.append(utils.lc_int(len(data)))
+            parts.append(bytes(null_bitmap))
+            if types == bound_types:
+                parts.append(b"\x00")
+            else:
+                parts.append(b"\x01")
+                if query_attrs is not None:
+                    names = [b"\x00"] * len(parameters) + attr_names
+                    for a_type, name in zip(types, names):
+                        parts.append(a_type)
+                        parts.append(name)
+                else:
+                    parts.extend(types)
+                bound_types = types
+            parts.extend(values)
+            yield b"".join(parts)
@@ -0,0 +1,354 @@
+"""Client-side cache of query results."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+
+from collections import OrderedDict
+from typing import (
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .types import DescriptionType, RowType
+
+DEFAULT_MAX_BYTES: int = 16 * 1024 * 1024
+DEFAULT_TTL: Optional[float] = 5.0
+
+# Table name standing for "every table", used when the tables written by a
+# statement can't be told from its text
+ALL_TABLES: str = "*"
+
+STMT_READ: str = "read"
+STMT_WRITE: str = "write"
+STMT_USE: str = "use"
+STMT_OTHER: str = "other"
+
+_TABLE_NAME = rb"(?:`[^`]+`|[\w$]+)(?:\s*\.\s*(?:`[^`]+`|[\w$]+))?"
+RE_SQL_LEADING_COMMENT = re.compile(rb"^\s*(?:/\*.*?\*/\s*)*", re.S)
+RE_SQL_FIRST_WORD = re.compile(rb"[A-Za-z]+")
+RE_SQL_FROM_CLAUSE = re.compile(
+    rb"\bFROM\s+(.+?)(?=\b(?:WHERE|GROUP|HAVING|ORDER|LIMIT|JOIN|INNER|CROSS|"
+    rb"STRAIGHT_JOIN|LEFT|RIGHT|NATURAL|UNION|WINDOW|FOR|LOCK|INTO|ON|USING)\b"
+    rb"|[();]|$)",
+    re.I | re.S,
+)
+RE_SQL_JOIN_TABLE = re.compile(
+    rb"\b(?:JOIN|STRAIGHT_JOIN)\s+(" + _TABLE_NAME + rb")", re.I
+)
+RE_SQL_TABLE_NAME = re.compile(rb"\s*(" + _TABLE_NAME + rb")")
+RE_SQL_NOT_CACHEABLE = re.compile(
+    rb"\b(?:FOR\s+UPDATE|FOR\s+SHARE|LOCK\s+IN\s+SHARE\s+MODE|INTO|SQL_NO_CACHE|"
+    rb"NOW|SYSDATE|CURDATE|CURTIME|CURRENT_DATE|CURRENT_TIME|CURRENT_TIMESTAMP|"
+    rb"LOCALTIME|LOCALTIMESTAMP|UNIX_TIMESTAMP|UTC_DATE|UTC_TIME|UTC_TIMESTAMP|"
+    rb"RAND|UUID|UUID_SHORT|CONNECTION_ID|LAST_INSERT_ID|FOUND_ROWS|ROW_COUNT|"
+    rb"USER|CURRENT_USER|SESSION_USER|SYSTEM_USER|DATABASE|SCHEMA|SLEEP|"
+    rb"GET_LOCK|RELEASE_LOCK|IS_FREE_LOCK|IS_USED_LOCK|NEXTVAL|LASTVAL)\b|@"
+    # Subqueries and derived tables hide their tables from RE_SQL_FROM_CLAUSE
+    rb"|\(\s*(?:SELECT|WITH|TABLE|VALUES)\b",
+    re.I,
+)
+RE_SQL_INSERT_TABLE = re.compile(
+    rb"^(?:INSERT|REPLACE)\s+(?:(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY|IGNORE)\s+)*"
+    rb"(?:INTO\s+)?(" + _TABLE_NAME + rb")",
+    re.I,
+)
+RE_SQL_UPDATE_TABLE = re.compile(
+    rb"^UPDATE\s+(?:(?:LOW_PRIORITY|IGNORE)\s+)*(" + _TABLE_NAME + rb")"
+    rb"(?:\s+(?:AS\s+)?[\w$]+)?\s+SET\b",
+    re.I,
+)
+RE_SQL_DELETE_TABLE = re.compile(
+    rb"^DELETE\s+(?:(?:LOW_PRIORITY|QUICK|IGNORE)\s+)*FROM\s+(" + _TABLE_NAME + rb")"
+    rb"(?:\s+(?:AS\s+)?[\w$]+)?\s*(?:$|;|\b(?:WHERE|ORDER|LIMIT|PARTITION)\b)",
+    re.I,
+)
+RE_SQL_TRUNCATE_TABLE = re.compile(
+    rb"^TRUNCATE\s+(?:TABLE\s+)?(" + _TABLE_NAME + rb")\s*;?\s*$", re.I
+)
+RE_SQL_USE_SCHEMA = re.compile(rb"^USE\s+(`[^`]+`|[\w$]+)\s*;?\s*$", re.I)
+
+# Statements which neither read cacheable data nor change table contents
+NEUTRAL_STATEMENTS: FrozenSet[bytes] = frozenset(
+    (
+        b"SET",
+        b"SHOW",
+        b"DESCRIBE",
+        b"DESC",
+        b"EXPLAIN",
+        b"BEGIN",
+        b"START",
+        b"COMMIT",
+        b"ROLLBACK",
+        b"SAVEPOINT",
+        b"RELEASE",
+        b"HELP",
+        b"DO",
+    )
+)
+
+
+def _table_name(name: bytes, schema: Optional[str]) -> str:
+    """Normalize a table name into a lowercase `schema.table` string."""
+    parts = [
+        part.strip().strip(b"`").decode("utf-8", "replace").lower()
+        for part in name.split(b".")
+    ]
+    if len(parts) == 1:
+        parts.insert(0, (schema or "").lower())
+    return ".".join(parts)
+
+
+def _read_tables(statement: bytes, schema: Optional[str]) -> FrozenSet[str]:
+    """Get the tables referenced in FROM and JOIN clauses of `statement`."""
+    tables: Set[str] = set()
+    for clause in RE_SQL_FROM_CLAUSE.findall(statement):
+        for item in clause.split(b","):
+            match = RE_SQL_TABLE_NAME.match(item)
+            if match:
+                tables.add(_table_name(match.group(1), schema))
+    for name in RE_SQL_JOIN_TABLE.findall(statement):
+        tables.add(_table_name(name, schema))
+    return frozenset(tables)
+
+
+def parse_statement(
+    statement: bytes, schema: Optional[str] = None
+) -> Tuple[str, FrozenSet[str]]:
+    """Tell what a statement does to the cached data.
+
+    Args:
+        statement: SQL statement, parameters already substituted.
+        schema: Default schema unqualified table names belong to.
+
+    Returns:
+        tuple: The kind of statement (one of the `STMT_*` values) and the
+               tables involved. For `STMT_READ` these are the tables read, and
+               an empty set means the result must not be cached. For
+               `STMT_WRITE` they are the tables changed, `ALL_TABLES` when
+               unknown. For `STMT_USE` it holds the new default schema.
+    """
+    stmt = statement[RE_SQL_LEADING_COMMENT.match(statement).end() :]
+    match = RE_SQL_FIRST_WORD.match(stmt)
+    keyword = match.group(0).upper() if match else b""
+
+    if stmt.startswith(b"("):
+        # Parenthesized query expression, e.g. "(SELECT ...) UNION (SELECT ...)"
+        return STMT_READ, frozenset()
+    if keyword in (b"SELECT", b"WITH", b"TABLE"):
+        if RE_SQL_NOT_CACHEABLE.search(stmt):
+            return STMT_READ, frozenset()
+        return STMT_READ, _read_tables(stmt, schema)
+    if keyword == b"USE":
+        match = RE_SQL_USE_SCHEMA.match(stmt)
+        if match:
+            return STMT_USE, frozenset(
+                (match.group(1).strip(b"`").decode("utf-8", "replace"),)
+            )
+        return STMT_OTHER, frozenset()
+    if keyword in NEUTRAL_STATEMENTS:
+        return STMT_OTHER, frozenset()
+
+    for regex in (
+        RE_SQL_INSERT_TABLE,
+        RE_SQL_UPDATE_TABLE,
+        RE_SQL_DELETE_TABLE,
+        RE_SQL_TRUNCATE_TABLE,
+    ):
+        match = regex.match(stmt)
+        if match:
+            return STMT_WRITE, frozenset((_table_name(match.group(1), schema),))
+    # DDL, multi-table DML, CALL, LOAD DATA, ... might change anything
+    return STMT_WRITE, frozenset((ALL_TABLES,))
+
+
+def normalize_statement(statement: bytes) -> bytes:
+    """Normalize the text of a statement used in a cache key.
+
+    Only the surrounding whitespace and trailing semicolons are removed. MySQL
+    names result columns after the text of the selected expressions, so
+    statements differing in inner whitespace or keyword case can return
+    different column names and are cached separately.
+    """
+    return statement.strip().rstrip(b";").rstrip()
+
+
+class CachedResult(NamedTuple):
+    """Result set stored in a `QueryResultCache`."""
+
+    columns: List[DescriptionType]
+    rows: List[RowType]
+    tables: FrozenSet[str]
+    size: int
+    expires: Optional[float]
+
+
+class QueryResultCache:
+    """LRU cache of query results bounded by their estimated size in bytes.
+
+    Results are keyed by the connection they were read through (server,
+    user and default schema) and the statement text with the parameters
+    already substituted. Each result remembers the tables it was read from,
+    writes to any of them executed through a connection using this cache
+    drop it. Changes made by other clients are not seen, `ttl` bounds how
+    long a result can be served.
+
+    The same instance can be shared by several connections, e.g. the
+    connections of a pool, it is thread-safe.
+
+    Args:
+        max_bytes: Maximum estimated size of all cached results.
+        ttl: Seconds a result stays valid, `None` to keep it until evicted
+             or invalidated.
+    """
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, ttl: Optional[float] = DEFAULT_TTL
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number or None")
+        self._max_bytes: int = max_bytes
+        self._ttl: Optional[float] = ttl
+        self._lock: threading.RLock = threading.RLock()
+        self._entries: "OrderedDict[Hashable, CachedResult]" = OrderedDict()
+        self._keys_by_table: Dict[str, Set[Hashable]] = {}
+        self._size: int = 0
+        self._generation: int = 0
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def generation(self) -> int:
+        """Counter increased on every invalidation.
+
+        Read it before running a query and pass it to `put()`, so a result
+        racing with a write to its tables is not stored.
+        """
+        return self._generation
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the current size of the cache."""
+        with self._lock:
+            stats = self._stats.copy()
+            stats["entries"] = len(self._entries)
+            stats["size"] = self._size
+        return stats
+
+    @staticmethod
+    def _estimate_size(columns: List[DescriptionType], rows: List[RowType]) -> int:
+        """Estimate the memory used by a result set."""
+        size = 64 + 128 * len(columns)
+        for row in rows:
+            size += 56 + 8 * len(row)
+            for value in row:
+                if value is not None:
+                    size += 57 + len(value)  # type: ignore[arg-type]
+        return size
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry, the lock must be held."""
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        for table in entry.tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+    def get(self, key: Hashable) -> Optional[CachedResult]:
+        """Get a cached result, `None` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.expires is None or entry.expires > time.monotonic()
+            ):
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+            if entry is not None:
+                self._remove(key)
+            self._stats["misses"] += 1
+            return None
+
+    def put(
+        self,
+        key: Hashable,
+        columns: List[DescriptionType],
+        rows: List[RowType],
+        tables: Iterable[str],
+        generation: Optional[int] = None,
+    ) -> bool:
+        """Store a result read from `tables`.
+
+        The result is not stored if it doesn't fit in the cache, or when an
+        invalidation happened since `generation` was read.
+
+        Returns True if the result was stored.
+        """
+        size = self._estimate_size(columns, rows)
+        if size > self._max_bytes:
+            return False
+        tables = frozenset(tables)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self._size + size > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+            expires = None if self._ttl is None else time.monotonic() + self._ttl
+            self._entries[key] = CachedResult(columns, rows, tables, size, expires)
+            self._size += size
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+        return True
+
+    def invalidate(self, tables: Optional[Iterable[str]] = None) -> None:
+        """Drop the results read from any of `tables`, all of them if `None`.
+
+        Table names are `schema.table` strings as returned by
+        `parse_statement()`, `ALL_TABLES` stands for every table.
+        """
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            if tables is None or ALL_TABLES in tables:
+                self._entries.clear()
+                self._keys_by_table.clear()
+                self._size = 0
+                return
+            for table in tables:
+                for key in list(self._keys_by_table.get(table, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_bytes={self._max_bytes}, "
+            f"ttl={self._ttl}, entries={len(self._entries)}, size={self._size})"
+        )
+
@@ -128,3 +128,4 @@ ParamsDictType = Dict[str, ToMysqlInputTypes]
 ParamsSequenceOrDictType = Union[ParamsDictType, ParamsSequenceType]
 RowType = Tuple[ToPythonOutputTypes, ...]
 WarningType = Tuple[str, int, str]
+ColumnsType = Dict[str, Sequence[ToPythonOutputTypes]]
@@ -245,42 +245,54 @@ def read_lc_string(buf: bytes) -> Tuple[bytes, Optional[bytes]]:
     return (buf[lsize + length + 1 :], buf[lsize + 1 : length + lsize + 1])
 
 
-def read_lc_string_list(buf: bytes) -> Optional[Tuple[Optional[bytes], ...]]:
+def read_lc_string_list(
+    buf: bytes, offset: int = 0
+) -> Optional[Tuple[Optional[bytes], ...]]:
     """Reads all length encoded strings from the given buffer
 
+    Decoding starts at `offset`, which lets callers parse a row straight
+    out of a packet without slicing off its header first. Lengths are
+    unpacked in place, so the only copies made are the values themselves.
+
     Returns a list of bytes
     """
     byteslst: List[Optional[bytes]] = []
-
-    sizes = {252: 2, 253: 3, 254: 8}
+    append = byteslst.append
+    unpack_from = struct.unpack_from
 
     buf_len = len(buf)
-    pos = 0
+    pos = offset
 
     while pos < buf_len:
         first = buf[pos]
-        if first == 255:
-            # Special case when MySQL error 1317 is returned by MySQL.
-            # We simply return None.
-            return None
-        if first == 251:
+        if first <= 250:
+            pos += 1
+            append(buf[pos : pos + first])
+            pos += first
+        elif first == 251:
             # NULL value
-            byteslst.append(None)
+            append(None)
             pos += 1
+        elif first == 252:
+            length = unpack_from("<H", buf, pos + 1)[0]
+            pos += 3
+            append(buf[pos : pos + length])
+            pos += length
+        elif first == 253:
+            # Read the marker along with the 3 length bytes and drop it
+            length = unpack_from("<I", buf, pos)[0] >> 8
+            pos += 4
+            append(buf[pos : pos + length])
+            pos += length
+        elif first == 254:
+            length = unpack_from("<Q", buf, pos + 1)[0]
+            pos += 9
+            append(buf[pos : pos + length])
+            pos += length
         else:
-            if first <= 250:
-                length = first
-                byteslst.append(buf[(pos + 1) : length + (pos + 1)])
-                pos += 1 + length
-            else:
-                lsize = 0
-                try:
-                    lsize = sizes[first]
-                except KeyError:
-                    return None
-                length = intread(buf[(pos + 1) : lsize + (pos + 1)])
-                byteslst.append(buf[pos + 1 + lsize : length + lsize + (pos + 1)])
-                pos += 1 + lsize + length
+            # Special case when MySQL error 1317 is returned by MySQL.
+            # We simply return None.
+            return None
 
     return tuple(byteslst)
 
@@ -64,8 +64,10 @@ import re
 import socket
 import sys
 import threading
+import time
 import uuid
 import warnings
+import weakref
 
 from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, Union
 
@@ -77,6 +79,7 @@ except ImportError:
 else:
     HAVE_DNSPYTHON = True
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
 from json.decoder import JSONDecodeError
@@ -107,7 +110,14 @@ from .errors import (
 from .helpers import escape, get_item_or_attr, iani_to_openssl_cs_name
 from .logger import logger
 from .protobuf import Protobuf
-from .protocol import HAVE_LZ4, HAVE_ZSTD, MessageReader, MessageWriter, Protocol
+from .protocol import (
+    HAVE_LZ4,
+    HAVE_ZSTD,
+    MessageReader,
+    MessageWriter,
+    Protocol,
+    select_compression_algorithm,
+)
 from .result import BaseResult, DocResult, Result, RowResult, SqlResult
 from .statement import (
     AddStatement,
@@ -146,6 +156,7 @@ CONNECTION_CLOSED_ERROR = {
 }
 
 _CONNECT_TIMEOUT = 10000  # Default connect timeout in milliseconds
+_PREPARE_THRESHOLD = 2  # Execution in which a statement gets prepared
 _DROP_DATABASE_QUERY = "DROP DATABASE IF EXISTS {}"
 _CREATE_DATABASE_QUERY = "CREATE DATABASE IF NOT EXISTS {}"
 _SELECT_SCHEMA_NAME_QUERY = (
@@ -158,6 +169,9 @@ _CNX_POOL_MAX_NAME_SIZE = 120
 _CNX_POOL_NAME_REGEX = re.compile(r"[^a-zA-Z0-9._:\-*$#]")
 _CNX_POOL_MAX_IDLE_TIME = 2147483
 _CNX_POOL_QUEUE_TIMEOUT = 2147483
+_CNX_POOL_PROBE_TIMEOUT = 2  # Seconds to wait on a router health probe
+_CNX_POOL_QUARANTINE_MIN = 1  # Seconds a router is quarantined on first failure
+_CNX_POOL_QUARANTINE_MAX = 60 * 5  # Upper bound of the quarantine backoff
 
 # Time is on seconds
 _PENALTY_SERVER_OFFLINE = 1000000
@@ -209,7 +223,10 @@ _SESS_OPTS = _SSL_OPTS + [
     "connection-attributes",
     "compression",
     "compression-algorithms",
+    "compression-threshold",
     "dns-srv",
+    "prepare-threshold",
+    "max-prepared-statements",
 ]
 
 
@@ -737,8 +754,24 @@ class Connection:
             self._connect_timeout = None
 
         self._stmt_counter: int = 0
-        self._prepared_stmt_ids: List[int] = []
+        # Prepared statements IDs, from least to most recently executed
+        self._prepared_stmt_ids: OrderedDict[
+            int, weakref.ReferenceType[StatementType]
+        ] = OrderedDict()
         self._prepared_stmt_supported: bool = True
+        self._prepare_threshold: int = settings.get(
+            "prepare-threshold", _PREPARE_THRESHOLD
+        )
+        self._max_prepared_stmts: Optional[int] = settings.get(
+            "max-prepared-statements"
+        )
+        self._prepared_stmt_stats: Dict[str, int] = {
+            "executions": 0,
+            "prepared_executions": 0,
+            "prepares": 0,
+            "deallocations": 0,
+            "evictions": 0,
+        }
         self._server_disconnected: bool = False
         self._server_disconnected_reason: Optional[Union[str, Tuple[str, int]]] = None
 
@@ -805,7 +838,12 @@ class Connection:
                     )
                 )
                 self._authenticate()
-                self.protocol.set_compression(algorithm)
+                if "compression-threshold" in self.settings:
+                    self.protocol.set_compression(
+                        algorithm, self.settings["compression-threshold"]
+                    )
+                else:
+                    self.protocol.set_compression(algorithm)
                 return
             except (OSError, RuntimeError) as err:
                 error = err
@@ -902,6 +940,10 @@ class Connection:
         2) lz4_message
         3) deflate_stream
 
+        If the list is ``auto``, the algorithms supported by both ends are
+        measured on a sample of documents and the one with the best trade-off
+        between compression ratio and CPU time is used.
+
         Args:
             caps (dict): Dictionary with the server capabilities.
             compression (str): The compression connection setting.
@@ -912,6 +954,8 @@ class Connection:
 
         .. versionadded:: 8.0.21
         .. versionchanged:: 8.0.22
+        .. versionchanged:: 8.2.0
+           Added the ``auto`` algorithm selection.
         """
         compression_data = caps.get("compression")
         if compression_data is None:
@@ -938,9 +982,18 @@ class Connection:
         server_algorithms = compression_dict.get("algorithm", [])
         algorithm = None
 
+        if algorithms and "auto" in algorithms:
+            client_algorithms = ["deflate_stream"]
+            if HAVE_LZ4:
+                client_algorithms.append("lz4_message")
+            if HAVE_ZSTD:
+                client_algorithms.append("zstd_stream")
+            algorithm = select_compression_algorithm(
+                [item for item in client_algorithms if item in server_algorithms]
+            )
         # Try to find an algorithm from the requested compression algorithms
         # list, which is supported by the server
-        if algorithms:
+        elif algorithms:
             # Resolve compression algorithms aliases and ignore unsupported
             client_algorithms = [
                 COMPRESSION_ALGORITHMS[item]
@@ -1047,9 +1100,27 @@ class Connection:
         """
         if statement.prepared:
             self.protocol.send_prepare_deallocate(statement.stmt_id)
-            self._prepared_stmt_ids.remove(statement.stmt_id)
+            self._prepared_stmt_ids.pop(statement.stmt_id, None)
+            self._prepared_stmt_stats["deallocations"] += 1
             statement.prepared = False
 
+    def _evict_prepared_statements(self, limit: int) -> None:
+        """Deallocates the least recently executed prepared statements.
+
+        Args:
+            limit (int): The number of prepared statements to keep.
+        """
+        while len(self._prepared_stmt_ids) > limit:
+            stmt_id, statement_ref = self._prepared_stmt_ids.popitem(last=False)
+            self.protocol.send_prepare_deallocate(stmt_id)
+            self._prepared_stmt_stats["deallocations"] += 1
+            self._prepared_stmt_stats["evictions"] += 1
+            statement = statement_ref()
+            if statement is not None:
+                # It has to become hot again to be prepared
+                statement.prepared = False
+                statement.reset_exec_counter()
+
     def _prepare_statement(
         self,
         msg_type: str,
@@ -1072,13 +1143,46 @@ class Connection:
         """
         try:
             self.fetch_active_result()
+            if self._max_prepared_stmts is not None:
+                self._evict_prepared_statements(self._max_prepared_stmts - 1)
             self.protocol.send_prepare_prepare(msg_type, msg, statement)
         except NotSupportedError:
             self._prepared_stmt_supported = False
             return
-        self._prepared_stmt_ids.append(statement.stmt_id)
+        self._prepared_stmt_ids[statement.stmt_id] = weakref.ref(statement)
+        self._prepared_stmt_stats["prepares"] += 1
         statement.prepared = True
 
+    def _prepare_and_execute(
+        self,
+        msg_type: str,
+        msg: MessageType,
+        statement: Union[
+            FindStatement,
+            DeleteStatement,
+            ModifyStatement,
+            ReadStatement,
+            RemoveStatement,
+            UpdateStatement,
+        ],
+    ) -> None:
+        """Prepares a statement and executes it.
+
+        Falls back to the non prepared operation if the server doesn't
+        support prepared statements.
+
+        Args:
+            msg_type (str): Message ID string.
+            msg (mysqlx.protobuf.Message): MySQL X Protobuf Message.
+            statement (Statement): A `Statement` based type object.
+        """
+        self._prepare_statement(msg_type, msg, statement)
+        if not self._prepared_stmt_supported:
+            self.protocol.send_msg_without_ps(msg_type, msg, statement)
+            return
+        self.protocol.send_prepare_execute(msg_type, msg, statement)
+        self._prepared_stmt_stats["prepared_executions"] += 1
+
     def _execute_prepared_pipeline(
         self,
         msg_type: str,
@@ -1099,8 +1203,10 @@ class Connection:
             msg (mysqlx.protobuf.Message): MySQL X Protobuf Message.
             statement (Statement): A `Statement` based type object.
         """
-        # For old servers without prepared statement support
-        if not self._prepared_stmt_supported:
+        self._prepared_stmt_stats["executions"] += 1
+        # For old servers without prepared statement support, or when
+        # preparing statements is disabled
+        if not self._prepared_stmt_supported or self._max_prepared_stmts == 0:
             # Crud::<Operation>
             self.protocol.send_msg_without_ps(msg_type, msg, statement)
             return
@@ -1108,36 +1214,34 @@ class Connection:
         if statement.deallocate_prepare_execute:
             # Prepare::Deallocate + Prepare::Prepare + Prepare::Execute
             self._deallocate_statement(statement)
-            self._prepare_statement(msg_type, msg, statement)
+            self._prepare_and_execute(msg_type, msg, statement)
             if not self._prepared_stmt_supported:
-                self.protocol.send_msg_without_ps(msg_type, msg, statement)
                 return
-            self.protocol.send_prepare_execute(msg_type, msg, statement)
             statement.deallocate_prepare_execute = False
             statement.reset_exec_counter()
-        elif statement.prepared and not statement.changed:
-            # Prepare::Execute
-            self.protocol.send_prepare_execute(msg_type, msg, statement)
-        elif statement.changed and not statement.repeated:
-            # Crud::<Operation>
+        elif statement.changed:
+            # Prepare::Deallocate + Crud::<Operation>
             self._deallocate_statement(statement)
-            self.protocol.send_msg_without_ps(msg_type, msg, statement)
             statement.changed = False
             statement.reset_exec_counter()
-        elif not statement.changed and not statement.repeated:
+            if self._prepare_threshold <= 1:
+                # Prepare::Prepare + Prepare::Execute
+                self._prepare_and_execute(msg_type, msg, statement)
+            else:
+                self.protocol.send_msg_without_ps(msg_type, msg, statement)
+        elif statement.prepared:
+            # Prepare::Execute
+            self._prepared_stmt_ids.move_to_end(statement.stmt_id)
+            self.protocol.send_prepare_execute(msg_type, msg, statement)
+            self._prepared_stmt_stats["prepared_executions"] += 1
+        elif statement.exec_counter + 1 >= self._prepare_threshold:
             # Prepare::Prepare + Prepare::Execute
-            if not statement.prepared:
-                self._prepare_statement(msg_type, msg, statement)
+            self._prepare_and_execute(msg_type, msg, statement)
             if not self._prepared_stmt_supported:
-                self.protocol.send_msg_without_ps(msg_type, msg, statement)
                 return
-            self.protocol.send_prepare_execute(msg_type, msg, statement)
-        elif statement.changed and statement.repeated:
-            # Prepare::Deallocate + Crud::<Operation>
-            self._deallocate_statement(statement)
+        else:
+            # Crud::<Operation>
             self.protocol.send_msg_without_ps(msg_type, msg, statement)
-            statement.changed = False
-            statement.reset_exec_counter()
 
         statement.increment_exec_counter()
 
@@ -1229,6 +1333,83 @@ class Connection:
         self._execute_prepared_pipeline(msg_type, msg, statement)
         return Result(self)
 
+    @catch_network_exception
+    def send_pipeline(
+        self,
+        statements: List[
+            Union[
+                AddStatement,
+                DeleteStatement,
+                InsertStatement,
+                ModifyStatement,
+                RemoveStatement,
+                UpdateStatement,
+            ]
+        ],
+    ) -> List[Result]:
+        """Send several statements without waiting for each one to finish.
+
+        The statements are sent together inside a ``no_error`` expectation
+        block and their results are read once all of them were sent, so the
+        whole batch costs a single round trip. When a statement fails, the server
+        skips all the statements that follow it in the block.
+
+        Args:
+            statements (list): A list of statements which don't return data,
+                               like :class:`mysqlx.AddStatement` or
+                               :class:`mysqlx.ModifyStatement`.
+
+        Returns:
+            list: A list of :class:`mysqlx.Result` objects, one per statement.
+
+        Raises:
+            :class:`mysqlx.OperationalError`: The error of the first statement
+                                              that failed.
+
+        .. versionadded:: 8.2.0
+        """
+        if self.protocol is None:
+            raise OperationalError("MySQLx Connection not available")
+        self.fetch_active_result()
+
+        with self.protocol.batch():
+            self.protocol.send_expect_open(no_error=True)
+            for statement in statements:
+                if isinstance(statement, (AddStatement, InsertStatement)):
+                    msg_type, msg = self.protocol.build_insert(statement)
+                    self.protocol.send_msg(msg_type, msg)
+                else:
+                    if isinstance(statement, (ModifyStatement, UpdateStatement)):
+                        msg_type, msg = self.protocol.build_update(statement)
+                    else:
+                        msg_type, msg = self.protocol.build_delete(statement)
+                    self.protocol.send_msg_without_ps(msg_type, msg, statement)
+            self.protocol.send_expect_close()
+
+        # Read all the responses, even after an error, to keep the
+        # connection in sync
+        error: Optional[Exception] = None
+        try:
+            self.protocol.read_ok()
+        except InterfaceError as err:
+            error = err
+        results = []
+        for statement in statements:
+            ids = statement.ids if isinstance(statement, AddStatement) else None
+            try:
+                results.append(Result(self, ids))
+            except OperationalError as err:
+                if error is None:
+                    error = err
+        try:
+            self.protocol.read_ok()
+        except InterfaceError as err:
+            if error is None:
+                error = err
+        if error is not None:
+            raise error
+        return results
+
     @catch_network_exception
     def execute_nonquery(
         self,
@@ -1388,6 +1569,7 @@ class Connection:
             if self._prepared_stmt_supported:
                 for stmt_id in self._prepared_stmt_ids:
                     self.protocol.send_prepare_deallocate(stmt_id)
+                self._forget_prepared_statements()
                 self._stmt_counter = 0
             # Send session close
             self.protocol.send_close()
@@ -1403,6 +1585,37 @@ class Connection:
             # close the connection locally.
             self.stream.close()
 
+    def _forget_prepared_statements(self) -> None:
+        """Marks all the prepared statements as not prepared."""
+        for statement_ref in self._prepared_stmt_ids.values():
+            statement = statement_ref()
+            if statement is not None:
+                statement.prepared = False
+                statement.reset_exec_counter()
+        self._prepared_stmt_ids.clear()
+
+    @property
+    def prepared_stmt_stats(self) -> Dict[str, Any]:
+        """dict: Prepared statements usage.
+
+        Contains the number of ``executions`` of statements which can be
+        prepared, how many of them used a prepared statement
+        (``prepared_executions``), the number of ``prepares``,
+        ``deallocations`` and ``evictions`` of the least recently used
+        prepared statements, the number of statements currently ``prepared``
+        and the ``hit_rate``.
+
+        .. versionadded:: 8.2.0
+        """
+        stats: Dict[str, Any] = dict(self._prepared_stmt_stats)
+        stats["prepared"] = len(self._prepared_stmt_ids)
+        stats["hit_rate"] = (
+            stats["prepared_executions"] / stats["executions"]
+            if stats["executions"]
+            else 0.0
+        )
+        return stats
+
     def reset_session(self) -> None:
         """Reset a sucessfully authenticated session."""
         if not self.is_open():
@@ -1411,6 +1624,8 @@ class Connection:
             self._active_result.fetch_all()
         try:
             self.keep_open = self.protocol.send_reset(self.keep_open)
+            # The server deallocated all the prepared statements
+            self._forget_prepared_statements()
         except (InterfaceError, OperationalError) as err:
             logger.warning(
                 "Warning: An error occurred while attempting to reset the "
@@ -1457,6 +1672,7 @@ class PooledConnection(Connection):
         self.pool: ConnectionPool = pool
         self.host: str = pool.cnx_config["host"]
         self.port: int = pool.cnx_config["port"]
+        self.checked_out: bool = False
 
     def close_connection(self) -> None:
         """Closes the connection.
@@ -1476,6 +1692,7 @@ class PooledConnection(Connection):
         state will be cleared by re-authenticating the user once the connection
         is get from the pool.
         """
+        self.pool.release(self)
         self.pool.add_connection(self)
 
     def reconnect(self) -> None:
@@ -1526,11 +1743,15 @@ class ConnectionPool(queue.Queue):
                                  infinite.
             priority (int): The router priority, to choose this pool over
                             other with lower priority.
+            weight (int): The router weight, to choose this pool over others
+                          with the same priority and outstanding requests.
 
     Raises:
         :class:`mysqlx.PoolError` on errors.
 
     .. versionadded:: 8.0.13
+    .. versionchanged:: 8.2.0
+       Track outstanding requests, queue-wait metrics and quarantine failures.
     """
 
     def __init__(self, name: str, **kwargs: Any) -> None:
@@ -1548,7 +1769,15 @@ class ConnectionPool(queue.Queue):
         self.settings: Dict[str, Any] = kwargs
         self.queue_timeout: int = kwargs.get("queue_timeout", 25)
         self.priority: int = kwargs.get("priority", 0)
+        self.weight: int = kwargs.get("weight", 0)
         self.cnx_config: Dict[str, Any] = kwargs
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._outstanding: int = 0
+        self._failures: int = 0
+        self._acquired: int = 0
+        self._acquire_timeouts: int = 0
+        self._queue_wait: float = 0.0
+        self._queue_wait_max: float = 0.0
         self.host: str = kwargs["host"]
         self.port: int = kwargs["port"]
 
@@ -1713,6 +1942,134 @@ class ConnectionPool(queue.Queue):
         """
         return (self._timeout, self._timeout_stamp)
 
+    @property
+    def outstanding(self) -> int:
+        """Returns the number of connections checked out from this pool.
+
+        .. versionadded:: 8.2.0
+        """
+        return self._outstanding
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Returns the routing and queue-wait metrics of this pool.
+
+        Returns:
+            dict: The number of ``outstanding`` connections, idle connections
+                  in the queue (``idle``), ``acquired`` connections, acquire
+                  ``timeouts``, total and maximum seconds spent waiting on the
+                  queue (``queue_wait`` and ``queue_wait_max``), consecutive
+                  ``failures`` and whether the pool is ``available``.
+
+        .. versionadded:: 8.2.0
+        """
+        with self._stats_lock:
+            return {
+                "outstanding": self._outstanding,
+                "idle": self.qsize(),
+                "acquired": self._acquired,
+                "timeouts": self._acquire_timeouts,
+                "queue_wait": self._queue_wait,
+                "queue_wait_max": self._queue_wait_max,
+                "failures": self._failures,
+                "available": self._available,
+            }
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Takes an idle connection from the queue, recording the time waited.
+
+        Args:
+            timeout (float): Seconds to wait for a connection, by default the
+                             pool ``queue_timeout``.
+
+        Returns:
+            PooledConnection: The connection object.
+
+        Raises:
+            :class:`queue.Empty`: If no connection is available in time.
+
+        .. versionadded:: 8.2.0
+        """
+        start = time.monotonic()
+        try:
+            cnx = self.get(
+                block=True,
+                timeout=self.queue_timeout if timeout is None else timeout,
+            )
+        except queue.Empty:
+            with self._stats_lock:
+                self._acquire_timeouts += 1
+            raise
+        finally:
+            waited = time.monotonic() - start
+            with self._stats_lock:
+                self._queue_wait += waited
+                self._queue_wait_max = max(self._queue_wait_max, waited)
+        return cnx
+
+    def checkout(self, cnx: PooledConnection) -> None:
+        """Registers a connection as handed out to a session.
+
+        .. versionadded:: 8.2.0
+        """
+        with self._stats_lock:
+            if not cnx.checked_out:
+                cnx.checked_out = True
+                self._outstanding += 1
+            self._acquired += 1
+            self._failures = 0
+
+    def release(self, cnx: PooledConnection) -> None:
+        """Registers a connection as returned by its session.
+
+        .. versionadded:: 8.2.0
+        """
+        with self._stats_lock:
+            if cnx.checked_out:
+                cnx.checked_out = False
+                self._outstanding -= 1
+
+    def quarantine(self) -> int:
+        """Sets this pool unavailable after a failed health probe.
+
+        Each consecutive failure doubles the time the pool stays unavailable,
+        up to ``_CNX_POOL_QUARANTINE_MAX`` seconds.
+
+        Returns:
+            int: The quarantine time in seconds.
+
+        .. versionadded:: 8.2.0
+        """
+        with self._stats_lock:
+            self._failures += 1
+            time_out = min(
+                _CNX_POOL_QUARANTINE_MIN << (self._failures - 1),
+                _CNX_POOL_QUARANTINE_MAX,
+            )
+        self.set_unavailable(time_out)
+        return time_out
+
+    def probe(self) -> bool:
+        """Checks if the router of this pool accepts connections.
+
+        The probe only opens a TCP connection, it does not authenticate.
+
+        Returns:
+            bool: True if the router is reachable, otherwise False.
+
+        .. versionadded:: 8.2.0
+        """
+        try:
+            with socket.create_connection(
+                (self.host, self.port), timeout=_CNX_POOL_PROBE_TIMEOUT
+            ):
+                pass
+        except OSError:
+            return False
+        with self._stats_lock:
+            self._failures = 0
+        return True
+
     def close(self) -> None:
         """Empty this ConnectionPool."""
         for cnx in self._connections_openned:
@@ -1729,13 +2086,80 @@ class PoolsManager:
 
     __instance: PoolsManager = None
     __pools: Dict[str, Any] = {}
+    __health_checks: Dict[str, threading.Event] = {}
 
     def __new__(cls) -> PoolsManager:
         if PoolsManager.__instance is None:
             PoolsManager.__instance = object.__new__(cls)
             PoolsManager.__pools = {}
+            PoolsManager.__health_checks = {}
         return PoolsManager.__instance
 
+    def _start_health_check(self, client_id: str, interval: float) -> None:
+        """Starts the background thread probing the routers of a client.
+
+        Routers failing the probe are quarantined with an exponential backoff,
+        so sessions skip them instead of discovering the failure on checkout.
+
+        Args:
+            client_id (str): The client id.
+            interval (float): Seconds between probes.
+
+        .. versionadded:: 8.2.0
+        """
+        if client_id in self.__health_checks:
+            return
+        stop = threading.Event()
+        self.__health_checks[client_id] = stop
+        thread = threading.Thread(
+            target=self._health_check,
+            args=(client_id, interval, stop),
+            name=f"mysqlx-pool-health-{client_id}",
+            daemon=True,
+        )
+        thread.start()
+
+    def _stop_health_check(self, client_id: str) -> None:
+        """Stops the background thread probing the routers of a client.
+
+        Args:
+            client_id (str): The client id.
+
+        .. versionadded:: 8.2.0
+        """
+        stop = self.__health_checks.pop(client_id, None)
+        if stop is not None:
+            stop.set()
+
+    def _health_check(
+        self, client_id: str, interval: float, stop: threading.Event
+    ) -> None:
+        """Probes the routers of a client until the client is closed.
+
+        Args:
+            client_id (str): The client id.
+            interval (float): Seconds between probes.
+            stop (threading.Event): Set when the client is closed.
+        """
+        while not stop.wait(interval):
+            for pool in list(self.__pools.get(client_id, [])):
+                if not pool.available():
+                    timeout, timeout_stamp = pool.get_timeout_stamp()
+                    if datetime.now() <= timeout_stamp + timedelta(seconds=timeout):
+                        continue
+                if pool.probe():
+                    pool.set_available()
+                else:
+                    # The pool may be flagged as available after its penalty
+                    # expired, flag it back to get the new quarantine time
+                    pool.set_available()
+                    time_out = pool.quarantine()
+                    logger.warning(
+                        "Router health probe failed pool: %s quarantine: %s",
+                        pool,
+                        time_out,
+                    )
+
     def _pool_exists(self, client_id: str, pool_name: str) -> bool:
         """Verifies if a pool exists with the given name.
 
@@ -1842,23 +2266,38 @@ class PoolsManager:
             pool = self.__pools.get(cnx_settings.get("client_id", "No id"), [])
             pool.append(ConnectionPool(router_name, **settings))
 
+        if cnx_settings.get("health_check_interval"):
+            self._start_health_check(
+                cnx_settings.get("client_id", "No id"),
+                cnx_settings["health_check_interval"],
+            )
+
     @staticmethod
-    def _get_random_pool(pool_list: List[ConnectionPool]) -> ConnectionPool:
-        """Get a random router from the group with the given priority.
+    def _get_least_outstanding_pool(
+        pool_list: List[ConnectionPool],
+    ) -> ConnectionPool:
+        """Get the router with fewer outstanding requests from the group with
+        the given priority.
+
+        Ties are broken by the router weight, then by random choice.
 
         Returns:
-            Router: a random router.
+            Router: the least loaded router.
 
-        .. versionadded:: 8.0.20
+        .. versionadded:: 8.2.0
         """
         if not pool_list:
             return None
         if len(pool_list) == 1:
             return pool_list[0]
 
-        last = len(pool_list) - 1
-        index = random.randint(0, last)
-        return pool_list[index]
+        best_key = min((pool.outstanding, -pool.weight) for pool in pool_list)
+        candidates = [
+            pool
+            for pool in pool_list
+            if (pool.outstanding, -pool.weight) == best_key
+        ]
+        return random.choice(candidates)
 
     @staticmethod
     def _get_sublist(
@@ -1887,7 +2326,7 @@ class PoolsManager:
         while not subpool and index < len(pools):
             subpool = self._get_sublist(pools, index, cur_priority)
             index += 1
-        return self._get_random_pool(subpool)
+        return self._get_least_outstanding_pool(subpool)
 
     @staticmethod
     def _get_next_priority(
@@ -1922,6 +2361,21 @@ class PoolsManager:
         to the pool that created it, and can be used as a normal Connection.
 
         When the MySQL connection is not connected, a reconnect is attempted.
+        Among the pools with the highest available priority, the one with
+        fewer outstanding connections is chosen.
+
+        Raises:
+            :class:`PoolError`: On errors.
+
+        Returns:
+            PooledConnection: A pooled connection object.
+        """
+        cnx = self._get_connection(settings)
+        cnx.pool.checkout(cnx)
+        return cnx
+
+    def _get_connection(self, settings: Dict[str, Any]) -> PooledConnection:
+        """Get a connection from the pool without tracking it as outstanding.
 
         Raises:
             :class:`PoolError`: On errors.
@@ -1959,7 +2413,7 @@ class PoolsManager:
                     # We have connections in pool, try to return a working one
                     with lock:
                         try:
-                            cnx = pool.get(block=True, timeout=pool.queue_timeout)
+                            cnx = pool.acquire()
                         except queue.Empty:
                             raise PoolError(
                                 "Failed getting connection; pool exhausted"
@@ -2030,7 +2484,7 @@ class PoolsManager:
                     # Pool is exaust so the client needs to wait
                     with lock:
                         try:
-                            cnx = pool.get(block=True, timeout=pool.queue_timeout)
+                            cnx = pool.acquire()
                             cnx.reset()
                             set_mysqlx_wait_timeout(cnx)
                             return cnx
@@ -2063,6 +2517,16 @@ class PoolsManager:
 
         raise PoolError("Unable to connect to any of the target hosts")
 
+    def get_pools_stats(self, settings: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Returns the metrics of the pools that shares the given settings.
+
+        Returns:
+            dict: The :attr:`ConnectionPool.stats` keyed by pool name.
+
+        .. versionadded:: 8.2.0
+        """
+        return {pool.name: pool.stats for pool in self._get_pools(settings)}
+
     def close_pool(self, cnx_settings: Dict[str, Any]) -> int:
         """Closes the connections in the pools
 
@@ -2070,6 +2534,7 @@ class PoolsManager:
             int: The number of closed pools
         """
         pools = self._get_pools(cnx_settings)
+        self._stop_health_check(cnx_settings.get("client_id", "No id"))
         for pool in pools:
             pool.close()
             # Remove the pool
@@ -2487,6 +2952,7 @@ class Client:
         self._set_max_idle_time(options_dict.get("max_idle_time", 0))
         self._set_queue_timeout(options_dict.get("queue_timeout", 0))
         self._set_pool_enabled(options_dict.get("enabled", True))
+        self._set_health_check_interval(options_dict.get("health_check_interval", 0))
 
         self.settings["pooling"] = self.pooling_enabled
         self.settings["max_size"] = self.max_size
@@ -2596,13 +3062,52 @@ class Client:
 
         self.queue_timeout = queue_timeout
         self.settings["queue_timeout"] = (
-            _CNX_POOL_QUEUE_TIMEOUT if queue_timeout == 0 else int(queue_timeout / 1000)
+            _CNX_POOL_QUEUE_TIMEOUT if queue_timeout == 0 else queue_timeout / 1000
         )
         # To avoid a connection stall waiting for the server, if the
         # connect-timeout is not given, use the queue_timeout
         if "connect-timeout" not in self.settings:
             self.settings["connect-timeout"] = self.queue_timeout
 
+    def _set_health_check_interval(self, health_check_interval: int) -> None:
+        """Set the interval of the router health probes.
+
+        Args:
+            health_check_interval (int): An integer equal or greater than 0
+                                         indicating the milliseconds between
+                                         probes. Zero disables the probes.
+
+        Raises:
+            :class:`AttributeError`: If the health_check_interval value is not
+                                     an integer greater or equal to 0.
+
+        .. versionadded:: 8.2.0
+        """
+        if (
+            isinstance(health_check_interval, bool)
+            or not isinstance(health_check_interval, int)
+            or not health_check_interval > -1
+        ):
+            raise AttributeError(
+                "Connection health_check_interval value must be an integer "
+                f"greater or equal to 0, the given value {health_check_interval} "
+                "is not valid"
+            )
+
+        self.health_check_interval = health_check_interval
+        self.settings["health_check_interval"] = health_check_interval / 1000
+
+    @property
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the routing and queue-wait metrics of each router pool.
+
+        Returns:
+            dict: The :attr:`ConnectionPool.stats` keyed by pool name.
+
+        .. versionadded:: 8.2.0
+        """
+        return PoolsManager().get_pools_stats(self.settings)
+
     def get_session(self) -> Session:
         """Creates a Session instance using the provided connection data.
 
@@ -2831,6 +3336,24 @@ def _validate_settings(settings: Dict[str, Any]) -> None:
     if "connection-attributes" in settings:
         _validate_connection_attributes(settings)
 
+    for option, minimum in (
+        ("prepare-threshold", 1),
+        ("max-prepared-statements", 0),
+        ("compression-threshold", 0),
+    ):
+        if option not in settings:
+            continue
+        try:
+            if isinstance(settings[option], str):
+                settings[option] = int(settings[option])
+            if not isinstance(settings[option], int) or settings[option] < minimum:
+                raise ValueError
+        except ValueError:
+            raise InterfaceError(
+                f"The value of '{option}' must be an integer greater than or "
+                f"equal to {minimum}"
+            ) from None
+
     if "connect-timeout" in settings:
         try:
             if isinstance(settings["connect-timeout"], str):
@@ -3297,6 +3820,9 @@ def get_client(
                         "queue_timeout": (int), # milliseconds a request will
                             # wait for a connection to become available.
                             # By default 0, means infinite.
+                        "health_check_interval": (int), # milliseconds
+                            # between background probes of the routers.
+                            # By default 0, means disabled.
                     }
                 }
 
@@ -3304,6 +3830,8 @@ def get_client(
         mysqlx.Client: Client object.
 
     .. versionadded:: 8.0.13
+    .. versionchanged:: 8.2.0
+       Added the ``health_check_interval`` pooling option.
     """
     if not isinstance(connection_string, (str, dict)):
         raise InterfaceError("connection_data must be a string or dict")
@@ -3341,6 +3869,9 @@ def get_client(
         pooling_options_dict["max_size"] = pooling_options.pop("max_size", 25)
         pooling_options_dict["max_idle_time"] = pooling_options.pop("max_idle_time", 0)
         pooling_options_dict["queue_timeout"] = pooling_options.pop("queue_timeout", 0)
+        pooling_options_dict["health_check_interval"] = pooling_options.pop(
+            "health_check_interval", 0
+        )
 
         # No other options besides pooling are supported
         if len(pooling_options) > 0:
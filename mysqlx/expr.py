@@ -28,11 +28,25 @@
 
 """Expression Parser."""
 
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+import copy
+import threading
+
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .dbdoc import DbDoc
 from .helpers import BYTE_TYPES, get_item_or_attr
-from .protobuf import Message, mysqlxpb_enum
+from .protobuf import Message, Protobuf, mysqlxpb_enum
 from .types import (
     BuildExprTypes,
     BuildScalarTypes,
@@ -429,13 +443,41 @@ def build_unary_op(name: str, param: MessageType) -> MessageType:
     return msg
 
 
+EXPR_CACHE_SIZE = 256
+"""Maximum number of parsed expressions kept by `ExprParser.parse_cached`."""
+
+
 def escape_literal(string: str) -> str:
     return string.replace('"', '""')
 
 
+def copy_expr_tree(tree: Any) -> Any:
+    """Returns a deep copy of a parsed expression tree.
+
+    Args:
+        tree (object): A :class:`mysqlx.protobuf.Message`, a protobuf message
+                       or a list of them, as returned by the parser rules.
+
+    Returns:
+        object: The copy of the tree.
+    """
+    if isinstance(tree, list):
+        return [copy_expr_tree(item) for item in tree]
+    if isinstance(tree, Message):
+        msg = Message()
+        msg.set_message(copy.deepcopy(tree.get_message()))
+        return msg
+    return copy.deepcopy(tree)
+
+
 class ExprParser:
     """Expression parser class."""
 
+    # Parsed trees by (expression, allow_relational, rule, use_pure)
+    _cache: OrderedDict = OrderedDict()
+    _cache_lock: threading.Lock = threading.Lock()
+    cache_size: int = EXPR_CACHE_SIZE
+
     def __init__(self, string: str, allow_relational: bool = True) -> None:
         self.string: str = string
         self.tokens: List[Token] = []
@@ -450,6 +492,50 @@ class ExprParser:
     def __str__(self) -> str:
         return f"<mysqlx.ExprParser '{self.string}'>"
 
+    @classmethod
+    def parse_cached(
+        cls, string: str, allow_relational: bool = True, rule: str = "expr"
+    ) -> Tuple[Any, Dict[str, int]]:
+        """Parses an expression, reusing the result of a previous parse.
+
+        The parsed trees are kept in a LRU cache of `ExprParser.cache_size`
+        entries. Callers get their own copy of the tree, so they can modify
+        it freely.
+
+        Args:
+            string (str): The expression.
+            allow_relational (bool): Allow relational columns.
+            rule (str): The parser rule, ``expr``, ``parse_order_spec``,
+                        ``parse_expr_list`` or ``parse_table_select_projection``.
+
+        Returns:
+            tuple: The parsed tree and the placeholder name to position map.
+
+        Raises:
+            ValueError: If the expression is not valid.
+        """
+        key = (string, allow_relational, rule, Protobuf.use_pure)
+        with cls._cache_lock:
+            entry = cls._cache.get(key)
+            if entry is not None:
+                cls._cache.move_to_end(key)
+        if entry is None:
+            parser = cls(string, allow_relational)
+            tree = getattr(parser, rule)()
+            entry = (tree, parser.placeholder_name_to_position)
+            with cls._cache_lock:
+                cls._cache[key] = entry
+                while len(cls._cache) > cls.cache_size:
+                    cls._cache.popitem(last=False)
+        tree, placeholders = entry
+        return copy_expr_tree(tree), dict(placeholders)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Removes all the parsed expressions from the cache."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
     def clean_expression(self) -> None:
         """Removes the keywords that does not form part of the expression.
 
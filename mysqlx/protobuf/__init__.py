@@ -34,7 +34,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from ..types import MessageType, ProtobufMessageCextType, ProtobufMessageType
 
@@ -602,6 +602,9 @@ class Message:
         """Creates a new server-side message, initialized with parsed data and
         returns a :class:`mysqlx.protobuf.Message` object.
 
+        With the pure Python implementation, the messages read for every row
+        of a result are decoded into a read-only :class:`ServerMessage`.
+
         Args:
             msg_type (int): Message type.
             payload (string): Serialized message data.
@@ -609,12 +612,192 @@ class Message:
         Returns:
             mysqlx.protobuf.Message: The Message representing a message
                                      containing parsed data.
+
+        .. versionchanged:: 8.2.0
+           Returns a :class:`ServerMessage` for the ``Mysqlx.Notice.Frame``,
+           ``Mysqlx.Resultset.ColumnMetaData``, ``Mysqlx.Resultset.Row`` and
+           ``Mysqlx.Sql.StmtExecuteOk`` messages when using pure Python.
         """
+        if Protobuf.use_pure:
+            decoder = ServerMessage.get_decoder(msg_type)
+            if decoder is not None:
+                server_msg = decoder(payload)
+                if server_msg is not None:
+                    return server_msg
         msg = cls()
         msg.set_message(Protobuf.mysqlxpb.parse_server_message(msg_type, payload))
         return msg
 
 
+def _decode_varint(payload: bytes, pos: int) -> Tuple[int, int]:
+    """Decodes a varint, returning its value and the position after it."""
+    value = 0
+    shift = 0
+    while True:
+        char = payload[pos]
+        pos += 1
+        value |= (char & 0x7F) << shift
+        if char < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ServerMessage:
+    """Read-only server message decoded straight from the wire.
+
+    Used with the pure Python implementation for the messages received for
+    every row, which only have scalar and bytes fields. Supports the same
+    read accesses as :class:`mysqlx.protobuf.Message`, without building a
+    protobuf message object.
+
+    Args:
+        msg_type_name (str): Protobuf type name.
+        fields (dict): The fields values by name.
+
+    .. versionadded:: 8.2.0
+    """
+
+    __slots__ = ("type", "_fields")
+
+    FAST_TYPES: Tuple[str, ...] = (
+        "Mysqlx.Notice.Frame",
+        "Mysqlx.Resultset.ColumnMetaData",
+        "Mysqlx.Resultset.Row",
+        "Mysqlx.Sql.StmtExecuteOk",
+    )
+    _decoders: Optional[Dict[int, Callable[[bytes], Optional["ServerMessage"]]]] = None
+
+    def __init__(self, msg_type_name: str, fields: Dict[str, Any]) -> None:
+        self.type: str = msg_type_name
+        self._fields: Dict[str, Any] = fields
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self) -> str:
+        return f"<ServerMessage {self.type} {self._fields}>"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Returns the value of a field of the message.
+
+        Args:
+            name (string): Field name.
+            default (object): The default value if the field does not exist.
+
+        Returns:
+            object: The value of the field.
+        """
+        return self._fields.get(name, default)
+
+    @staticmethod
+    def compile_decoder(
+        msg_type_name: str,
+    ) -> Callable[[bytes], Optional["ServerMessage"]]:
+        """Creates a decoder for a message type from its descriptor.
+
+        Args:
+            msg_type_name (str): Protobuf type name.
+
+        Returns:
+            callable: A function decoding a payload into a `ServerMessage`,
+                      or returning `None` if the payload has unknown fields.
+
+        Raises:
+            ValueError: If the message has fields which are not scalar
+                        integers, strings or bytes.
+        """
+        descriptor = _DESCRIPTOR_POOL.FindMessageTypeByName(msg_type_name)
+        tags: Dict[int, Tuple[str, bool, bool]] = {}
+        defaults: Dict[str, Any] = {}
+        repeated_names: List[str] = []
+        for field in descriptor.fields:
+            repeated = field.label == field.LABEL_REPEATED
+            if field.type in (
+                field.TYPE_BOOL,
+                field.TYPE_ENUM,
+                field.TYPE_UINT32,
+                field.TYPE_UINT64,
+            ):
+                tags[field.number << 3] = (field.name, repeated, False)
+            elif field.type in (field.TYPE_BYTES, field.TYPE_STRING):
+                is_string = field.type == field.TYPE_STRING
+                tags[(field.number << 3) | 2] = (field.name, repeated, is_string)
+            else:
+                raise ValueError(f"Unsupported field type in {msg_type_name}")
+            if repeated:
+                repeated_names.append(field.name)
+            else:
+                defaults[field.name] = field.default_value
+
+        def decode(payload: bytes) -> Optional[ServerMessage]:
+            fields = defaults.copy()
+            for name in repeated_names:
+                fields[name] = []
+            size = len(payload)
+            pos = 0
+            try:
+                while pos < size:
+                    tag = payload[pos]
+                    if tag < 0x80:
+                        pos += 1
+                    else:
+                        tag, pos = _decode_varint(payload, pos)
+                    if tag not in tags:
+                        return None
+                    name, repeated, is_string = tags[tag]
+                    if tag & 0x7:
+                        length = payload[pos]
+                        if length < 0x80:
+                            pos += 1
+                        else:
+                            length, pos = _decode_varint(payload, pos)
+                        value = payload[pos : pos + length]
+                        pos += length
+                        if is_string:
+                            value = value.decode("utf-8")
+                    else:
+                        value = payload[pos]
+                        if value < 0x80:
+                            pos += 1
+                        else:
+                            value, pos = _decode_varint(payload, pos)
+                    if repeated:
+                        fields[name].append(value)
+                    else:
+                        fields[name] = value
+            except IndexError as err:
+                raise ValueError(f"Unable to decode {msg_type_name}") from err
+            if pos != size:
+                raise ValueError(f"Truncated {msg_type_name} message")
+            return ServerMessage(msg_type_name, fields)
+
+        return decode
+
+    @classmethod
+    def get_decoder(
+        cls, msg_type: int
+    ) -> Optional[Callable[[bytes], Optional["ServerMessage"]]]:
+        """Returns the decoder of a server message type.
+
+        Args:
+            msg_type (int): Message type.
+
+        Returns:
+            callable: The decoder, or `None` if the message type has to be
+                      parsed by protobuf.
+        """
+        if cls._decoders is None:
+            cls._decoders = {
+                msg_type: cls.compile_decoder(msg_type_name)
+                for msg_type, msg_type_name in SERVER_MESSAGES.items()
+                if msg_type_name in cls.FAST_TYPES
+            }
+        return cls._decoders.get(msg_type)
+
+
 def mysqlxpb_enum(name: str) -> int:
     """Returns the value of a MySQL X Protobuf enumerator.
 
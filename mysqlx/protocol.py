@@ -28,11 +28,15 @@
 
 """Implementation of the X protocol for MySQL servers."""
 
+import json
+import random
 import struct
+import time
 import zlib
 
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     import lz4.frame
@@ -90,6 +94,122 @@ from .types import (
 )
 
 _COMPRESSION_THRESHOLD = 1000
+_COMPRESSION_PROBE_MESSAGES = 16  # Frames measured before locking in
+_COMPRESSION_MIN_SAVING = 0.1  # Keep compressing if it saves at least 10%
+_COMPRESSION_AUTO_BANDWIDTH = 12500000  # Bytes per second (100Mbit/s) assumed
+_BATCH_MAX_SIZE = 1048576  # Flush batched messages once they reach 1MiB
+
+_COMPRESSION_AUTO_SELECTED: Dict[Tuple[str, ...], str] = {}
+
+
+def _compression_sample() -> List[bytes]:
+    """Builds the payloads used to calibrate the compression algorithms.
+
+    Returns:
+        list: JSON documents resembling the rows of a collection.
+    """
+    rand = random.Random(0)
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf"]
+    payloads = []
+    for batch in range(16):
+        docs = [
+            {
+                "_id": f"{batch:04x}{num:024x}",
+                "name": " ".join(rand.choice(words) for _ in range(2)),
+                "age": rand.randint(0, 20),
+                "flag": rand.random() < 0.5,
+                "location": f"https://example.com/{rand.getrandbits(64):x}",
+                "tags": rand.sample(words, 3),
+            }
+            for num in range(rand.randint(4, 40))
+        ]
+        payloads.append(json.dumps(docs).encode("utf-8"))
+    return payloads
+
+
+def benchmark_compression(
+    payloads: List[bytes], algorithms: Optional[List[str]] = None
+) -> Dict[str, Dict[str, float]]:
+    """Measures the compression algorithms over a list of payloads.
+
+    Each payload is compressed as a frame of the same session, so the stream
+    algorithms keep their context between payloads as they do on the wire.
+
+    Args:
+        payloads (list): The payloads to compress.
+        algorithms (list): The algorithms to measure, by default all the
+                           algorithms available.
+
+    Returns:
+        dict: The ``ratio`` (compressed size / size), ``compress_time`` and
+              ``decompress_time`` in seconds, keyed by algorithm.
+
+    .. versionadded:: 8.2.0
+    """
+    if algorithms is None:
+        algorithms = ["deflate_stream"]
+        if HAVE_LZ4:
+            algorithms.append("lz4_message")
+        if HAVE_ZSTD:
+            algorithms.append("zstd_stream")
+    size = sum(len(payload) for payload in payloads) or 1
+    results = {}
+    for algorithm in algorithms:
+        compressor = Compressor(algorithm)
+        start = time.perf_counter()
+        frames = [compressor.compress(payload) for payload in payloads]
+        compress_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for frame in frames:
+            compressor.decompress(frame)
+        decompress_time = time.perf_counter() - start
+        results[algorithm] = {
+            "ratio": sum(len(frame) for frame in frames) / size,
+            "compress_time": compress_time,
+            "decompress_time": decompress_time,
+        }
+    return results
+
+
+def select_compression_algorithm(
+    algorithms: List[str], payloads: Optional[List[bytes]] = None
+) -> Optional[str]:
+    """Selects the compression algorithm with the best trade-off.
+
+    The algorithms are ranked by the estimated time to send the payloads:
+    the compressed size over a 100Mbit/s link plus the CPU time spent
+    compressing and decompressing them. The choice made with the default
+    sample is computed once per process.
+
+    Args:
+        algorithms (list): The candidate algorithms.
+        payloads (list): The payloads to calibrate with, by default JSON
+                         documents resembling the rows of a collection.
+
+    Returns:
+        str: The selected algorithm or None if no candidate was given.
+
+    .. versionadded:: 8.2.0
+    """
+    if not algorithms:
+        return None
+    candidates = tuple(sorted(algorithms))
+    if payloads is None and candidates in _COMPRESSION_AUTO_SELECTED:
+        return _COMPRESSION_AUTO_SELECTED[candidates]
+    sample = _compression_sample() if payloads is None else payloads
+    size = sum(len(payload) for payload in sample)
+    results = benchmark_compression(sample, list(candidates))
+    selected = min(
+        candidates,
+        key=lambda algorithm: (
+            results[algorithm]["ratio"] * size / _COMPRESSION_AUTO_BANDWIDTH
+            + results[algorithm]["compress_time"]
+            + results[algorithm]["decompress_time"]
+        ),
+    )
+    if payloads is None:
+        _COMPRESSION_AUTO_SELECTED[candidates] = selected
+    return selected
 
 
 class Compressor:
@@ -273,52 +393,124 @@ class MessageWriter:
     def __init__(self, socket_stream: SocketType) -> None:
         self._stream: SocketType = socket_stream
         self._compressor: Optional[Compressor] = None
+        self._compression_threshold: int = _COMPRESSION_THRESHOLD
+        # Sizes of the first compressed frames, to stop compressing the
+        # messages sent if it doesn't pay off
+        self._compression_probe: List[int] = [0, 0, 0]
+        # Frames are written into a buffer reused between writes
+        self._buffer: bytearray = bytearray()
+        self._buffer_pos: int = 0
+        self._batching: bool = False
 
     def write_message(self, msg_type: int, msg: MessageType) -> None:
         """Write message.
 
+        The message is sent right away, unless a batch was started with
+        :func:`start_batch`.
+
         Args:
             msg_type (int): The message type.
             msg (mysqlx.protobuf.Message): MySQL X Protobuf Message.
-        """
-        msg_size = msg.byte_size(msg)
-        if self._compressor and msg_size > _COMPRESSION_THRESHOLD:
-            msg_str = encode_to_bytes(msg.serialize_to_string())
-            header = struct.pack("<LB", msg_size + 1, msg_type)
-            compressed = self._compressor.compress(b"".join([header, msg_str]))
 
-            msg_first_fields = Message("Mysqlx.Connection.Compression")
-            msg_first_fields["client_messages"] = msg_type
-            msg_first_fields["uncompressed_size"] = msg_size + 5
+        .. versionchanged:: 8.2.0
+           Messages can be batched.
+        """
+        msg_str = encode_to_bytes(msg.serialize_to_string())
+        pos = self._buffer_pos
+        end = pos + len(msg_str) + 5
+        if len(self._buffer) < end:
+            self._buffer.extend(bytes(end - len(self._buffer)))
+        struct.pack_into("<LB", self._buffer, pos, len(msg_str) + 1, msg_type)
+        self._buffer[pos + 5 : end] = msg_str
+        self._buffer_pos = end
+        if not self._batching or end >= _BATCH_MAX_SIZE:
+            self._flush()
+
+    def start_batch(self) -> None:
+        """Start batching messages.
+
+        The messages written after this call are kept and sent together, in a
+        single frame when compression is enabled, when :func:`end_batch` is
+        called or when they reach 1MiB.
+
+        .. versionadded:: 8.2.0
+        """
+        self._batching = True
 
-            msg_payload = Message("Mysqlx.Connection.Compression")
-            msg_payload["payload"] = compressed
+    def end_batch(self, discard: bool = False) -> None:
+        """Send the batched messages and stop batching.
 
-            output = b"".join(
-                [
-                    encode_to_bytes(msg_first_fields.serialize_partial_to_string())[
-                        :-2
-                    ],
-                    encode_to_bytes(msg_payload.serialize_partial_to_string()),
-                ]
-            )
+        Args:
+            discard (bool): Drop the messages not sent yet instead.
 
-            msg_comp_id = mysqlxpb_enum("Mysqlx.ClientMessages.Type.COMPRESSION")
-            header = struct.pack("<LB", len(output) + 1, msg_comp_id)
-            self._stream.sendall(b"".join([header, output]))
+        .. versionadded:: 8.2.0
+        """
+        self._batching = False
+        if discard:
+            self._buffer_pos = 0
         else:
-            msg_str = encode_to_bytes(msg.serialize_to_string())
-            header = struct.pack("<LB", msg_size + 1, msg_type)
-            self._stream.sendall(b"".join([header, msg_str]))
+            self._flush()
+
+    def _flush(self) -> None:
+        """Send the messages in the buffer."""
+        size = self._buffer_pos
+        if not size:
+            return
+        self._buffer_pos = 0
+        data = memoryview(self._buffer)[:size]
+        try:
+            if self._compressor and size > self._compression_threshold + 5:
+                msg_payload = Message("Mysqlx.Connection.Compression")
+                msg_payload["uncompressed_size"] = size
+                msg_payload["payload"] = self._compressor.compress(data)
+                output = encode_to_bytes(msg_payload.serialize_partial_to_string())
+                self._update_compression_probe(size, len(output))
+                msg_comp_id = mysqlxpb_enum("Mysqlx.ClientMessages.Type.COMPRESSION")
+                header = struct.pack("<LB", len(output) + 1, msg_comp_id)
+                self._stream.sendall(b"".join([header, output]))
+            else:
+                self._stream.sendall(data)
+        finally:
+            data.release()
+            if size > _BATCH_MAX_SIZE:
+                # Don't hold on to the memory used by a large message
+                self._buffer = bytearray()
 
-    def set_compression(self, algorithm: str) -> None:
+    def _update_compression_probe(self, size: int, compressed_size: int) -> None:
+        """Measures the first compressed frames and locks in the decision.
+
+        After ``_COMPRESSION_PROBE_MESSAGES`` frames, the messages are sent
+        uncompressed if compression saved less than 10% of the bytes. The
+        server still accepts them, compression is optional per frame.
+
+        Args:
+            size (int): The size of the messages.
+            compressed_size (int): The size of the compressed frame.
+        """
+        probe = self._compression_probe
+        probe[0] += 1
+        probe[1] += size
+        probe[2] += compressed_size
+        if probe[0] == _COMPRESSION_PROBE_MESSAGES:
+            if probe[2] > probe[1] * (1 - _COMPRESSION_MIN_SAVING):
+                self._compressor = None
+
+    def set_compression(
+        self, algorithm: str, threshold: int = _COMPRESSION_THRESHOLD
+    ) -> None:
         """Creates a :class:`mysqlx.protocol.Compressor` object based on the
         compression algorithm.
 
         Args:
             algorithm (str): Compression algorithm.
+            threshold (int): Messages up to this size are not compressed.
+
+        .. versionchanged:: 8.2.0
+           Added the ``threshold`` argument.
         """
         self._compressor = Compressor(algorithm) if algorithm else None
+        self._compression_threshold = threshold
+        self._compression_probe = [0, 0, 0]
 
 
 class Protocol:
@@ -337,6 +529,23 @@ class Protocol:
         self._compression_algorithm: Optional[str] = None
         self._warnings: List[str] = []
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager batching the messages sent inside it.
+
+        The messages are sent together when leaving the context, or dropped
+        if an exception is raised.
+
+        .. versionadded:: 8.2.0
+        """
+        self._writer.start_batch()
+        try:
+            yield
+        except BaseException:
+            self._writer.end_batch(discard=True)
+            raise
+        self._writer.end_batch()
+
     @property
     def compression_algorithm(self) -> Optional[str]:
         """str: The compresion algorithm."""
@@ -560,19 +769,23 @@ class Protocol:
                 break
         return msg
 
-    def set_compression(self, algorithm: str) -> None:
+    def set_compression(
+        self, algorithm: str, threshold: int = _COMPRESSION_THRESHOLD
+    ) -> None:
         """Sets the compression algorithm to be used by the compression
         object, for uplink and downlink.
 
         Args:
             algorithm (str): Algorithm to be used in compression/decompression.
+            threshold (int): Messages sent up to this size are not compressed.
 
         .. versionadded:: 8.0.21
-
+        .. versionchanged:: 8.2.0
+           Added the ``threshold`` argument.
         """
         self._compression_algorithm = algorithm
         self._reader.set_compression(algorithm)
-        self._writer.set_compression(algorithm)
+        self._writer.set_compression(algorithm, threshold)
 
     def get_capabilites(self) -> MessageType:
         """Get capabilities.
@@ -1172,12 +1385,27 @@ class Protocol:
             mysqlxpb_enum("Mysqlx.ClientMessages.Type.SESS_CLOSE"), msg
         )
 
-    def send_expect_open(self) -> None:
-        """Send expectation."""
-        cond_key = mysqlxpb_enum("Mysqlx.Expect.Open.Condition.Key.EXPECT_FIELD_EXIST")
+    def send_expect_open(self, no_error: bool = False) -> None:
+        """Send expectation.
+
+        Args:
+            no_error (bool): Open an expectation block in which the server
+                             fails every message after the first error,
+                             instead of checking for the ``keep_open`` field.
+
+        .. versionchanged:: 8.2.0
+           The ``no_error`` argument was added.
+        """
         msg_oc = Message("Mysqlx.Expect.Open.Condition")
-        msg_oc["condition_key"] = cond_key
-        msg_oc["condition_value"] = "6.1"
+        if no_error:
+            msg_oc["condition_key"] = mysqlxpb_enum(
+                "Mysqlx.Expect.Open.Condition.Key.EXPECT_NO_ERROR"
+            )
+        else:
+            msg_oc["condition_key"] = mysqlxpb_enum(
+                "Mysqlx.Expect.Open.Condition.Key.EXPECT_FIELD_EXIST"
+            )
+            msg_oc["condition_value"] = "6.1"
 
         msg_eo = Message("Mysqlx.Expect.Open")
         msg_eo["cond"] = [msg_oc.get_message()]
@@ -1186,6 +1414,16 @@ class Protocol:
             mysqlxpb_enum("Mysqlx.ClientMessages.Type.EXPECT_OPEN"), msg_eo
         )
 
+    def send_expect_close(self) -> None:
+        """Send the end of an expectation block.
+
+        .. versionadded:: 8.2.0
+        """
+        self._writer.write_message(
+            mysqlxpb_enum("Mysqlx.ClientMessages.Type.EXPECT_CLOSE"),
+            Message("Mysqlx.Expect.Close"),
+        )
+
     def send_reset(self, keep_open: Optional[bool] = None) -> bool:
         """Send reset session message.
 
@@ -35,7 +35,17 @@ import struct
 import sys
 
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .charsets import MYSQL_CHARACTER_SETS
 from .dbdoc import DbDoc
@@ -47,16 +57,11 @@ from .types import ConnectionType, FieldTypes
 def from_protobuf(column: Column, payload: bytes) -> Any:
     if len(payload) == 0:
         return None
+    return column.converter(payload)
 
-    if column.get_type() == ColumnType.STRING:
-        return decode_from_bytes(payload[:-1])  # Strip trailing char
 
-    try:
-        return ColumnProtoType.converter_map[column.get_proto_type()](payload)
-    except KeyError as err:
-        sys.stderr.write(f"{err}")
-        sys.stderr.write(f"{payload.encode('hex')}")  # type: ignore[attr-defined]
-        return None
+def string_from_protobuf(payload: bytes) -> str:
+    return decode_from_bytes(payload[:-1])  # Strip trailing char
 
 
 def bytes_from_protobuf(payload: bytes) -> bytes:
@@ -74,66 +79,80 @@ def double_from_protobuf(payload: bytes) -> float:
     return struct.unpack("<d", payload)[0]
 
 
-def varint_from_protobuf_stream(payload: bytes) -> Tuple[int, bytes]:
-    if len(payload) == 0:
-        raise ValueError("Payload is empty")
-
-    cur = 0
-    i = 0
-    shift = 0
-
-    for item in payload:
-        char = item if isinstance(item, int) else ord(item)  # type: ignore[arg-type]
-        eos = (char & 0x80) == 0
-        cur_bits = char & 0x7F
-        cur_bits <<= shift
-        i |= cur_bits
-        if eos:
-            return i, payload[cur + 1 :]
-        cur += 1
-        shift += 7
+def varint_from_protobuf_at(payload: bytes, pos: int = 0) -> Tuple[int, int]:
+    """Decodes a varint starting at a position of a payload.
+
+    Args:
+        payload (bytes): The payload, or a memoryview of it.
+        pos (int): The position of the varint first byte.
+
+    Returns:
+        tuple: The value and the position following the varint.
 
+    Raises:
+        ValueError: If there is nothing to read at the position.
+        EOFError: If the payload ends before the varint does.
+    """
+    try:
+        char = payload[pos]
+    except IndexError:
+        raise ValueError("Payload is empty") from None
+    # Fast path for the 1 and 2 bytes varints, most of the values
+    if char < 0x80:
+        return char, pos + 1
+    try:
+        char2 = payload[pos + 1]
+    except IndexError:
+        raise EOFError("Payload too short") from None
+    if char2 < 0x80:
+        return (char & 0x7F) | (char2 << 7), pos + 2
+    value = (char & 0x7F) | ((char2 & 0x7F) << 7)
+    shift = 14
+    for index in range(pos + 2, len(payload)):
+        char = payload[index]
+        value |= (char & 0x7F) << shift
+        if char < 0x80:
+            return value, index + 1
+        shift += 7
     raise EOFError("Payload too short")
 
 
+def varint_from_protobuf_stream(payload: bytes) -> Tuple[int, bytes]:
+    value, pos = varint_from_protobuf_at(payload)
+    return value, payload[pos:]
+
+
 def varint_from_protobuf(payload: bytes) -> int:
-    i, payload = varint_from_protobuf_stream(payload)
-    if len(payload) != 0:
+    value, pos = varint_from_protobuf_at(payload)
+    if pos != len(payload):
         raise ValueError("Payload too long")
-
-    return i
+    return value
 
 
 def varsint_from_protobuf(payload: bytes) -> int:
-    i, payload = varint_from_protobuf_stream(payload)
-    if len(payload) != 0:
+    value, pos = varint_from_protobuf_at(payload)
+    if pos != len(payload):
         raise ValueError("Payload too long")
-
     # Zigzag encoded, revert it
-    if i & 0x1:
-        i = ~i
-        i = i >> 1
-        i |= 1 << 63
-    else:
-        i = i >> 1
-
-    return i
+    return (value >> 1) ^ -(value & 0x1)
 
 
 def set_from_protobuf(payload: bytes) -> List[bytes]:
     set_pb: List = []
+    size = len(payload)
+    pos = 0
     while True:
         try:
-            field_len, payload = varint_from_protobuf_stream(payload)
-            if len(payload) < field_len:
-                if len(payload) == 0 and field_len == 1 and len(set_pb) == 0:
+            field_len, pos = varint_from_protobuf_at(payload, pos)
+            if size - pos < field_len:
+                if pos == size and field_len == 1 and len(set_pb) == 0:
                     # Special case for empty set
                     return []
                 raise ValueError("Invalid Set encoding")
 
-            set_pb.append(payload[:field_len])
-            payload = payload[field_len:]
-            if len(payload) == 0:
+            set_pb.append(payload[pos : pos + field_len])
+            pos += field_len
+            if pos == size:
                 # Done
                 break
         except ValueError:
@@ -142,78 +161,46 @@ def set_from_protobuf(payload: bytes) -> List[bytes]:
 
 
 def decimal_from_protobuf(payload: bytes) -> decimal.Decimal:
-    digits = []
-    sign = None
-    scale = payload[0] if isinstance(payload[0], int) else ord(payload[0])  # type: ignore[arg-type]
-    payload = payload[1:]
-
-    for item in payload:
-        char = item if isinstance(item, int) else ord(item)  # type: ignore[arg-type]
-        high_bcd = (char & 0xF0) >> 4
-        low_bcd = char & 0x0F
-        if high_bcd < 0x0A:
-            digits.append(high_bcd)
-            if low_bcd < 0x0A:
-                digits.append(low_bcd)
-            elif low_bcd == 0x0C:
-                sign = 0
-                break
-            elif low_bcd == 0x0D:
-                sign = 1
-                break
-            else:
-                raise ValueError("Invalid BCD")
-        elif high_bcd == 0x0C:
-            sign = 0
-            assert low_bcd == 0x00
-            break
-        elif high_bcd == 0x0D:
-            sign = 1
-            assert low_bcd == 0x00
-            break
-        else:
-            raise ValueError(f"Invalid BCD: {high_bcd}")
-
-    return decimal.Decimal((sign, digits, -scale))
+    # The scale followed by BCD digits, ended by the sign nibble and an
+    # optional padding nibble
+    scale = payload[0]
+    bcd = memoryview(payload)[1:].hex().rstrip("0")
+    sign = bcd[-1:]
+    digits = bcd[:-1]
+    if sign not in ("c", "d") or (digits and not digits.isdigit()):
+        raise ValueError(f"Invalid BCD: {bcd}")
+    return decimal.Decimal(f"{'-' if sign == 'd' else ''}{digits or '0'}E-{scale}")
 
 
 def datetime_from_protobuf(payload: bytes) -> datetime:
     # A sequence of varints
-    hour = 0
-    minutes = 0
-    seconds = 0
-    useconds = 0
-    year, payload = varint_from_protobuf_stream(payload)
-    month, payload = varint_from_protobuf_stream(payload)
-    day, payload = varint_from_protobuf_stream(payload)
+    year, pos = varint_from_protobuf_at(payload)
+    month, pos = varint_from_protobuf_at(payload, pos)
+    day, pos = varint_from_protobuf_at(payload, pos)
+    if pos == len(payload):
+        return datetime(year, month, day)
 
+    time_parts = [0, 0, 0, 0]
     try:
-        hour, payload = varint_from_protobuf_stream(payload)
-        minutes, payload = varint_from_protobuf_stream(payload)
-        seconds, payload = varint_from_protobuf_stream(payload)
-        useconds, payload = varint_from_protobuf_stream(payload)
+        for index in range(4):
+            time_parts[index], pos = varint_from_protobuf_at(payload, pos)
     except ValueError:
         pass
 
-    return datetime(year, month, day, hour, minutes, seconds, useconds)
+    return datetime(year, month, day, *time_parts)
 
 
 def time_from_protobuf(payload: bytes) -> timedelta:
     # A sequence of varints
-    hour = 0
-    minutes = 0
-    seconds = 0
-    useconds = 0
     negate = payload[0] == 1
-    payload = payload[1:]
-
+    pos = 1
+    time_parts = [0, 0, 0, 0]
     try:
-        hour, payload = varint_from_protobuf_stream(payload)
-        minutes, payload = varint_from_protobuf_stream(payload)
-        seconds, payload = varint_from_protobuf_stream(payload)
-        useconds, payload = varint_from_protobuf_stream(payload)
+        for index in range(4):
+            time_parts[index], pos = varint_from_protobuf_at(payload, pos)
     except ValueError:
         pass
+    hour, minutes, seconds, useconds = time_parts
 
     if negate:
         # Negate the first non-zero value
@@ -512,6 +499,7 @@ class Column:
             ColumnType.BYTES,
             ColumnType.STRING,
         )
+        self._converter: Callable[[bytes], Any] = self._get_converter()
 
     def __str__(self) -> str:
         return str(
@@ -523,6 +511,30 @@ class Column:
             }
         )
 
+    def _get_converter(self) -> Callable[[bytes], Any]:
+        """Returns the function converting a protobuf payload of this column."""
+        if self._col_type == ColumnType.STRING:
+            return string_from_protobuf
+        try:
+            return ColumnProtoType.converter_map[self._proto_type]
+        except KeyError:
+            proto_type = self._proto_type
+
+            def unknown_from_protobuf(payload: bytes) -> None:
+                sys.stderr.write(f"{proto_type}")
+                sys.stderr.write(f"{bytes(payload).hex()}")
+
+            return unknown_from_protobuf
+
+    @property
+    def converter(self) -> Callable[[bytes], Any]:
+        """callable: The function converting a non empty protobuf payload of
+        this column to a Python object.
+
+        .. versionadded:: 8.2.0
+        """
+        return self._converter
+
     def _map_bytes(self) -> None:
         """Map bytes."""
         if self._content_type == BytesContentType.GEOMETRY:
@@ -799,23 +811,61 @@ class Column:
         return self._is_bytes
 
 
+_NOT_DECODED = object()
+
+
 class Row:
     """Represents a row element returned from a SELECT query.
 
+    When the column converters are given, the fields are the raw protobuf
+    payloads and each one is converted on first access.
+
     Args:
         resultset (mysqlx.SqlResult or mysqlx.RowResult): The result set.
         fields (`list`): The list of fields.
+        converters (`list`): The converter of each column.
+
+    .. versionchanged:: 8.2.0
+       The ``converters`` argument was added.
     """
 
     def __init__(
-        self, resultset: Union[BufferingResult, RowResult], fields: Sequence[FieldTypes]
+        self,
+        resultset: Union[BufferingResult, RowResult],
+        fields: Sequence[FieldTypes],
+        converters: Optional[Sequence[Callable[[bytes], Any]]] = None,
     ) -> None:
-        self._fields: Sequence[FieldTypes] = fields
         self._resultset: Union[BufferingResult, RowResult] = resultset
+        self._payloads: Optional[Sequence[bytes]] = None
+        self._converters: Optional[Sequence[Callable[[bytes], Any]]] = converters
+        self._values: List[Any]
+        if converters is None:
+            self._values = list(fields)
+        else:
+            self._payloads = fields  # type: ignore[assignment]
+            self._values = [_NOT_DECODED] * len(fields)
 
     def __repr__(self) -> str:
         return repr(self._fields)
 
+    def _get_value(self, index: int) -> Any:
+        """Returns the value of a column, converting it if needed."""
+        value = self._values[index]
+        if value is _NOT_DECODED:
+            payload = self._payloads[index]
+            value = self._converters[index](payload) if len(payload) else None
+            self._values[index] = value
+        return value
+
+    @property
+    def _fields(self) -> List[FieldTypes]:
+        """`list`: The values of all the columns."""
+        if self._payloads is not None:
+            for index in range(len(self._values)):
+                self._get_value(index)
+            self._payloads = None
+        return self._values
+
     def __getitem__(self, index: Union[int, str]) -> Any:
         """Returns the value of a column by name or index.
 
@@ -824,9 +874,9 @@ class Row:
         int_index = self._resultset.index_of(index) if isinstance(index, str) else index
         if int_index == -1 and isinstance(index, str):
             raise ValueError(f"Column name '{index}' not found")
-        if int_index >= len(self._fields) or int_index < 0:
+        if int_index >= len(self._values) or int_index < 0:
             raise IndexError("Index out of range")
-        return self._fields[int_index]
+        return self._get_value(int_index)
 
     @deprecated("8.0.12")
     def get_string(self, str_index: str) -> str:
@@ -838,11 +888,11 @@ class Row:
         .. deprecated:: 8.0.12
         """
         int_index = self._resultset.index_of(str_index)
-        if int_index >= len(self._fields):
+        if int_index >= len(self._values):
             raise IndexError("Argument out of range")
         if int_index == -1:
             raise ValueError(f"Column name '{str_index}' not found")
-        return str(self._fields[int_index])
+        return str(self._get_value(int_index))
 
 
 class BaseResult:
@@ -979,6 +1029,8 @@ class BufferingResult(BaseResult):
     def __init__(self, connection: ConnectionType) -> None:
         super().__init__(connection)
         self._columns: List[Column] = []
+        self._converters: List[Callable[[bytes], Any]] = []
+        self._column_indexes: Optional[Dict[str, int]] = None
         self._has_data: bool = False
         self._has_more_results: bool = False
         self._items: List[Union[Row, DbDoc]] = []
@@ -989,6 +1041,22 @@ class BufferingResult(BaseResult):
     def __getitem__(self, index: int) -> Union[Row, DbDoc]:
         return self._items[index]
 
+    def __iter__(self) -> Iterator[Union[Row, DbDoc]]:
+        """Iterates over the items of the result.
+
+        The items already fetched are returned first, then the remaining ones
+        are read from the server as they arrive, without being kept by the
+        result, so any number of items can be traversed in constant memory.
+
+        .. versionadded:: 8.2.0
+        """
+        yield from self._items
+        while True:
+            item = self.fetch_one()
+            if item is None:
+                return
+            yield item
+
     @property
     def count(self) -> int:
         """int: The total of items."""
@@ -997,6 +1065,8 @@ class BufferingResult(BaseResult):
     def _init_result(self) -> None:
         """Initialize the result."""
         self._columns = self._connection.get_column_metadata(self)
+        self._converters = [column.converter for column in self._columns]
+        self._column_indexes = None
         self._has_more_data = len(self._columns) > 0
         self._items = []
         self._page_size = 20
@@ -1015,12 +1085,9 @@ class BufferingResult(BaseResult):
         row = self._connection.read_row(self)
         if row is None:
             return None
-        item = [None] * len(row["field"])
-        if not dumping:
-            for key in range(len(row["field"])):
-                column = self._columns[key]
-                item[key] = from_protobuf(column, row["field"][key])
-        return Row(self, item)
+        if dumping:
+            return Row(self, [None] * len(row["field"]))
+        return Row(self, row["field"], self._converters)
 
     def _page_in_items(self) -> Union[bool, int]:
         """Reads the page items.
@@ -1046,12 +1113,11 @@ class BufferingResult(BaseResult):
         Returns:
             int: The index of the column.
         """
-        index = 0
-        for col in self._columns:
-            if col.get_column_label() == col_name:
-                return index
-            index += 1
-        return -1
+        if self._column_indexes is None:
+            self._column_indexes = {}
+            for index, col in enumerate(self._columns):
+                self._column_indexes.setdefault(col.get_column_label(), index)
+        return self._column_indexes.get(col_name, -1)
 
     def fetch_one(self) -> Optional[Union[Row, DbDoc]]:
         """Fetch one item.
@@ -1064,6 +1130,35 @@ class BufferingResult(BaseResult):
 
         return self._read_item(False)
 
+    def fetch_many(self, size: int) -> List[Union[Row, DbDoc]]:
+        """Fetch the next items.
+
+        Like :func:`fetch_one`, the items are read from the server and not
+        kept by the result, so the caller controls how many items are held in
+        memory at once.
+
+        Args:
+            size (int): The maximum number of items to fetch.
+
+        Returns:
+            `list`: The list of items of :class:`mysqlx.DbDoc` or
+                    :class:`mysqlx.Row`, empty when there are no more items.
+
+        Raises:
+            ValueError: If ``size`` is not a positive integer.
+
+        .. versionadded:: 8.2.0
+        """
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("The 'size' value must be a positive integer")
+        items: List[Union[Row, DbDoc]] = []
+        while len(items) < size and not self._closed:
+            item = self._read_item(False)
+            if item is None:
+                break
+            items.append(item)
+        return items
+
     def fetch_all(self) -> List[Union[Row, DbDoc]]:
         """Fetch all items.
 
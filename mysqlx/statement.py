@@ -336,9 +336,9 @@ class FilterableStatement(Statement):
         """
         self.has_sort = True
         self._sort_str = ",".join(flexible_params(*clauses))
-        self._sort_expr = ExprParser(
-            self._sort_str, not self._doc_based
-        ).parse_order_spec()
+        self._sort_expr, _ = ExprParser.parse_cached(
+            self._sort_str, not self._doc_based, "parse_order_spec"
+        )
         self._changed = True
         return self
 
@@ -355,11 +355,11 @@ class FilterableStatement(Statement):
         self.has_where = True
         self._where_str = condition
         try:
-            expr = ExprParser(condition, not self._doc_based)
-            self._where_expr = expr.expr()
+            self._where_expr, self._binding_map = ExprParser.parse_cached(
+                condition, not self._doc_based
+            )
         except ValueError as err:
             raise ProgrammingError("Invalid condition") from err
-        self._binding_map = expr.placeholder_name_to_position
         self._changed = True
         return self
 
@@ -372,9 +372,9 @@ class FilterableStatement(Statement):
         fields = flexible_params(*fields)
         self.has_group_by = True
         self._grouping_str = ",".join(fields)
-        self._grouping = ExprParser(
-            self._grouping_str, not self._doc_based
-        ).parse_expr_list()
+        self._grouping, _ = ExprParser.parse_cached(
+            self._grouping_str, not self._doc_based, "parse_expr_list"
+        )
         self._changed = True
 
     def _set_having(self, condition: str) -> None:
@@ -384,7 +384,7 @@ class FilterableStatement(Statement):
             condition (str): The condition.
         """
         self.has_having = True
-        self._having = ExprParser(condition, not self._doc_based).expr()
+        self._having, _ = ExprParser.parse_cached(condition, not self._doc_based)
         self._changed = True
 
     def _set_projection(self, *fields: str) -> FilterableStatement:
@@ -399,9 +399,9 @@ class FilterableStatement(Statement):
         fields = flexible_params(*fields)
         self.has_projection = True
         self._projection_str = ",".join(fields)
-        self._projection_expr = ExprParser(
-            self._projection_str, not self._doc_based
-        ).parse_table_select_projection()
+        self._projection_expr, _ = ExprParser.parse_cached(
+            self._projection_str, not self._doc_based, "parse_table_select_projection"
+        )
         self._changed = True
         return self
 